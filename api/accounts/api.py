@@ -2,12 +2,10 @@ from typing import List
 
 import structlog
 from django.contrib.auth.models import AnonymousUser
-from django.db import IntegrityError
 from django.http import HttpRequest
 from ninja import Router
 from ninja.errors import HttpError, ValidationError
 from ninja.pagination import paginate
-from ninja_jwt.token_blacklist.models import BlacklistedToken, OutstandingToken
 
 from accounts.models import User
 from accounts.schemas import (
@@ -15,10 +13,12 @@ from accounts.schemas import (
     AdminUserModify,
     AuthError,
     NewAccount,
+    TokenRevocation,
     UpdateAccount,
     UserSelf,
 )
 from auth.middleware import AnonymousOnly, AuthenticatedOnly, JWTAuth, StaffOnly
+from auth.revocation import revoke_user_tokens
 
 logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)  # noqa: F821
 accounts_router = Router(auth=JWTAuth())
@@ -92,13 +92,7 @@ def delete_self(request: HttpRequest):
     """
 
     try:
-        # blacklist all refresh tokens for this user
-        outstanding_tokens = OutstandingToken.objects.filter(user=request.user)
-
-        for token in outstanding_tokens:
-            BlacklistedToken.objects.create(token=token)
-    except IntegrityError:
-        logger.debug("Token already blacklisted", token=token.__str__)
+        revoke_user_tokens(request.user.pk)
     except Exception as e:
         raise ValidationError([e]) from e
 
@@ -112,6 +106,21 @@ def delete_self(request: HttpRequest):
     return
 
 
+@accounts_router.post(
+    "/me/revoke_tokens",
+    auth=JWTAuth(permissions=AuthenticatedOnly),
+    response={200: TokenRevocation, 403: AuthError},
+    tags=["accounts"],
+    operation_id="revokeSelfTokens",
+)
+def revoke_self_tokens(request: HttpRequest):
+    """
+    Logs the calling user out everywhere by revoking all of their refresh tokens
+    """
+
+    return {"revoked": revoke_user_tokens(request.user.pk)}
+
+
 @accounts_router.post(
     "/sign_up",
     auth=JWTAuth(permissions=AnonymousOnly),
@@ -240,15 +249,11 @@ def delete_user(request: HttpRequest, user_id: int):
     """
     try:
         user = User.objects.get(pk=user_id)
-
-        # blacklist all refresh tokens for this user
-        outstanding_tokens = OutstandingToken.objects.filter(user=user)
-
-        for token in outstanding_tokens:
-            BlacklistedToken.objects.create(token=token)
     except User.DoesNotExist as err:
         raise HttpError(404, "User not found") from err
 
+    revoke_user_tokens(user.pk)
+
     try:
         user.delete()
     except Exception as e:
@@ -257,3 +262,20 @@ def delete_user(request: HttpRequest, user_id: int):
         raise ValidationError([e]) from e
 
     return None
+
+
+@accounts_router.post(
+    "/{user_id}/revoke_tokens",
+    auth=JWTAuth(permissions=StaffOnly),
+    response={200: TokenRevocation, 403: AuthError},
+    tags=["accounts"],
+    operation_id="revokeUserTokens",
+)
+def revoke_tokens(request: HttpRequest, user_id: int):
+    """
+    Logs a user out everywhere by revoking all of their refresh tokens
+    """
+    if not User.objects.filter(pk=user_id).exists():
+        raise HttpError(404, "User not found")
+
+    return {"revoked": revoke_user_tokens(user_id)}
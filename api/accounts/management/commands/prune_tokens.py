@@ -0,0 +1,32 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from auth.blacklist import PRUNE_BATCH_SIZE, prune_expired_tokens
+
+
+class Command(BaseCommand):
+    help = "Delete expired outstanding and blacklisted tokens in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=PRUNE_BATCH_SIZE,
+            help="Tokens deleted per transaction",
+        )
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=None,
+            help="Keep running as a worker, pruning every INTERVAL seconds",
+        )
+
+    def handle(self, *args, batch_size, interval, **options):
+        while True:
+            started = time.monotonic()
+            deleted = prune_expired_tokens(batch_size=batch_size)
+            self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} expired token(s)."))
+            if interval is None:
+                return
+            time.sleep(max(0, interval - (time.monotonic() - started)))
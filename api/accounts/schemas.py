@@ -100,6 +100,14 @@ class AuthError(Schema):
     details: str
 
 
+class TokenRevocation(Schema):
+    """
+    How many refresh tokens were revoked
+    """
+
+    revoked: int
+
+
 class NewAccount(Schema):
     """
     Specifies fields that users can provide to create an account
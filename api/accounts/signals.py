@@ -0,0 +1,60 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group, Permission
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from ninja_jwt.token_blacklist.models import BlacklistedToken
+
+from auth.blacklist import blacklist
+from auth.permissions import permission_resolver
+from auth.user_cache import user_cache
+
+User = get_user_model()
+
+
+def _forget_user(user_id) -> None:
+    user_cache.invalidate(user_id)
+    # again once the write is visible, in case a request cached the old row meanwhile
+    transaction.on_commit(lambda: user_cache.invalidate(user_id))
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    """Authenticated requests use cached user snapshots, which must not outlive a change."""
+    _forget_user(instance.pk)
+
+
+@receiver(post_save, sender=BlacklistedToken)
+def invalidate_blacklisted_user(sender, instance: BlacklistedToken, created: bool, **kwargs):
+    """Revoking a token makes its user authenticate afresh."""
+    if created:
+        blacklist.added([instance.token.jti])
+    if instance.token.user_id is not None:
+        _forget_user(instance.token.user_id)
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(m2m_changed, sender=User.user_permissions.through)
+def invalidate_user_permissions(sender, instance, action: str, reverse: bool, **kwargs):
+    """Permission checks use cached permission sets, versioned per user."""
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if reverse:
+        # a group's members or a permission's holders changed; it is not known whom it affects
+        permission_resolver.permissions_changed()
+    else:
+        permission_resolver.user_changed(instance.pk)
+
+
+@receiver(m2m_changed, sender=Group.permissions.through)
+def invalidate_group_permissions(sender, action: str, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        permission_resolver.permissions_changed()
+
+
+@receiver(post_save, sender=Permission)
+@receiver(post_delete, sender=Permission)
+@receiver(post_delete, sender=Group)
+def invalidate_permissions(sender, **kwargs):
+    permission_resolver.permissions_changed()
@@ -2,6 +2,9 @@ import pytest
 from ninja_jwt.tokens import RefreshToken
 
 from accounts.models import User
+from auth.blacklist import blacklist
+from auth.token_cache import token_cache
+from auth.user_cache import user_cache
 
 
 @pytest.fixture
@@ -34,3 +37,12 @@ def auth_token(request: pytest.FixtureRequest) -> str:
     user = request.getfixturevalue(request.param)
     refresh = RefreshToken.for_user(user)
     return str(refresh.access_token)
+
+
+@pytest.fixture(autouse=True)
+def clear_user_cache():
+    """Users and tokens are cached in process, beyond the per-test database rollback."""
+    user_cache.clear()
+    token_cache.clear()
+    blacklist.clear()
+    yield
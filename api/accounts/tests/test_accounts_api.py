@@ -1,11 +1,24 @@
 import json
+from datetime import timedelta
+from io import StringIO
 from typing import Any, Dict, List
 
 import pytest
+from django.core.cache import cache
+from django.core.management import call_command
 from django.http import HttpResponse
 from django.test.client import Client
+from django.utils import timezone
+from ninja_jwt.authentication import JWTBaseAuthentication
+from ninja_jwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from ninja_jwt.tokens import RefreshToken
 
 from accounts.models import User
+from auth import token_cache as token_cache_module
+from auth.blacklist import BLACKLIST_GENERATION_KEY, BloomFilter, blacklist
+from auth.middleware import JWTAuth
+from auth.revocation import revoke_user_tokens
+from auth.user_cache import user_cache
 
 
 @pytest.mark.django_db
@@ -402,3 +415,328 @@ class TestDeleteUserEndpoint:
         """Test that unauthenticated users cannot delete users."""
         response: HttpResponse = client.delete(f"/api/accounts/{regular_user.id}")
         assert response.status_code == 403
+
+
+@pytest.mark.django_db
+class TestAuthenticatedUserCache:
+    @pytest.mark.parametrize("auth_token", ["superuser"], indirect=True)
+    def test_warm_requests_skip_the_user_query(
+        self, client: Client, auth_token: str, django_assert_num_queries
+    ) -> None:
+        """Test that a staff session costs no auth queries once its user is cached."""
+        client.get("/api/accounts/me", HTTP_AUTHORIZATION=f"Bearer {auth_token}")
+
+        with django_assert_num_queries(0):
+            response: HttpResponse = client.get(
+                "/api/accounts/me", HTTP_AUTHORIZATION=f"Bearer {auth_token}"
+            )
+        assert response.status_code == 200
+
+    @pytest.mark.parametrize("auth_token", ["superuser"], indirect=True)
+    def test_changes_to_the_user_invalidate(
+        self, client: Client, auth_token: str, superuser: User
+    ) -> None:
+        """Test that saving or deleting a user drops its cached snapshot."""
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {auth_token}"}
+        assert client.get("/api/accounts/", **headers).status_code == 200
+
+        superuser.is_staff = False
+        superuser.save()
+        assert client.get("/api/accounts/", **headers).status_code == 403
+
+        superuser.delete()
+        assert client.get("/api/accounts/me", **headers).status_code == 403
+
+    @pytest.mark.parametrize("auth_token", ["regular_user"], indirect=True)
+    def test_requests_get_their_own_copy(self, client: Client, auth_token: str) -> None:
+        """Test that changes a request makes to its user do not leak into the cache."""
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {auth_token}"}
+        client.get("/api/accounts/me", **headers)
+        (cached,) = [entry[0] for entry in user_cache._users.values()]
+
+        client.put(
+            "/api/accounts/me",
+            data=json.dumps({"first_name": "Changed"}),
+            content_type="application/json",
+            **headers,
+        )
+        assert cached.first_name == ""
+        assert json.loads(client.get("/api/accounts/me", **headers).content)["first_name"] == (
+            "Changed"
+        )
+
+    @pytest.mark.parametrize("auth_token", ["regular_user"], indirect=True)
+    def test_logout_forgets_the_token(self, client: Client, auth_token: str) -> None:
+        """Test that logging out drops the cached user."""
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {auth_token}"}
+        client.get("/api/accounts/me", **headers)
+        assert user_cache._users
+
+        client.post("/api/auth/logout", **headers)
+        assert not user_cache._users
+
+    @pytest.mark.parametrize("auth_token", ["regular_user"], indirect=True)
+    def test_shared_tier(
+        self,
+        client: Client,
+        auth_token: str,
+        regular_user: User,
+        monkeypatch,
+        django_assert_num_queries,
+    ) -> None:
+        """Test that another worker finds the user in the shared cache until it changes."""
+        monkeypatch.setattr(type(user_cache), "shared", property(lambda self: True))
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {auth_token}"}
+        client.get("/api/accounts/me", **headers)
+
+        # another worker starts with an empty local tier
+        user_cache.clear()
+        with django_assert_num_queries(0):
+            assert client.get("/api/accounts/me", **headers).status_code == 200
+
+        user_cache.clear()
+        regular_user.first_name = "Renamed"
+        regular_user.save()
+        user_cache.clear()
+        response = client.get("/api/accounts/me", **headers)
+        assert json.loads(response.content)["first_name"] == "Renamed"
+
+
+@pytest.mark.django_db
+class TestTokenValidation:
+    @pytest.fixture
+    def decodes(self, monkeypatch) -> List[str]:
+        """Record every token actually decoded."""
+        calls: List[str] = []
+        decode = JWTBaseAuthentication.get_validated_token
+
+        def recording(cls, raw_token):
+            calls.append(raw_token)
+            return decode(raw_token)
+
+        monkeypatch.setattr(JWTBaseAuthentication, "get_validated_token", classmethod(recording))
+        return calls
+
+    def test_anonymous_requests_skip_authentication(self, client: Client, monkeypatch) -> None:
+        """Test that requests without a token never reach authenticate."""
+
+        def fail(*args):
+            raise AssertionError("authenticate called")
+
+        monkeypatch.setattr(JWTAuth, "authenticate", fail)
+        assert client.get("/api/posts/").status_code == 200
+
+    def test_bad_cookie_is_decoded_once(self, client: Client, decodes: List[str]) -> None:
+        """Test that a token that failed to decode is treated as absent afterwards."""
+        client.cookies["access_token"] = "not-a-token"
+        assert client.get("/api/accounts/me").status_code == 403
+        assert client.get("/api/accounts/me").status_code == 403
+        assert decodes == ["not-a-token"]
+
+    @pytest.mark.parametrize("auth_token", ["regular_user"], indirect=True)
+    def test_valid_token_is_decoded_until_it_expires(
+        self, client: Client, auth_token: str, decodes: List[str], monkeypatch
+    ) -> None:
+        """Test that a valid token is decoded once and again only after its expiry."""
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {auth_token}"}
+        assert client.get("/api/accounts/me", **headers).status_code == 200
+        assert client.get("/api/accounts/me", **headers).status_code == 200
+        assert decodes == [auth_token]
+
+        later = token_cache_module.time.time() + 24 * 60 * 60
+        monkeypatch.setattr(token_cache_module.time, "time", lambda: later)
+        client.get("/api/accounts/me", **headers)
+        assert decodes == [auth_token, auth_token]
+
+
+class TestBloomFilter:
+    def test_members_are_always_found(self) -> None:
+        """Test that the filter has no false negatives."""
+        bloom = BloomFilter(100)
+        for index in range(100):
+            bloom.add(f"jti-{index}")
+        assert all(f"jti-{index}" in bloom for index in range(100))
+        assert bloom.count == 100
+
+    def test_false_positives_stay_rare(self) -> None:
+        """Test that a filter at capacity rarely claims to hold what it does not."""
+        bloom = BloomFilter(1000, error_rate=0.01)
+        for index in range(1000):
+            bloom.add(f"jti-{index}")
+        false_positives = sum(f"other-{index}" in bloom for index in range(10000))
+        assert false_positives < 300
+
+    def test_adding_twice_counts_once(self) -> None:
+        bloom = BloomFilter(10)
+        bloom.add("jti")
+        bloom.add("jti")
+        assert bloom.count == 1
+
+
+@pytest.mark.django_db
+class TestTokenBlacklist:
+    def test_blacklisted_refresh_token_is_rejected(
+        self, client: Client, regular_user: User
+    ) -> None:
+        """Test that a refresh token cannot be used once blacklisted."""
+        token = RefreshToken.for_user(regular_user)
+        token.blacklist()
+        refresh = str(token)
+
+        response = client.post(
+            "/api/token/refresh", {"refresh": refresh}, content_type="application/json"
+        )
+        assert response.status_code == 401
+
+    def test_rotation_blacklists_the_old_token(self, client: Client, regular_user: User) -> None:
+        """Test that a refresh token is spent by refreshing with it."""
+        refresh = str(RefreshToken.for_user(regular_user))
+        response = client.post(
+            "/api/token/refresh", {"refresh": refresh}, content_type="application/json"
+        )
+        assert response.status_code == 200
+        assert json.loads(response.content)["refresh"] != refresh
+
+        response = client.post(
+            "/api/token/refresh", {"refresh": refresh}, content_type="application/json"
+        )
+        assert response.status_code == 401
+
+    @pytest.fixture
+    def shared(self, monkeypatch) -> None:
+        """Pretend the workers share the cache, as they would with Redis or Memcached."""
+        monkeypatch.setattr(type(blacklist), "shared", property(lambda self: True))
+
+    def test_misses_skip_the_database(
+        self, regular_user: User, shared: None, django_assert_num_queries
+    ) -> None:
+        """Test that a token missing from the filter is not looked up."""
+        revoked = RefreshToken.for_user(regular_user)
+        revoked.blacklist()
+        fresh = RefreshToken.for_user(regular_user)
+        blacklist.is_blacklisted("warm-up")
+
+        with django_assert_num_queries(0):
+            assert not blacklist.is_blacklisted(fresh["jti"])
+        assert blacklist.is_blacklisted(revoked["jti"])
+
+    def test_blacklisting_elsewhere_is_picked_up(self, regular_user: User, shared: None) -> None:
+        """Test that a filter built earlier learns of tokens blacklisted by other workers."""
+        refresh = RefreshToken.for_user(regular_user)
+        assert not blacklist.is_blacklisted(refresh["jti"])
+
+        # another worker writes the row, skipping this worker's signal, and bumps the generation
+        token = OutstandingToken.objects.get(jti=refresh["jti"])
+        BlacklistedToken.objects.bulk_create([BlacklistedToken(token=token)])
+        assert not blacklist.is_blacklisted(refresh["jti"])
+        cache.set(BLACKLIST_GENERATION_KEY, "elsewhere", None)
+        assert blacklist.is_blacklisted(refresh["jti"])
+
+    def test_local_cache_checks_the_database(self, regular_user: User) -> None:
+        """Test that without a shared cache a blacklisting elsewhere is seen at once."""
+        refresh = RefreshToken.for_user(regular_user)
+        assert not blacklist.is_blacklisted(refresh["jti"])
+
+        # another worker's cache is out of reach, so nothing tells this one
+        token = OutstandingToken.objects.get(jti=refresh["jti"])
+        BlacklistedToken.objects.bulk_create([BlacklistedToken(token=token)])
+        assert blacklist.is_blacklisted(refresh["jti"])
+
+
+@pytest.mark.django_db
+class TestPruneTokens:
+    def test_prune_expired_tokens(self, regular_user: User) -> None:
+        """Test that expired tokens and their blacklist entries are deleted in batches."""
+        now = timezone.now()
+        for index in range(5):
+            token = OutstandingToken.objects.create(
+                user=regular_user,
+                jti=f"expired-{index}",
+                token="token",
+                expires_at=now - timedelta(days=1),
+            )
+            if index % 2:
+                BlacklistedToken.objects.create(token=token)
+        live = RefreshToken.for_user(regular_user)
+        live.blacklist()
+
+        out = StringIO()
+        call_command("prune_tokens", batch_size=2, stdout=out)
+
+        assert "Deleted 5 expired token(s)." in out.getvalue()
+        assert list(OutstandingToken.objects.values_list("jti", flat=True)) == [live["jti"]]
+        assert BlacklistedToken.objects.count() == 1
+        assert blacklist.is_blacklisted(live["jti"])
+
+
+@pytest.mark.django_db
+class TestTokenRevocation:
+    @pytest.mark.parametrize("auth_token", ["regular_user"], indirect=True)
+    def test_revoke_self_tokens(
+        self,
+        client: Client,
+        auth_token: str,
+        regular_user: User,
+        django_capture_on_commit_callbacks,
+    ) -> None:
+        """Test that users can log out everywhere, including tokens blacklisted already."""
+        tokens = [RefreshToken.for_user(regular_user) for _ in range(3)]
+        tokens[0].blacklist()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response: HttpResponse = client.post(
+                "/api/accounts/me/revoke_tokens",
+                HTTP_AUTHORIZATION=f"Bearer {auth_token}",
+            )
+
+        assert response.status_code == 200
+        # the two left of these plus the one behind auth_token
+        assert json.loads(response.content) == {"revoked": 3}
+        assert all(blacklist.is_blacklisted(token["jti"]) for token in tokens)
+        assert BlacklistedToken.objects.filter(token__user=regular_user).count() == 4
+
+    def test_revocation_is_one_insert(self, regular_user: User, django_assert_num_queries) -> None:
+        """Test that a user's tokens are revoked in bulk however many there are."""
+        for _ in range(50):
+            RefreshToken.for_user(regular_user)
+
+        # savepoint, select, insert, release
+        with django_assert_num_queries(4):
+            assert revoke_user_tokens(regular_user.pk) == 50
+
+    @pytest.mark.parametrize("auth_token", ["superuser"], indirect=True)
+    def test_revoke_user_tokens_staff(
+        self, client: Client, auth_token: str, regular_user: User
+    ) -> None:
+        """Test that staff users can revoke another user's tokens."""
+        RefreshToken.for_user(regular_user)
+        response: HttpResponse = client.post(
+            f"/api/accounts/{regular_user.id}/revoke_tokens",
+            HTTP_AUTHORIZATION=f"Bearer {auth_token}",
+        )
+        assert response.status_code == 200
+        assert json.loads(response.content) == {"revoked": 1}
+
+    @pytest.mark.parametrize("auth_token", ["regular_user"], indirect=True)
+    def test_revoke_user_tokens_non_staff(
+        self, client: Client, auth_token: str, superuser: User
+    ) -> None:
+        """Test that non-staff users cannot revoke another user's tokens."""
+        response: HttpResponse = client.post(
+            f"/api/accounts/{superuser.id}/revoke_tokens",
+            HTTP_AUTHORIZATION=f"Bearer {auth_token}",
+        )
+        assert response.status_code == 403
+
+    @pytest.mark.parametrize("auth_token", ["regular_user"], indirect=True)
+    def test_delete_self_revokes_tokens(
+        self, client: Client, auth_token: str, regular_user: User
+    ) -> None:
+        """Test that deleting an account leaves none of its refresh tokens usable."""
+        refresh = str(RefreshToken.for_user(regular_user))
+        client.delete("/api/accounts/me", HTTP_AUTHORIZATION=f"Bearer {auth_token}")
+
+        response = client.post(
+            "/api/token/refresh", {"refresh": refresh}, content_type="application/json"
+        )
+        assert response.status_code == 401
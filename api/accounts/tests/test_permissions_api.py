@@ -2,12 +2,16 @@ import json
 from typing import Any, Dict, List
 
 import pytest
-from django.contrib.auth.models import Permission
+from django.conf import settings
+from django.contrib.auth.models import Group, Permission
 from django.contrib.contenttypes.models import ContentType
 from django.http import HttpResponse
-from django.test.client import Client
+from django.test.client import Client, RequestFactory
+from ninja.errors import HttpError
 
 from accounts.models import User
+from auth.middleware import PermissionRequired
+from auth.permissions import LOCAL_PERMISSIONS_TTL, PERMISSIONS_TTL, permission_resolver
 
 
 @pytest.fixture
@@ -250,3 +254,76 @@ class TestUpdatePermissionEndpoint:
         )
 
         assert response.status_code == 403
+
+
+@pytest.mark.django_db
+class TestPermissionRequired:
+    def check(self, user: User, *perms: str) -> bool:
+        request = RequestFactory().get("/")
+        request.user = user
+        try:
+            PermissionRequired(*perms).check(request, user)
+        except HttpError:
+            return False
+        return True
+
+    def test_direct_and_group_permissions(
+        self, regular_user: User, test_permission: Permission
+    ) -> None:
+        """Test that permissions held directly or through a group are granted."""
+        assert not self.check(regular_user, "accounts.can_test_user")
+
+        regular_user.user_permissions.add(test_permission)
+        assert self.check(regular_user, "accounts.can_test_user")
+        assert not self.check(regular_user, "accounts.can_test_user", "auth.change_group")
+
+        group = Group.objects.create(name="editors")
+        group.permissions.add(Permission.objects.get(codename="change_group"))
+        regular_user.groups.add(group)
+        assert self.check(regular_user, "accounts.can_test_user", "auth.change_group")
+
+    def test_superusers_and_inactive_users(self, superuser: User, regular_user: User) -> None:
+        """Test that superusers hold every permission and inactive users none."""
+        assert self.check(superuser, "auth.change_group")
+
+        superuser.is_active = False
+        assert not self.check(superuser, "auth.change_group")
+
+    def test_permissions_are_resolved_once(
+        self, regular_user: User, test_permission: Permission, django_assert_num_queries
+    ) -> None:
+        """Test that the permission set is cached until it changes."""
+        regular_user.user_permissions.add(test_permission)
+        with django_assert_num_queries(1):
+            permission_resolver.permissions(regular_user)
+        with django_assert_num_queries(0):
+            assert self.check(regular_user, "accounts.can_test_user")
+
+    @pytest.mark.parametrize("auth_token", ["superuser"], indirect=True)
+    def test_group_changes_through_the_api_invalidate(
+        self, client: Client, auth_token: str, regular_user: User, test_permission: Permission
+    ) -> None:
+        """Test that changing a group's permissions is seen by the next check."""
+        group = Group.objects.create(name="testers")
+        regular_user.groups.add(group)
+        assert not self.check(regular_user, "accounts.can_test_user")
+
+        response: HttpResponse = client.put(
+            f"/api/groups/{group.id}",
+            {"name": "testers", "permissions": [test_permission.id]},
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {auth_token}",
+        )
+        assert response.status_code == 200
+        assert self.check(regular_user, "accounts.can_test_user")
+
+        group.delete()
+        assert not self.check(regular_user, "accounts.can_test_user")
+
+    def test_local_cache_is_short_lived(self, regular_user: User, monkeypatch) -> None:
+        """Test that without a shared cache the sets outlive other workers' changes only briefly."""
+        assert permission_resolver.ttl == LOCAL_PERMISSIONS_TTL
+        monkeypatch.setitem(
+            settings.CACHES["default"], "BACKEND", "django.core.cache.backends.redis.RedisCache"
+        )
+        assert permission_resolver.ttl == PERMISSIONS_TTL
@@ -0,0 +1,177 @@
+import hashlib
+import math
+import threading
+import time
+from datetime import timedelta
+from typing import Iterable, Iterator, Optional
+
+import structlog
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from ninja_jwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
+
+# bumped whenever a token is blacklisted; workers then read the new rows
+BLACKLIST_GENERATION_KEY = "auth:blacklist:generation"
+# bumped when expired rows are pruned; workers then rebuild their filter
+BLACKLIST_PRUNED_KEY = "auth:blacklist:pruned"
+# rows committed out of id order are picked up by also reading this far back in time
+HIGH_WATER_LOOKBACK = timedelta(minutes=1)
+BLOOM_CAPACITY = 10_000
+BLOOM_ERROR_RATE = 0.001
+# expired token rows deleted per transaction when pruning
+PRUNE_BATCH_SIZE = 1000
+
+
+class BloomFilter:
+    """A fixed-size Bloom filter of strings: no false negatives, `error_rate` false positives."""
+
+    def __init__(self, capacity: int, error_rate: float = BLOOM_ERROR_RATE):
+        self.capacity = capacity
+        self.bits = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.bits / capacity * math.log(2)))
+        self.count = 0
+        self._array = bytearray((self.bits + 7) // 8)
+
+    def _positions(self, item: str) -> Iterator[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "big"), int.from_bytes(digest[8:], "big")
+        for index in range(self.hashes):
+            yield (first + index * second) % self.bits
+
+    def add(self, item: str) -> None:
+        if item in self:
+            return
+        for position in self._positions(item):
+            self._array[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._array[position >> 3] & (1 << (position & 7)) for position in self._positions(item)
+        )
+
+
+class BlacklistFilter:
+    """
+    Which token ids are blacklisted, answered from a Bloom filter of the blacklisted tokens that
+    have not expired yet. Only possible hits are confirmed against the database. New rows are
+    read incrementally past the highest id seen once another worker reports a blacklisting
+    through the cache; pruning rebuilds the filter. That needs a cache the workers share: with
+    the per-process local memory cache every check goes to the database instead.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bloom: Optional[BloomFilter] = None
+        self._high_water = 0
+        self._synced_at = timezone.now()
+        self._generation = None
+        self._pruned = None
+
+    @property
+    def shared(self) -> bool:
+        """Whether workers can see each other's generation keys, i.e. the cache is not locmem."""
+        return "locmem" not in settings.CACHES["default"]["BACKEND"].lower()
+
+    def is_blacklisted(self, jti: str) -> bool:
+        if not self.shared:
+            # other workers could blacklist tokens unnoticed, so every check asks the database
+            return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+        self._sync()
+        with self._lock:
+            if jti not in self._bloom:
+                return False
+        return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+    def added(self, jtis: Iterable[str]) -> None:
+        """Record tokens this worker just blacklisted, and tell the other workers."""
+        with self._lock:
+            if self._bloom is not None:
+                for jti in jtis:
+                    self._bloom.add(jti)
+        cache.set(BLACKLIST_GENERATION_KEY, time.time_ns(), None)
+
+    def pruned(self) -> None:
+        """Have every worker rebuild its filter without the pruned tokens."""
+        cache.set(BLACKLIST_PRUNED_KEY, time.time_ns(), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._bloom = None
+
+    def _sync(self) -> None:
+        state = cache.get_many([BLACKLIST_GENERATION_KEY, BLACKLIST_PRUNED_KEY])
+        generation, pruned = state.get(BLACKLIST_GENERATION_KEY), state.get(BLACKLIST_PRUNED_KEY)
+        with self._lock:
+            if self._bloom is None or pruned != self._pruned:
+                self._rebuild()
+            elif generation != self._generation:
+                self._read_new_rows()
+            else:
+                return
+            self._generation, self._pruned = generation, pruned
+
+    def _rebuild(self) -> None:
+        now = timezone.now()
+        rows = list(
+            BlacklistedToken.objects.filter(token__expires_at__gt=now).values_list(
+                "id", "token__jti"
+            )
+        )
+        self._bloom = BloomFilter(max(BLOOM_CAPACITY, len(rows) * 2))
+        self._high_water = 0
+        self._add(rows, now)
+        logger.info("Loaded token blacklist", tokens=len(rows))
+
+    def _read_new_rows(self) -> None:
+        now = timezone.now()
+        rows = BlacklistedToken.objects.filter(
+            Q(id__gt=self._high_water)
+            | Q(blacklisted_at__gte=self._synced_at - HIGH_WATER_LOOKBACK)
+        ).values_list("id", "token__jti")
+        self._add(rows, now)
+        if self._bloom.count > self._bloom.capacity:
+            # past capacity the false positive rate climbs, so start over with a larger filter
+            self._rebuild()
+
+    def _add(self, rows, now) -> None:
+        for id, jti in rows:
+            self._bloom.add(jti)
+            self._high_water = max(self._high_water, id)
+        self._synced_at = now
+
+
+blacklist = BlacklistFilter()
+
+
+def prune_expired_tokens(batch_size: int = PRUNE_BATCH_SIZE) -> int:
+    """
+    Delete expired outstanding tokens and their blacklist entries in batches of `batch_size`,
+    each in a short transaction, so pruning a large backlog never holds locks for long. An
+    expired token fails validation on its own, so neither row is needed any more. Returns the
+    number of outstanding tokens deleted.
+    """
+    deleted = 0
+    while True:
+        ids = list(
+            OutstandingToken.objects.filter(expires_at__lte=timezone.now()).values_list(
+                "id", flat=True
+            )[:batch_size]
+        )
+        if not ids:
+            break
+        with transaction.atomic():
+            BlacklistedToken.objects.filter(token_id__in=ids).delete()
+            OutstandingToken.objects.filter(id__in=ids).delete()
+        deleted += len(ids)
+
+    if deleted:
+        blacklist.pruned()
+    logger.info("Pruned expired tokens", tokens=deleted)
+    return deleted
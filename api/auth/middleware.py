@@ -5,6 +5,13 @@ from django.contrib.auth.models import AbstractUser, AnonymousUser
 from django.http import HttpRequest
 from ninja.errors import HttpError
 from ninja_jwt.authentication import InvalidToken, JWTAuth
+from ninja_jwt.exceptions import TokenError
+from ninja_jwt.settings import api_settings
+from ninja_jwt.tokens import AccessToken
+
+from auth.permissions import permission_resolver
+from auth.token_cache import token_cache
+from auth.user_cache import user_cache
 
 logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
 
@@ -71,6 +78,59 @@ class StaffOnly:
             raise HttpError(403, "This operation is not allowed")
 
 
+class PermissionRequired:
+    "Permission that allows only users holding all of the given app_label.codename permissions"
+
+    def __init__(self, *perms: str):
+        self.perms = perms
+
+    def __str__(self) -> str:
+        return f"PermissionRequired({', '.join(self.perms)})"
+
+    def check(self, request: HttpRequest, user: AbstractUser):
+        if request.user.is_anonymous:
+            raise HttpError(403, "This operation is not allowed")
+
+        if not permission_resolver.has_perms(user, self.perms):
+            logger.info(
+                "User attempted to access restricted endpoint and was rejected",
+                user=user,
+                permission=str(self),
+                method=request.method,
+                path=request.path,
+            )
+
+            raise HttpError(403, "This operation is not allowed")
+
+
+def request_token(request: HttpRequest) -> str:
+    """The raw access token of the request, from the bearer header or else the cookie."""
+    auth_value = request.headers.get("Authorization")
+    token = None
+
+    if auth_value is not None:
+        parts = auth_value.split(" ")
+        if parts[0].lower() == "bearer":
+            token = " ".join(parts[1:])
+    # If not in header, try cookie
+    if not token or token == TOKEN_UNSET:
+        token = request.COOKIES.get("access_token", TOKEN_UNSET)
+    return token
+
+
+def forget_token(request: HttpRequest) -> None:
+    """Drop the cached user of the request's access token, e.g. when it logs out."""
+    token = request_token(request)
+    if token == TOKEN_UNSET:
+        return
+    try:
+        user_id = AccessToken(token).get(api_settings.USER_ID_CLAIM)
+    except TokenError:
+        return
+    if user_id is not None:
+        user_cache.invalidate(user_id)
+
+
 class JWTAuth(JWTAuth):
     def __init__(self, permissions=None, allow_anonymous=False):
         super().__init__()
@@ -78,25 +138,19 @@ class JWTAuth(JWTAuth):
         self.allow_anonymous = allow_anonymous
 
     def __call__(self, request: HttpRequest) -> Any | None:
-        headers = request.headers
-        auth_value = headers.get(self.header)
-        token = None
-
-        if auth_value is not None:
-            parts = auth_value.split(" ")
-            if parts[0].lower() == self.openapi_scheme:
-                token = " ".join(parts[1:])
-        # If not in header, try cookie
-        if not token or token == TOKEN_UNSET:
-            token = request.COOKIES.get("access_token", TOKEN_UNSET)
+        token = request_token(request)
 
         user: AbstractUser = AnonymousUser()
 
-        try:
-            user = self.authenticate(request, token)
+        if not token or token == TOKEN_UNSET or token_cache.known_invalid(token):
+            # most requests are anonymous: nothing to decode, nothing to log
             request.user = user
-        except Exception:
-            logger.error("Failed to authenticate user")
+        else:
+            try:
+                user = self.authenticate(request, token)
+                request.user = user
+            except Exception:
+                logger.error("Failed to authenticate user")
 
         if not self.permissions:
             return user
@@ -121,6 +175,27 @@ class JWTAuth(JWTAuth):
 
         return user
 
+    @classmethod
+    def get_validated_token(cls, raw_token):
+        """The decoded token, validated once and then served from the token cache until `exp`."""
+        return token_cache.validate(raw_token, super().get_validated_token)
+
+    def get_user(self, validated_token) -> AbstractUser:
+        """
+        The token's user, from the user cache when the same token was seen recently. Users are
+        only cached once loaded and found active; saving or deleting one invalidates it.
+        """
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        token_id = validated_token.get(api_settings.JTI_CLAIM) or validated_token.get("iat")
+        if user_id is None or token_id is None:
+            return super().get_user(validated_token)
+
+        user = user_cache.get(user_id, token_id)
+        if user is None:
+            user = super().get_user(validated_token)
+            user_cache.set(user, token_id)
+        return user
+
     def authorize(self, request: HttpRequest, user: AbstractUser) -> Type[AbstractUser]:
         if self.permissions:
             logger.info(
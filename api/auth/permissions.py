@@ -0,0 +1,79 @@
+import time
+from typing import Any, FrozenSet, Iterable
+
+from django.conf import settings
+from django.contrib.auth.models import AbstractUser, Permission
+from django.core.cache import cache
+from django.db.models import Q
+
+from auth.user_cache import LOCAL_TTL
+
+# The effective permissions of a user are cached under the versions they were computed at.
+# Bumping a user's version drops their set; bumping the global one drops everyone's, for
+# changes to a group or a permission itself.
+PERMISSIONS_VERSION_KEY = "auth:permissions:version"
+PERMISSIONS_TTL = 60 * 60
+# The per-process local memory cache only sees versions bumped in its own worker, so sets
+# cached there live no longer than the users cached alongside them.
+LOCAL_PERMISSIONS_TTL = LOCAL_TTL
+
+
+def _user_version_key(user_id: Any) -> str:
+    return f"auth:permissions:user:{user_id}:version"
+
+
+def _permissions_key(user_id: Any, version: Any, user_version: Any) -> str:
+    return f"auth:permissions:user:{user_id}:{version}:{user_version}"
+
+
+class PermissionResolver:
+    """
+    The "app_label.codename" permissions a user holds directly or through their groups,
+    resolved with one query and then kept in the cache until a version key changes. Checks
+    follow `ModelBackend`: inactive users hold nothing and active superusers everything.
+    """
+
+    @property
+    def ttl(self) -> int:
+        if "locmem" in settings.CACHES["default"]["BACKEND"].lower():
+            return LOCAL_PERMISSIONS_TTL
+        return PERMISSIONS_TTL
+
+    def permissions(self, user: AbstractUser) -> FrozenSet[str]:
+        if not user.is_active or user.is_anonymous:
+            return frozenset()
+
+        version_key, user_version_key = PERMISSIONS_VERSION_KEY, _user_version_key(user.pk)
+        versions = cache.get_many([version_key, user_version_key])
+        key = _permissions_key(
+            user.pk, versions.get(version_key, 0), versions.get(user_version_key, 0)
+        )
+        permissions = cache.get(key)
+        if permissions is None:
+            permissions = self._resolve(user)
+            cache.set(key, permissions, self.ttl)
+        return permissions
+
+    def has_perms(self, user: AbstractUser, perms: Iterable[str]) -> bool:
+        if user.is_active and user.is_superuser:
+            return True
+        return set(perms) <= self.permissions(user)
+
+    def user_changed(self, user_id: Any) -> None:
+        """The user's groups or own permissions changed."""
+        cache.set(_user_version_key(user_id), time.time_ns(), None)
+
+    def permissions_changed(self) -> None:
+        """A group's permissions, a group's members or a permission itself changed."""
+        cache.set(PERMISSIONS_VERSION_KEY, time.time_ns(), None)
+
+    def _resolve(self, user: AbstractUser) -> FrozenSet[str]:
+        rows = (
+            Permission.objects.filter(Q(user=user) | Q(group__user=user))
+            .values_list("content_type__app_label", "codename")
+            .distinct()
+        )
+        return frozenset(f"{app_label}.{codename}" for app_label, codename in rows)
+
+
+permission_resolver = PermissionResolver()
@@ -0,0 +1,42 @@
+from typing import Any
+
+import structlog
+from django.db import transaction
+from django.utils import timezone
+from ninja_jwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+from auth.blacklist import blacklist
+from auth.user_cache import user_cache
+
+logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
+
+# blacklist rows inserted per statement
+REVOKE_BATCH_SIZE = 1000
+
+
+def revoke_user_tokens(user_id: Any, batch_size: int = REVOKE_BATCH_SIZE) -> int:
+    """
+    Blacklist every unexpired refresh token of the user in one transaction, inserting the rows
+    in bulk. Tokens blacklisted already, or concurrently, are skipped rather than failing the
+    rest. Bulk inserts send no signals, so the blacklist filter and the user cache are told
+    here. Returns the number of tokens that were still valid.
+    """
+    with transaction.atomic():
+        tokens = list(
+            OutstandingToken.objects.filter(
+                user_id=user_id, expires_at__gt=timezone.now(), blacklistedtoken__isnull=True
+            ).values_list("id", "jti")
+        )
+        BlacklistedToken.objects.bulk_create(
+            [BlacklistedToken(token_id=id) for id, _ in tokens],
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        )
+
+        user_cache.invalidate(user_id)
+        # the other workers can only read the rows once they are committed
+        jtis = [jti for _, jti in tokens]
+        transaction.on_commit(lambda: (blacklist.added(jtis), user_cache.invalidate(user_id)))
+
+    logger.info("Revoked refresh tokens", user=user_id, tokens=len(tokens))
+    return len(tokens)
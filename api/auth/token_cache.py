@@ -0,0 +1,82 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from ninja_jwt.exceptions import InvalidToken
+from ninja_jwt.tokens import Token
+
+# decoded tokens kept per process
+TOKEN_CACHE_SIZE = 4096
+# how long a token that failed to decode is remembered; it can never become valid
+INVALID_TOKEN_TTL = 5 * 60
+
+
+class TokenCache:
+    """
+    Validated tokens by the SHA-256 of their raw form, so a token is decoded and its signature
+    checked once rather than on every request. A valid token is kept until its `exp`, an invalid
+    one for `INVALID_TOKEN_TTL`, both in a bounded LRU.
+    """
+
+    def __init__(self, size: int = TOKEN_CACHE_SIZE):
+        self.size = size
+        self._lock = threading.Lock()
+        self._tokens: OrderedDict = OrderedDict()
+
+    def _lookup(self, digest: bytes):
+        with self._lock:
+            entry = self._tokens.get(digest)
+            if entry is None:
+                return None
+            if entry[1] <= time.time():
+                del self._tokens[digest]
+                return None
+            self._tokens.move_to_end(digest)
+            return entry
+
+    def known_invalid(self, raw_token: str) -> bool:
+        """Whether the token already failed validation; such requests are anonymous."""
+        entry = self._lookup(_digest(raw_token))
+        return entry is not None and entry[0] is None
+
+    def validate(self, raw_token: str, validate: Callable[[str], Token]) -> Token:
+        """The validated token, from the cache or else from `validate`, which may raise."""
+        digest = _digest(raw_token)
+        entry = self._lookup(digest)
+        if entry is not None:
+            if entry[0] is None:
+                raise InvalidToken("Token is invalid")
+            return entry[0]
+
+        try:
+            token = validate(raw_token)
+        except InvalidToken:
+            self._remember(digest, None, time.time() + INVALID_TOKEN_TTL)
+            raise
+        self._remember(digest, token, _expires(token))
+        return token
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tokens.clear()
+
+    def _remember(self, digest: bytes, token: Optional[Token], expires: float) -> None:
+        with self._lock:
+            self._tokens[digest] = (token, expires)
+            self._tokens.move_to_end(digest)
+            while len(self._tokens) > self.size:
+                self._tokens.popitem(last=False)
+
+
+def _digest(raw_token: str) -> bytes:
+    return hashlib.sha256(raw_token.encode()).digest()
+
+
+def _expires(token: Token) -> float:
+    # tokens without an expiry are still checked again now and then
+    return float(token.get("exp", time.time() + INVALID_TOKEN_TTL))
+
+
+token_cache = TokenCache()
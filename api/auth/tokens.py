@@ -0,0 +1,14 @@
+from django.utils.translation import gettext_lazy as _
+from ninja_jwt import tokens
+from ninja_jwt.exceptions import TokenError
+from ninja_jwt.settings import api_settings
+
+from auth.blacklist import blacklist
+
+
+class RefreshToken(tokens.RefreshToken):
+    """A refresh token checked against the in-memory blacklist filter instead of a query."""
+
+    def check_blacklist(self) -> None:
+        if blacklist.is_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError(_("Token is blacklisted"))
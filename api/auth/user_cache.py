@@ -0,0 +1,96 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+import structlog
+from django.conf import settings
+from django.contrib.auth.models import AbstractUser
+from django.core.cache import cache
+
+logger: structlog.stdlib.BoundLogger = structlog.get_logger(__name__)
+
+# authenticated users kept per process
+USER_CACHE_SIZE = 1024
+# Entries in a worker's memory are only invalidated by writes made in that worker, so they
+# live briefly. The shared tier is invalidated everywhere and may keep them for the lifetime
+# of an access token.
+LOCAL_TTL = 30
+SHARED_TTL = 5 * 60
+
+
+def _generation_key(user_id: Any) -> str:
+    return f"auth:user:{user_id}:generation"
+
+
+def _user_key(user_id: Any, token_id: Any) -> str:
+    return f"auth:user:{user_id}:{token_id}"
+
+
+class UserCache:
+    """
+    Snapshots of authenticated users by (user id, token id), so that a request bearing a token
+    seen recently does not load its user again. An in-process LRU sits in front of the default
+    cache, which is used as a shared tier when it is not the per-process local memory cache.
+    Every lookup returns a copy, so requests cannot see each other's changes to `request.user`.
+    """
+
+    def __init__(self, size: int = USER_CACHE_SIZE):
+        self.size = size
+        self._lock = threading.Lock()
+        self._users: OrderedDict = OrderedDict()
+
+    @property
+    def shared(self) -> bool:
+        return "locmem" not in settings.CACHES["default"]["BACKEND"].lower()
+
+    def get(self, user_id: Any, token_id: Any) -> Optional[AbstractUser]:
+        key = (user_id, token_id)
+        with self._lock:
+            entry = self._users.get(key)
+            if entry is not None and entry[1] > time.monotonic():
+                self._users.move_to_end(key)
+                return copy.copy(entry[0])
+
+        if not self.shared:
+            return None
+        generation_key, user_key = _generation_key(user_id), _user_key(user_id, token_id)
+        found = cache.get_many([generation_key, user_key])
+        if user_key not in found:
+            return None
+        # written before the user last changed
+        generation, user = found[user_key]
+        if generation != found.get(generation_key, 0):
+            return None
+        self._remember(key, user)
+        return copy.copy(user)
+
+    def set(self, user: AbstractUser, token_id: Any) -> None:
+        user = copy.copy(user)
+        self._remember((user.pk, token_id), user)
+        if self.shared:
+            generation = cache.get(_generation_key(user.pk), 0)
+            cache.set(_user_key(user.pk, token_id), (generation, user), SHARED_TTL)
+
+    def invalidate(self, user_id: Any) -> None:
+        """Forget every snapshot of the user, in this process and in the shared tier."""
+        with self._lock:
+            for key in [key for key in self._users if key[0] == user_id]:
+                del self._users[key]
+        if self.shared:
+            cache.set(_generation_key(user_id), time.time_ns(), SHARED_TTL)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._users.clear()
+
+    def _remember(self, key: tuple, user: AbstractUser) -> None:
+        with self._lock:
+            self._users[key] = (user, time.monotonic() + LOCAL_TTL)
+            self._users.move_to_end(key)
+            while len(self._users) > self.size:
+                self._users.popitem(last=False)
+
+
+user_cache = UserCache()
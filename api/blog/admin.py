@@ -1,6 +1,8 @@
 from django.contrib import admin
 
+from blog import cache as post_cache
 from blog.models import Comment, File, Post, Series, ShareCode
+from blog.search import search_query
 
 
 # Register your models here.
@@ -13,6 +15,12 @@ class PostAdmin(admin.ModelAdmin):
     date_hierarchy = "published_at"
     ordering = ("-published_at",)
 
+    def get_search_results(self, request, queryset, search_term):
+        # use the indexed search vector instead of ILIKE scans over the post bodies
+        if not search_term:
+            return queryset, False
+        return queryset.filter(search_vector=search_query(search_term)), False
+
 
 @admin.register(Series)
 class SeriesAdmin(admin.ModelAdmin):
@@ -32,6 +40,13 @@ admin.site.register(File, FileAdmin)
 admin.site.register(ShareCode)
 
 
+def invalidate_comment_posts(comments):
+    # bulk updates skip the model signals that keep cached comment counts fresh
+    post_cache.invalidate_post_details(
+        Post.objects.filter(comments__in=comments).values_list("slug", "published_at").distinct()
+    )
+
+
 @admin.register(Comment)
 class CommentAdmin(admin.ModelAdmin):
     list_display = (
@@ -48,11 +63,13 @@ class CommentAdmin(admin.ModelAdmin):
 
     def mark_visible(self, request, queryset):
         queryset.update(visible=True)
+        invalidate_comment_posts(queryset)
 
     mark_visible.short_description = "Mark selected comments as visible"
 
     def mark_hidden(self, request, queryset):
         queryset.update(visible=False)
+        invalidate_comment_posts(queryset)
 
     mark_hidden.short_description = "Mark selected comments as hidden"
 
@@ -7,6 +7,8 @@ from ninja.errors import HttpError, ValidationError
 from ninja.pagination import paginate
 
 from auth.middleware import JWTAuth, StaffOnly
+from blog.comment_tree import ThreadPagination, build_comment_tree
+from blog.pagination import CursorPagination
 from blog.schema.comment import (
     AdminCommentList,
     AdminCommentUpdate,
@@ -20,6 +22,15 @@ from ..models import Comment, Post
 comments_router = Router()
 
 
+def with_replies(comment: Comment) -> Comment:
+    """Attach the visible reply tree below `comment`, loaded in a single query."""
+    for node in build_comment_tree(Comment.objects.filter(post_id=comment.post_id)):
+        if node.id == comment.id:
+            return node
+    comment.thread_children = []
+    return comment
+
+
 @comments_router.get(
     "/",
     response={200: List[CommentList]},
@@ -27,35 +38,35 @@ comments_router = Router()
     auth=JWTAuth(permissions=None, allow_anonymous=True),
     operation_id="listComments",
 )
-@paginate
+@paginate(ThreadPagination)
 def list_comments(
     request: HttpRequest,
     post_id: int | None = None,
     top_level: bool = False,
 ):
     """
-    List all comments for a post
+    List all visible comments for a post, each with its visible replies nested below it.
+    The whole thread is loaded in one query and assembled in memory.
+
+    Without `post_id` (staff only) the visible top-level comments of every post are listed,
+    paged in the database, with the replies of each page loaded alongside.
     """
     if post_id is None and not request.user.is_staff:
         raise HttpError(403, "You do not have permission to view all comments")
 
-    comments = Comment.objects.all()
+    if post_id is None:
+        return (
+            Comment.objects.filter(visible=True, parent__isnull=True)
+            .select_related("author", "post")
+            .defer("post__content", "post__content_html", "post__excerpt")
+        )
 
-    if post_id:
-        try:
-            comments = comments.filter(post_id=post_id)
-        except Exception as err:
-            raise HttpError(500, "Fail to fetch all comments") from err
+    thread = build_comment_tree(Comment.objects.filter(post_id=post_id))
 
     if top_level:
-        comments = comments.filter(parent__isnull=True)
-
-    # go through the children field of each comment and pop items where visible is False
-    for comment in comments:
-        if not comment.visible:
-            comments.pop(comment)
+        thread = [comment for comment in thread if comment.parent_id is None]
 
-    return comments
+    return thread
 
 
 @comments_router.get(
@@ -65,7 +76,7 @@ def list_comments(
     auth=JWTAuth(permissions=StaffOnly, allow_anonymous=False),
     operation_id="modQueueList",
 )
-@paginate
+@paginate(CursorPagination)
 def mod_queue_list(request: HttpRequest, reviewed: Optional[bool] = False):
     try:
         comments = Comment.objects.filter(reviewed=reviewed)
@@ -125,7 +136,7 @@ def get_comment(request: HttpRequest, id: int):
     Gets all the details of a comment.
     """
     try:
-        return Comment.objects.get(id=id)
+        return with_replies(Comment.objects.get(id=id))
     except Exception as err:
         raise HttpError(500, "Fail to fetch comment") from err
 
@@ -191,7 +202,7 @@ def update_comment(request, id: int, comment: CommentMutate):
         original.reviewed = False
         original.save()
 
-        return original
+        return with_replies(original)
     except Exception as err:
         raise ValidationError("Comment with this id already exists") from err
 
@@ -1,9 +1,19 @@
-from django.http import HttpRequest
+import hashlib
+import io
+import json
+from datetime import datetime
+from typing import List
+
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse
 from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
 from ninja import Router
-from ninja.responses import Response
+from ninja.responses import NinjaJSONEncoder
 
 from auth.middleware import JWTAuth
+from blog import cache as post_cache
 from blog.feed_builder import FeedBuilder
 from blog.schema.feed import FeedAuthorSchema, FeedItem, JSONFeed
 
@@ -11,46 +21,146 @@ from ..models import Post
 
 feed_router = Router()
 
+FEED_MAX_LIMIT = 100
+FEED_FORMATS = {
+    "json": ("https://ooo-yay.com/api/feed/", "application/feed+json"),
+    "rss": ("https://ooo-yay.com/api/feed/rss", "application/rss+xml; charset=utf-8"),
+    "atom": ("https://ooo-yay.com/api/feed/atom", "application/atom+xml; charset=utf-8"),
+}
 
-@feed_router.get(
-    "/",
-    auth=JWTAuth(None, True),
-    response={200: JSONFeed},
-    tags=["feed"],
-    operation_id="getFeed",
-)
-def feed(request: HttpRequest, limit: int = 10, offset: int = 0):
-    builder = (
-        FeedBuilder(title="ooo-yay feed")
-        .with_authors([FeedAuthorSchema(name="Matt Ouille", url="https://ooo-yay.com")])
-        .with_description("Latest posts from @ooo-yay")
-        .with_icon("https://ooo-yay.com/logo.svg")
-        .with_favicon("https://ooo-yay.com/logo.svg")
-        .with_feed_url("https://ooo-yay.com/api/feed/")
-        .with_home_page_url("https://ooo-yay.com")
-    )
 
-    posts = Post.objects.filter(published_at__lte=timezone.now()).order_by("-published_at")[
-        offset : offset + limit
-    ]
-    for post in posts:
-        builder.add_item(
-            FeedItem(
+def feed_items(post_ids: List[tuple]) -> List[FeedItem]:
+    """
+    Feed items for the given (id, updated_at, content_hash) rows, in order. Items are cached
+    per post revision and shared by every feed format and page, so only posts that changed
+    since they were last rendered are loaded from the database.
+    """
+    keys = {row[0]: post_cache.feed_item_key(*row) for row in post_ids}
+    cached = cache.get_many(keys.values())
+    missing = [post_id for post_id, key in keys.items() if key not in cached]
+    if missing:
+        fresh = {}
+        for post in Post.objects.filter(id__in=missing).only(
+            "id", "title", "slug", "content_html", "published_at", "updated_at"
+        ):
+            fresh[keys[post.id]] = FeedItem(
                 id=f"{post.id}",
                 title=post.title,
-                content_html=post.content,
+                content_html=post.content_html,
                 date_published=post.published_at,
                 date_modified=post.updated_at,
                 language="en",
                 author=FeedAuthorSchema(name="Matt Ouille", url="https://ooo-yay.com"),
                 url=f"https://ooo-yay.com/posts/{post.published_at.year}/{post.slug}",
             )
-        )
+        cache.set_many(fresh, post_cache.FEED_CACHE_TIMEOUT)
+        cached.update(fresh)
+    return [cached[key] for key in keys.values() if key in cached]
+
+
+def build_feed_snapshot(name: str, limit: int, offset: int):
+    """
+    Render one page of the feed in the given format to bytes, along with the validators used
+    for conditional requests and how long the snapshot stays valid.
+    """
+    feed_url, _ = FEED_FORMATS[name]
+    builder = (
+        FeedBuilder(title="ooo-yay feed")
+        .with_authors([FeedAuthorSchema(name="Matt Ouille", url="https://ooo-yay.com")])
+        .with_description("Latest posts from @ooo-yay")
+        .with_icon("https://ooo-yay.com/logo.svg")
+        .with_favicon("https://ooo-yay.com/logo.svg")
+        .with_feed_url(feed_url)
+        .with_home_page_url("https://ooo-yay.com")
+    )
+
+    now = timezone.now()
+    # one extra row tells us whether there is a next page without a COUNT query
+    rows = list(
+        Post.objects.filter(published_at__lte=now)
+        .order_by("-published_at")
+        .values_list("id", "updated_at", "content_hash")[offset : offset + limit + 1]
+    )
+    has_next = len(rows) > limit
+    for item in feed_items(rows[:limit]):
+        builder.add_item(item)
+
+    if has_next:
+        builder.with_next_url(f"{feed_url}?limit={limit}&offset={offset + limit}")
+
+    if name == "json":
+        body = json.dumps(builder.build(), cls=NinjaJSONEncoder).encode()
+    else:
+        buffer = io.BytesIO()
+        if name == "rss":
+            builder.write_rss(buffer)
+        else:
+            builder.write_atom(buffer)
+        body = buffer.getvalue()
+
+    snapshot = {
+        "body": body,
+        "etag": f'"{hashlib.sha256(body).hexdigest()}"',
+        # the snapshot time rather than the newest item, which would go back on deletes
+        "last_modified": now.timestamp(),
+    }
+    return snapshot, _snapshot_timeout(now)
+
+
+def _snapshot_timeout(now: datetime) -> int:
+    # scheduled posts appear without any write, so expire the snapshot when the next one is due
+    next_scheduled = (
+        Post.objects.filter(published_at__gt=now)
+        .order_by("published_at")
+        .values_list("published_at", flat=True)
+        .first()
+    )
+    if next_scheduled is None:
+        return post_cache.FEED_CACHE_TIMEOUT
+    return max(1, min(post_cache.FEED_CACHE_TIMEOUT, int((next_scheduled - now).total_seconds())))
+
+
+def feed_response(request: HttpRequest, name: str, limit: int, offset: int) -> HttpResponse:
+    limit = max(1, min(limit, FEED_MAX_LIMIT))
+    offset = max(0, offset)
+    snapshot = post_cache.get_or_build(
+        post_cache.feed_key(name, limit, offset),
+        lambda: build_feed_snapshot(name, limit, offset),
+    )
+
+    response = HttpResponse(snapshot["body"], content_type=FEED_FORMATS[name][1])
+    response["ETag"] = snapshot["etag"]
+    response["Last-Modified"] = http_date(snapshot["last_modified"])
+    return get_conditional_response(
+        request,
+        etag=snapshot["etag"],
+        last_modified=int(snapshot["last_modified"]),
+        response=response,
+    )
+
+
+@feed_router.get(
+    "/",
+    auth=JWTAuth(None, True),
+    response={200: JSONFeed},
+    tags=["feed"],
+    operation_id="getFeed",
+)
+def feed(request: HttpRequest, limit: int = 10, offset: int = 0):
+    """
+    JSON Feed of published posts. Pages are served from a snapshot rebuilt only after posts
+    change, and honour `If-None-Match`/`If-Modified-Since` with `304 Not Modified`.
+    """
+    return feed_response(request, "json", limit, offset)
+
+
+@feed_router.get("/rss", auth=JWTAuth(None, True), tags=["feed"], operation_id="getRssFeed")
+def rss_feed(request: HttpRequest, limit: int = 10, offset: int = 0):
+    """RSS 2.0 rendering of the JSON feed, cached and validated the same way."""
+    return feed_response(request, "rss", limit, offset)
 
-    count = Post.objects.filter(published_at__lte=timezone.now()).count()
-    if offset + limit < count:
-        builder.with_next_url(
-            f"https://ooo-yay.com/api/feed/?limit={limit}&offset={offset + limit}"
-        )
 
-    return Response(builder.build(), content_type="application/feed+json")
+@feed_router.get("/atom", auth=JWTAuth(None, True), tags=["feed"], operation_id="getAtomFeed")
+def atom_feed(request: HttpRequest, limit: int = 10, offset: int = 0):
+    """Atom 1.0 rendering of the JSON feed, cached and validated the same way."""
+    return feed_response(request, "atom", limit, offset)
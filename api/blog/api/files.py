@@ -1,23 +1,69 @@
-from typing import List, Literal
+import json
+from datetime import timedelta
+from typing import Iterator, List
+from uuid import UUID
 
 import structlog
-from django.http import HttpRequest
+from botocore.exceptions import BotoCoreError, ClientError
+from django.core import signing
+from django.db.models import Prefetch, QuerySet
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.http import content_disposition_header, http_date
 from ninja import File as NinjaFile
-from ninja import Router, UploadedFile
+from ninja import Query, Router, UploadedFile
 from ninja.errors import HttpError
 from ninja.pagination import paginate
 
-from auth.middleware import JWTAuth, StaffOnly
-from blog.schema.file import FileDetails, FileMetadata, FileMutateMetadata, OrphanedFiles
-from files.storage import PrivateStorage, PublicStorage
+from auth.middleware import AuthenticatedOnly, JWTAuth, StaffOnly
+from blog import derivatives, reconcile, uploads
+from blog.deletion import delete_files
+from blog.orphans import iter_orphaned_files
+from blog.pagination import CursorPagination
+from blog.schema.file import (
+    FileBulkDelete,
+    FileBulkDeleteResult,
+    FileDetails,
+    FileDownload,
+    FileFilters,
+    FileMetadata,
+    FileMutateMetadata,
+    FileUploadComplete,
+    FileUploadRequest,
+    FileUploadTicket,
+    FileVisibilityUpdate,
+    MissingFiles,
+    OrphanedFileDetails,
+    OrphanedFiles,
+    StorageStats,
+    UploadPartDetails,
+    UploadSessionCreate,
+    UploadSessionDetails,
+)
+from blog.visibility import change_visibility
+from files import download, hashing, multipart, presign
+from files.storage import stats as storage_stats
+from files.storage import storage_for
 
-from ..models import File
+from ..models import File, Post, UploadSession
 
 logger = structlog.get_logger(__name__)
 
 files_router = Router()
 
 
+def file_details(files: QuerySet) -> QuerySet:
+    """
+    Files with everything FileDetails renders prefetched: a page costs the same few queries
+    however many files and posts it holds.
+    """
+    return files.prefetch_related(
+        Prefetch("posts", queryset=Post.objects.only("id", "title", "published_at", "slug")),
+        "derivatives",
+    )
+
+
 @files_router.get(
     "/",
     response={200: List[FileDetails]},
@@ -25,23 +71,51 @@ files_router = Router()
     auth=JWTAuth(permissions=StaffOnly),
     operation_id="listFiles",
 )
-@paginate
-def list_files(request: HttpRequest, visibility: Literal["public", "private", "all"] = "all"):
+@paginate(CursorPagination)
+def list_files(request: HttpRequest, filters: FileFilters = Query(...)):
     """
     List all files
     """
     try:
-        if visibility == "public":
-            return File.objects.filter(visibility="public")
-        elif visibility == "private":
-            return File.objects.filter(visibility="private")
-        else:
-            return File.objects.all()
+        return filters.filter(file_details(File.objects.order_by("-created_at")))
     except Exception as err:
         logger.error("Error fetching all files", error=err)
         raise HttpError(500, "Fail to fetch all files") from err
 
 
+def _stream_orphaned_files(head: bool) -> Iterator[bytes]:
+    """Encode the scan as an `OrphanedFiles` document, one file at a time."""
+    current, first = "public", True
+    yield b'{"public": ['
+    try:
+        for visibility, obj, url in iter_orphaned_files(head=head):
+            if visibility != current:
+                yield b'], "private": ['
+                current, first = visibility, True
+            details = OrphanedFileDetails(
+                name=obj.name,
+                size=obj.size,
+                content_type=obj.content_type,
+                location=url,
+                last_modified=obj.last_modified,
+                visibility=visibility,
+            )
+            yield (b"" if first else b", ") + details.model_dump_json().encode()
+            first = False
+    except Exception as err:
+        # the status line is already sent, so the failure is reported in the document itself
+        logger.error("Error listing orphaned files", error=err)
+        error = "Fail to list orphaned files"
+    else:
+        error = None
+    if current == "public":
+        yield b'], "private": ['
+    yield b'], "complete": %s, "error": %s}' % (
+        json.dumps(error is None).encode(),
+        json.dumps(error).encode(),
+    )
+
+
 @files_router.get(
     "/orphaned",
     response={200: OrphanedFiles},
@@ -49,148 +123,346 @@ def list_files(request: HttpRequest, visibility: Literal["public", "private", "a
     auth=JWTAuth(permissions=StaffOnly),
     operation_id="listOrphanedFiles",
 )
-def list_orphaned_files(request: HttpRequest):
+def list_orphaned_files(request: HttpRequest, live: bool = False, exact_content_types: bool = True):
     """
     Find files that exist in storage but not in the database.
     If a file exists in both public and private storage, it will be considered public.
-    Returns detailed metadata about each orphaned file.
+    Reads the inventory kept by the `reconcile_storage` job; `snapshot_at` tells how current it
+    is. With `live`, or before the first inventory pass completes, the buckets are scanned
+    instead: they are listed page by page and results are streamed as they are found, with
+    content types read by concurrent HEAD requests or guessed from file names when
+    `exact_content_types` is false. A live scan that fails part way ends the document with
+    `complete` false; its lists are partial.
     """
+    scan = None if live else reconcile.snapshot()
+    if scan is None:
+        return StreamingHttpResponse(
+            _stream_orphaned_files(exact_content_types), content_type="application/json"
+        )
+
+    storages = {"public": storage_for("public"), "private": storage_for("private")}
+    result = {"public": [], "private": [], "snapshot_at": scan.snapshot_at}
+    for obj in reconcile.orphaned_objects():
+        result[obj.visibility].append(
+            {
+                "name": obj.name,
+                "size": obj.size,
+                "content_type": obj.content_type or "application/octet-stream",
+                "location": storages[obj.visibility].url(obj.name),
+                "last_modified": obj.last_modified,
+                "visibility": obj.visibility,
+            }
+        )
+    return result
+
+
+@files_router.get(
+    "/missing",
+    response={200: MissingFiles},
+    tags=["files"],
+    auth=JWTAuth(permissions=StaffOnly),
+    operation_id="listMissingFiles",
+)
+def list_missing_files(request: HttpRequest):
+    """
+    Files in the database whose object was not in storage as of the latest inventory snapshot
+    taken by the `reconcile_storage` job. Empty, with no `snapshot_at`, until one exists.
+    """
+    scan = reconcile.snapshot()
+    if scan is None:
+        return {"snapshot_at": None, "files": []}
+    return {
+        "snapshot_at": scan.snapshot_at,
+        "files": file_details(reconcile.missing_files(scan)),
+    }
+
+
+@files_router.get(
+    "/storage/stats",
+    response={200: StorageStats},
+    tags=["files"],
+    auth=JWTAuth(permissions=StaffOnly),
+    operation_id="getStorageStats",
+)
+def get_storage_stats(request: HttpRequest):
+    """
+    S3 clients created by this server process and the count, errors and latency of its S3 calls
+    by operation, since the process started.
+    """
+    return storage_stats.snapshot()
+
+
+UPLOAD_TOKEN_SALT = "blog.files.upload"
+
+
+# declared before the first "/{id}" route so the literal paths win
+@files_router.post(
+    "/uploads",
+    response={200: FileUploadTicket},
+    tags=["files"],
+    auth=JWTAuth(permissions=StaffOnly),
+    operation_id="createFileUpload",
+)
+def create_file_upload(request: HttpRequest, upload: FileUploadRequest):
+    """
+    Starts a direct upload to storage. The client PUTs the file to the returned URL with the
+    returned headers, then calls completeFileUpload with the token to record the file.
+    Given the content's `sha256`, storage verifies the upload against it, and if a file with
+    identical content and visibility exists it is returned as `file` with nothing to upload.
+    """
+    duplicate = uploads.reuse_duplicate(upload.visibility, upload.sha256, upload.posts)
+    if duplicate:
+        return {"name": duplicate.name, "file": duplicate}
+
     try:
-        # Get all files from database
-        db_files = set(File.objects.values_list("name", flat=True))
-        logger.info("Files in database", files=list(db_files))
+        storage = storage_for(upload.visibility)
+        name = storage.get_available_name(storage.generate_filename(upload.name))
+        url, headers = presign.presigned_put(
+            storage, name, upload.content_type, sha256=upload.sha256
+        )
+    except Exception as err:
+        logger.error("Error presigning upload", error=err)
+        raise HttpError(500, "Fail to create upload") from err
+
+    token = signing.dumps(
+        {
+            "name": name,
+            "visibility": upload.visibility,
+            "posts": upload.posts or [],
+            "sha256": upload.sha256 or "",
+        },
+        salt=UPLOAD_TOKEN_SALT,
+    )
+    return {
+        "name": name,
+        "url": url,
+        "headers": headers,
+        "expires_at": timezone.now() + timedelta(seconds=presign.UPLOAD_URL_EXPIRY),
+        "token": token,
+    }
 
-        # Initialize storage backends
-        public_storage = PublicStorage()
-        private_storage = PrivateStorage()
 
-        # List files from public storage
-        public_files = set()
-        orphaned_public_details = []
-        try:
-            # Debug: Print storage configuration
-            logger.info(
-                "Public storage config",
-                bucket=public_storage.bucket_name,
-                location=public_storage.location,
-            )
+@files_router.post(
+    "/uploads/complete",
+    response={200: FileDetails},
+    tags=["files"],
+    auth=JWTAuth(permissions=StaffOnly),
+    operation_id="completeFileUpload",
+)
+def complete_file_upload(request: HttpRequest, payload: FileUploadComplete):
+    """
+    Records a file uploaded with createFileUpload once its object is in storage. Size and
+    content type are taken from the stored object. Completing twice returns the same file.
+    Without a `sha256` from the client the content is hashed in the background.
+    """
+    try:
+        # the upload may finish right before its URL expires; leave time to complete it
+        upload = signing.loads(
+            payload.token, salt=UPLOAD_TOKEN_SALT, max_age=presign.UPLOAD_URL_EXPIRY * 2
+        )
+    except signing.BadSignature as err:
+        raise HttpError(400, "Invalid or expired upload token") from err
+
+    existing = File.objects.filter(name=upload["name"], visibility=upload["visibility"]).first()
+    if existing:
+        return existing
 
-            # Get all objects and log them
-            prefix = public_storage.location.rstrip("/") + "/" if public_storage.location else ""
-            all_objects = list(public_storage.bucket.objects.filter(Prefix=prefix))
-            logger.info("Raw public bucket objects", objects=[obj.key for obj in all_objects])
+    storage = storage_for(upload["visibility"])
+    try:
+        stored = presign.head(storage, upload["name"])
+    except Exception as err:
+        logger.error("Error verifying upload", error=err, name=upload["name"])
+        raise HttpError(500, "Fail to verify upload") from err
+    if stored is None:
+        raise HttpError(409, "The file has not been uploaded yet")
+
+    content_type, _, params = stored.get("ContentType", "application/octet-stream").partition(";")
+    charset = params.strip().removeprefix("charset=") or None
+    file = File.objects.create(
+        location=storage.url(upload["name"]),
+        name=upload["name"],
+        content_type=content_type.strip(),
+        charset=charset,
+        size=stored["ContentLength"],
+        visibility=upload["visibility"],
+        # checked by storage against the content when the URL was signed with it
+        sha256=upload["sha256"],
+    )
+    if upload["posts"]:
+        file.posts.set(upload["posts"])
+    derivatives.schedule(file)
+    uploads.schedule_hash(file)
+    return file
 
-            # Create a mapping of full keys to objects for easier lookup
-            public_object_map = {obj.key: obj for obj in all_objects if obj.key != prefix}
 
-            # Remove the prefix from the keys to match database names
-            public_files = {
-                key[len(prefix) :] if prefix else key for key in public_object_map.keys()
-            }
+def _session_details(session: UploadSession) -> dict:
+    parts = list(session.parts.all())
+    return {
+        "id": session.id,
+        "name": session.name,
+        "content_type": session.content_type,
+        "visibility": session.visibility,
+        "size": session.size,
+        "min_part_size": multipart.MIN_PART_SIZE,
+        "max_part_size": multipart.MAX_PART_SIZE,
+        "parts": parts,
+        "received": sum(part.size for part in parts),
+        "expires_at": session.updated_at + uploads.UPLOAD_SESSION_TTL,
+        "file": session.file,
+    }
 
-            logger.info("Files in public storage (without prefix)", files=list(public_files))
-            logger.info("Orphaned public files", files=list(public_files - db_files))
-
-            # Get details for each orphaned public file
-            for filename in public_files - db_files:
-                try:
-                    file_obj = public_storage.open(filename)
-                    # Get the object using the full key from our mapping
-                    full_key = prefix + filename if prefix else filename
-                    obj = public_object_map.get(full_key)
-
-                    if obj:
-                        logger.info(
-                            "Found orphaned public file",
-                            filename=filename,
-                            full_key=full_key,
-                            size=obj.size,
-                        )
-                        orphaned_public_details.append(
-                            {
-                                "name": filename,
-                                "size": obj.size,
-                                "content_type": getattr(
-                                    file_obj, "content_type", "application/octet-stream"
-                                ),
-                                "location": public_storage.url(filename),
-                                "last_modified": obj.last_modified,
-                                "visibility": "public",
-                            }
-                        )
-                    else:
-                        logger.error(
-                            "Failed to get object details", filename=filename, full_key=full_key
-                        )
-                except Exception as err:
-                    logger.error("Error getting public file details", error=err, filename=filename)
-        except Exception as err:
-            logger.error("Error listing public files", error=err)
-
-        # List files from private storage
-        private_files = set()
-        orphaned_private_details = []
-        try:
-            # Get all objects and log them
-            prefix = private_storage.location.rstrip("/") + "/" if private_storage.location else ""
-            all_objects = list(private_storage.bucket.objects.filter(Prefix=prefix))
-            logger.info("Raw private bucket objects", objects=[obj.key for obj in all_objects])
 
-            # Create a mapping of full keys to objects for easier lookup
-            private_object_map = {obj.key: obj for obj in all_objects if obj.key != prefix}
+@files_router.post(
+    "/sessions",
+    response={200: UploadSessionDetails},
+    tags=["files"],
+    auth=JWTAuth(permissions=StaffOnly),
+    operation_id="createUploadSession",
+)
+def create_upload_session(request: HttpRequest, payload: UploadSessionCreate):
+    """
+    Starts a resumable upload. Send the file in numbered parts with uploadSessionPart, in any
+    order and concurrently, then call completeUploadSession. If the connection drops, get the
+    session to see which parts arrived and send the rest.
+    """
+    try:
+        session = uploads.start_session(
+            request.user,
+            payload.name,
+            payload.content_type,
+            payload.visibility,
+            size=payload.size,
+            posts=payload.posts,
+        )
+    except HttpError:
+        raise
+    except Exception as err:
+        logger.error("Error creating upload session", error=err)
+        raise HttpError(500, "Fail to create upload session") from err
+    return _session_details(session)
 
-            # Remove the prefix from the keys to match database names
-            private_files = {
-                key[len(prefix) :] if prefix else key for key in private_object_map.keys()
-            }
 
-            # Remove any files that exist in public storage
-            private_files = private_files - public_files
-
-            logger.info("Files in private storage (without prefix)", files=list(private_files))
-            logger.info("Orphaned private files", files=list(private_files - db_files))
-
-            # Get details for each orphaned private file
-            for filename in private_files - db_files:
-                try:
-                    file_obj = private_storage.open(filename)
-                    # Get the object using the full key from our mapping
-                    full_key = prefix + filename if prefix else filename
-                    obj = private_object_map.get(full_key)
-
-                    if obj:
-                        logger.info(
-                            "Found orphaned private file",
-                            filename=filename,
-                            full_key=full_key,
-                            size=obj.size,
-                        )
-                        orphaned_private_details.append(
-                            {
-                                "name": filename,
-                                "size": obj.size,
-                                "content_type": getattr(
-                                    file_obj, "content_type", "application/octet-stream"
-                                ),
-                                "location": private_storage.url(filename),
-                                "last_modified": obj.last_modified,
-                                "visibility": "private",
-                            }
-                        )
-                    else:
-                        logger.error(
-                            "Failed to get object details", filename=filename, full_key=full_key
-                        )
-                except Exception as err:
-                    logger.error("Error getting private file details", error=err, filename=filename)
-        except Exception as err:
-            logger.error("Error listing private files", error=err)
-
-        return {"public": orphaned_public_details, "private": orphaned_private_details}
+@files_router.get(
+    "/sessions/{session_id}",
+    response={200: UploadSessionDetails},
+    tags=["files"],
+    auth=JWTAuth(permissions=StaffOnly),
+    operation_id="getUploadSession",
+)
+def get_upload_session(request: HttpRequest, session_id: UUID):
+    """
+    Gets the parts received so far by a resumable upload.
+    """
+    return _session_details(get_object_or_404(UploadSession, id=session_id, owner=request.user))
 
+
+@files_router.put(
+    "/sessions/{session_id}/parts/{number}",
+    response={200: UploadPartDetails},
+    tags=["files"],
+    auth=JWTAuth(permissions=StaffOnly),
+    operation_id="uploadSessionPart",
+)
+def upload_session_part(request: HttpRequest, session_id: UUID, number: int):
+    """
+    Stores part `number` (starting at 1) of a resumable upload; the request body is the raw
+    bytes of the part, with its Content-Length. Sending a part again replaces it.
+    """
+    session = get_object_or_404(UploadSession, id=session_id, owner=request.user)
+    try:
+        size = int(request.headers["Content-Length"])
+    except (KeyError, ValueError):
+        raise HttpError(411, "Content-Length is required") from None
+    try:
+        # stream the body to storage as it arrives rather than buffering the part
+        return uploads.append_part(session, number, request, size)
+    except HttpError:
+        raise
     except Exception as err:
-        logger.error("Error listing orphaned files", error=err)
-        raise HttpError(500, "Failed to list orphaned files") from err
+        logger.error("Error uploading part", error=err, session=session.id, number=number)
+        raise HttpError(500, "Fail to upload part") from err
+
+
+@files_router.post(
+    "/sessions/{session_id}/complete",
+    response={200: FileDetails},
+    tags=["files"],
+    auth=JWTAuth(permissions=StaffOnly),
+    operation_id="completeUploadSession",
+)
+def complete_upload_session(request: HttpRequest, session_id: UUID):
+    """
+    Assembles the uploaded parts into the file and records it; its content is hashed in the
+    background. Completing twice returns the same file.
+    """
+    session = get_object_or_404(UploadSession, id=session_id, owner=request.user)
+    try:
+        return uploads.complete_session(session)
+    except HttpError:
+        raise
+    except Exception as err:
+        logger.error("Error completing upload session", error=err, session=session.id)
+        raise HttpError(500, "Fail to complete upload session") from err
+
+
+@files_router.delete(
+    "/sessions/{session_id}",
+    response={200: None},
+    tags=["files"],
+    auth=JWTAuth(permissions=StaffOnly),
+    operation_id="abortUploadSession",
+)
+def abort_upload_session(request: HttpRequest, session_id: UUID):
+    """
+    Discards a resumable upload and the parts stored for it.
+    """
+    uploads.abort_session(get_object_or_404(UploadSession, id=session_id, owner=request.user))
+    return None
+
+
+@files_router.put(
+    "/visibility",
+    response={200: List[FileDetails]},
+    tags=["files"],
+    auth=JWTAuth(permissions=StaffOnly),
+    operation_id="updateFilesVisibility",
+)
+def update_files_visibility(request: HttpRequest, payload: FileVisibilityUpdate):
+    """
+    Changes the visibility of many files at once. Objects are moved concurrently within storage.
+    """
+    files = list(File.objects.filter(id__in=payload.ids).order_by("id"))
+    if len(files) != len(set(payload.ids)):
+        raise HttpError(404, "Not all files exist")
+    try:
+        change_visibility(files, payload.visibility)
+    except Exception as err:
+        logger.error("Error changing file visibility", error=err)
+        raise HttpError(500, "Fail to change file visibility") from err
+    return file_details(File.objects.filter(id__in=payload.ids).order_by("id"))
+
+
+@files_router.post(
+    "/delete",
+    response={200: FileBulkDeleteResult},
+    tags=["files"],
+    auth=JWTAuth(permissions=StaffOnly),
+    operation_id="deleteFiles",
+)
+def delete_files_in_bulk(request: HttpRequest, payload: FileBulkDelete):
+    """
+    Deletes many files, and orphaned objects listed by `listOrphanedFiles`, at once. Rows are
+    deleted in one transaction and objects in batches of up to 1000 keys; objects storage fails
+    to delete are listed in `failures`.
+    """
+    try:
+        files, objects, failures = delete_files(
+            payload.ids, [(orphan.visibility, orphan.name) for orphan in payload.orphans]
+        )
+    except Exception as err:
+        logger.error("Error deleting files", error=err)
+        raise HttpError(500, "Fail to delete files") from err
+    return {"files": files, "objects": objects, "failures": failures}
 
 
 @files_router.get(
@@ -205,12 +477,105 @@ def get_file(request: HttpRequest, id: int):
     Gets all the details of a file.
     """
     try:
-        return File.objects.get(id=id)
+        return file_details(File.objects.all()).get(id=id)
     except Exception as err:
         logger.error("Error fetching file", error=err)
         raise HttpError(500, "Fail to fetch file") from err
 
 
+def _downloadable(request: HttpRequest, id: int) -> File:
+    """The file, if the user may download it: staff any file, others the files of published posts."""
+    file = get_object_or_404(File, id=id)
+    if not request.user.is_staff:
+        if not file.posts.filter(published_at__lte=timezone.now()).exists():
+            raise HttpError(404, "File not found")
+    return file
+
+
+@files_router.get(
+    "/{id}/download",
+    response={200: FileDownload},
+    tags=["files"],
+    auth=JWTAuth(permissions=AuthenticatedOnly),
+    operation_id="getFileDownload",
+)
+def get_file_download(request: HttpRequest, id: int):
+    """
+    A URL to download the file from. For private files it is presigned and short-lived; the same
+    URL is handed out again while most of its lifetime is left.
+    """
+    file = _downloadable(request, id)
+    if file.visibility == "public":
+        return {"url": file.location, "expires_at": None}
+    try:
+        url, expires_at = presign.presigned_get(storage_for(file.visibility), file.name)
+    except Exception as err:
+        logger.error("Error presigning download", error=err)
+        raise HttpError(500, "Fail to create download") from err
+    return {"url": url, "expires_at": expires_at}
+
+
+@files_router.get(
+    "/{id}/content",
+    response={200: None, 206: None, 416: None},
+    tags=["files"],
+    auth=JWTAuth(permissions=AuthenticatedOnly),
+    operation_id="getFileContent",
+)
+def get_file_content(request: HttpRequest, id: int):
+    """
+    The file's bytes, streamed through the API chunk by chunk, with support for single `Range`
+    requests. When `s3.accel_redirect_prefix` is configured, nginx is told to serve a presigned
+    URL instead and the API never touches the bytes.
+    """
+    file = _downloadable(request, id)
+    storage = storage_for(file.visibility)
+    disposition = content_disposition_header(False, file.name.rsplit("/", 1)[-1])
+
+    if download.ACCEL_REDIRECT_PREFIX:
+        try:
+            url, _ = presign.presigned_get(storage, file.name)
+        except (ClientError, BotoCoreError) as err:
+            logger.error("Error presigning file content", error=err)
+            raise HttpError(502, "Fail to read file") from err
+        response = HttpResponse(content_type=file.content_type)
+        response["X-Accel-Redirect"] = download.accel_redirect(url, download.ACCEL_REDIRECT_PREFIX)
+        response["Content-Disposition"] = disposition
+        return response
+
+    try:
+        obj = download.get_object(storage, file.name, request.headers.get("Range"))
+    except ClientError as err:
+        code = err.response.get("Error", {}).get("Code")
+        if code == "InvalidRange":
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{file.size}"
+            return response
+        if code in ("404", "NoSuchKey"):
+            raise HttpError(404, "File not found") from err
+        logger.error("Error reading file from S3", error=err)
+        raise HttpError(502, "Fail to read file") from err
+    except BotoCoreError as err:
+        logger.error("Error reading file from S3", error=err)
+        raise HttpError(502, "Fail to read file") from err
+
+    response = StreamingHttpResponse(
+        download.iter_body(obj["Body"]),
+        status=206 if obj.get("ContentRange") else 200,
+        content_type=obj.get("ContentType") or file.content_type,
+    )
+    response["Content-Length"] = obj["ContentLength"]
+    if obj.get("ContentRange"):
+        response["Content-Range"] = obj["ContentRange"]
+    response["Accept-Ranges"] = "bytes"
+    response["Content-Disposition"] = disposition
+    if obj.get("ETag"):
+        response["ETag"] = obj["ETag"]
+    if obj.get("LastModified"):
+        response["Last-Modified"] = http_date(obj["LastModified"].timestamp())
+    return response
+
+
 @files_router.post(
     "/",
     response={200: FileDetails},
@@ -220,17 +585,20 @@ def get_file(request: HttpRequest, id: int):
 )
 def create_file(request: HttpRequest, metadata: FileMetadata, upload: NinjaFile[UploadedFile]):
     """
-    Creates a file with or without post associations.
+    Creates a file with or without post associations. If a file with identical content and
+    visibility exists, it is associated with the posts and returned instead.
     """
     try:
-        if metadata.visibility == "public":
-            stored_name = PublicStorage().save(upload.name, upload.file)
-
-            url = PublicStorage().url(stored_name)
-        else:
-            stored_name = PrivateStorage().save(upload.name, upload.file)
+        # hashed by the upload handlers while the request streamed in
+        digest = getattr(upload, "sha256", None) or hashing.sha256_chunks(upload.chunks())
+        duplicate = uploads.reuse_duplicate(metadata.visibility, digest, metadata.posts)
+        if duplicate:
+            return duplicate
 
-            url = PrivateStorage().url(stored_name)
+        upload.seek(0)
+        storage = storage_for(metadata.visibility)
+        stored_name = storage.save(upload.name, upload.file)
+        url = storage.url(stored_name)
 
         upload = File.objects.create(
             location=url,
@@ -239,18 +607,16 @@ def create_file(request: HttpRequest, metadata: FileMetadata, upload: NinjaFile[
             charset=upload.charset,
             size=upload.size,
             visibility=metadata.visibility,
+            sha256=digest,
         )
 
         if metadata:
-            upload.posts.set(metadata.posts)
+            upload.posts.set(metadata.posts or [])
 
+        derivatives.schedule(upload)
         return upload
     except Exception as err:
-        import sys
-
-        print("Error creating file:", err, file=sys.stderr)
-        logger.error("Error creating file", error=err)
-
+        logger.exception("Error creating file")
         raise HttpError(500, "Fail to create file") from err
 
 
@@ -263,7 +629,8 @@ def create_file(request: HttpRequest, metadata: FileMetadata, upload: NinjaFile[
 )
 def update_file(request: HttpRequest, id: int, metadata: FileMutateMetadata):
     """
-    Updates a file, namely the posts associated with the file. File properties are immutable.
+    Updates a file, namely the posts associated with the file and its visibility. Changing
+    visibility moves the object within storage. Other file properties are immutable.
     """
     try:
         file = File.objects.get(id=id)
@@ -271,7 +638,8 @@ def update_file(request: HttpRequest, id: int, metadata: FileMutateMetadata):
         if metadata.posts:
             file.posts.set(metadata.posts)
 
-        # TODO: changing visibility here requires recreating the object and updating the DB
+        if metadata.visibility:
+            change_visibility([file], metadata.visibility)
     except Exception as err:
         logger.error("Error associating file", error=err)
 
@@ -293,6 +661,7 @@ def delete_file(request: HttpRequest, id: int):
     """
     try:
         file = File.objects.get(id=id)
+        derivatives.delete_derivatives([file])
         file.delete()
 
     except Exception as err:
@@ -310,10 +679,7 @@ def delete_file(request: HttpRequest, id: int):
     )
 
     try:
-        if file.visibility == "public":
-            PublicStorage().delete(file.name)
-        else:
-            PrivateStorage().delete(file.name)
+        storage_for(file.visibility).delete(file.name)
     except Exception as err:
         logger.error("Error deleting file from S3", error=err)
 
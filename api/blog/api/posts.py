@@ -1,23 +1,32 @@
+import json
 from typing import List, Optional
 
 import structlog
+from django.db.models import Count, Q
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django.utils.text import slugify
-from ninja import Router
+from ninja import Query, Router
 from ninja.errors import HttpError
 from ninja.pagination import paginate
+from ninja.responses import NinjaJSONEncoder
 
 from auth.middleware import JWTAuth, StaffOnly
-from blog.schema.file import FileDetails
+from blog import cache as post_cache
+from blog.api.files import file_details
+from blog.pagination import CursorPagination
+from blog.schema.file import FileDetails, FileFilters
 from blog.schema.post import (
     PostCreate,
     PostListPublic,
     PostPublic,
+    PostSearchResult,
     PostUpdate,
 )
 from blog.schema.sharecode import ShareCodeCreate, ShareCodeSchema
 from blog.schema.validation import ValidationErrorResponse
+from blog.search import matching_posts
 
 from ..models import Post, Series, ShareCode
 
@@ -26,6 +35,13 @@ logger = structlog.get_logger(__name__)
 posts_router = Router()
 
 
+def public_posts():
+    """Posts with everything PostPublic renders loaded up front, in a single query."""
+    return Post.objects.select_related("author", "series").annotate(
+        comment_count=Count("comments", filter=Q(comments__visible=True))
+    )
+
+
 # POST API ENDPOINTS (These are the ones we are keeping and have updated)
 @posts_router.post(
     "",
@@ -61,6 +77,26 @@ def create_post(request, payload: PostCreate):
     return 201, post
 
 
+# declared before the first "/{post_id}" route so the literal path wins
+@posts_router.get(
+    "/search",
+    response=List[PostSearchResult],
+    tags=["posts"],
+    auth=JWTAuth(permissions=None, allow_anonymous=True),
+    operation_id="searchPosts",
+)
+@paginate(CursorPagination)
+def search_posts(request, q: str):
+    """
+    Full-text search over published posts, best matches first.
+    `q` accepts web search syntax: quoted phrases, `or` and `-excluded` terms.
+    """
+    if not q.strip():
+        raise HttpError(400, "Search query must not be empty")
+    posts = public_posts().filter(published_at__isnull=False).defer("content")
+    return matching_posts(posts, q).order_by("-rank")
+
+
 @posts_router.put(
     "/{post_id}",
     response={200: PostPublic, 400: ValidationErrorResponse, 404: None},
@@ -100,8 +136,7 @@ def update_post(request, post_id: int, payload: PostUpdate):
     for attr, value in data.items():
         setattr(post, attr, value)
     post.save()
-    post.refresh_from_db()
-    return 200, post
+    return 200, public_posts().get(id=post.id)
 
 
 @posts_router.get(
@@ -113,10 +148,10 @@ def update_post(request, post_id: int, payload: PostUpdate):
 )
 def get_post_by_id(request, post_id: int):
     if request.user.is_authenticated and request.user.is_staff:
-        post = get_object_or_404(Post.objects.select_related("author", "series"), id=post_id)
+        post = get_object_or_404(public_posts(), id=post_id)
     else:
         post = get_object_or_404(
-            Post.objects.select_related("author", "series"),
+            public_posts(),
             id=post_id,
             published_at__isnull=False,
         )
@@ -134,19 +169,21 @@ def get_post_by_slug_and_year(
     request, year: int, slug: str, draft: bool = False, sharecode: str = None
 ):
     # 1. Always try to fetch the published post first (ignore sharecode if found)
+    cached = post_cache.get_post_detail(year, slug)
+    if cached is not None:
+        return HttpResponse(cached, content_type="application/json")
     try:
-        post = Post.objects.select_related("author", "series").get(
-            slug=slug, published_at__year=year, published_at__isnull=False
-        )
-        return post
+        post = public_posts().get(slug=slug, published_at__year=year, published_at__isnull=False)
     except Post.DoesNotExist:
         pass
+    else:
+        body = json.dumps(PostPublic.from_orm(post).model_dump(), cls=NinjaJSONEncoder)
+        post_cache.set_post_detail(year, slug, body.encode())
+        return HttpResponse(body, content_type="application/json")
     # 2. If not found, and sharecode is present, try to fetch the unpublished post and validate sharecode
     if sharecode:
         try:
-            post = Post.objects.select_related("author", "series").get(
-                slug=slug, published_at__isnull=True
-            )
+            post = public_posts().get(slug=slug, published_at__isnull=True)
             valid_code = ShareCode.objects.filter(post=post, code=sharecode).first()
             if not valid_code:
                 raise Post.DoesNotExist()
@@ -159,9 +196,9 @@ def get_post_by_slug_and_year(
     try:
         if request.user.is_authenticated and request.user.is_staff:
             if draft:
-                post = get_object_or_404(Post, slug=slug, published_at__isnull=True)
+                post = get_object_or_404(public_posts(), slug=slug, published_at__isnull=True)
             else:
-                post = get_object_or_404(Post, slug=slug, published_at__year=year)
+                post = get_object_or_404(public_posts(), slug=slug, published_at__year=year)
         else:
             raise Post.DoesNotExist()
     except Post.DoesNotExist as err:
@@ -176,7 +213,7 @@ def get_post_by_slug_and_year(
     auth=JWTAuth(permissions=None, allow_anonymous=True),
     operation_id="listPosts",
 )
-@paginate
+@paginate(CursorPagination)
 def list_posts(
     request,
     series_slug: Optional[str] = None,
@@ -189,7 +226,7 @@ def list_posts(
     List posts, optionally filtered by series, author, or draft status.
     The 'order' parameter controls the ordering of posts. Use '-published_at' (default for published), '-updated_at' (default for drafts).
     """
-    posts = Post.objects.select_related("author", "series").all()
+    posts = public_posts().defer("content")
     is_staff = request.user.is_authenticated and request.user.is_staff
 
     if not is_staff:
@@ -234,9 +271,9 @@ def list_posts(
     auth=JWTAuth(permissions=StaffOnly, allow_anonymous=True),
     operation_id="getPostFilesById",
 )
-def get_post_files_by_id(request, post_id: int):
+def get_post_files_by_id(request, post_id: int, filters: FileFilters = Query(...)):
     post = get_object_or_404(Post, id=post_id)
-    return post.files.all()
+    return filters.filter(file_details(post.files.all()))
 
 
 @posts_router.delete(
@@ -0,0 +1,95 @@
+import time
+from datetime import datetime
+from typing import Any, Callable, Iterable, Optional, Tuple
+
+from django.core.cache import cache
+
+# Published posts rarely change and every write path invalidates explicitly, so the timeout
+# only bounds staleness for caches that are not shared between workers.
+POST_DETAIL_CACHE_TIMEOUT = 60 * 15
+
+FEED_CACHE_TIMEOUT = 60 * 60
+FEED_GENERATION_KEY = "blog:feed:generation"
+# how long a rebuild may hold its lock, and how long other requests wait for it
+BUILD_LOCK_TIMEOUT = 30
+BUILD_WAIT = 5
+BUILD_POLL_INTERVAL = 0.05
+
+
+def post_detail_key(year: int, slug: str) -> str:
+    """Cache key for the serialized public body of a published post."""
+    return f"blog:post-detail:{year}:{slug}"
+
+
+def get_post_detail(year: int, slug: str) -> Optional[bytes]:
+    """Return the cached serialized post body, if any."""
+    return cache.get(post_detail_key(year, slug))
+
+
+def set_post_detail(year: int, slug: str, body: bytes) -> None:
+    """Store the serialized post body for a published post."""
+    cache.set(post_detail_key(year, slug), body, POST_DETAIL_CACHE_TIMEOUT)
+
+
+def invalidate_post_details(posts: Iterable[Tuple[str, Optional[datetime]]]) -> None:
+    """
+    Drop cached bodies for the given (slug, published_at) pairs. Drafts are never cached
+    so pairs without a publication date are ignored.
+    """
+    keys = [
+        post_detail_key(published_at.year, slug)
+        for slug, published_at in posts
+        if slug and published_at
+    ]
+    if keys:
+        cache.delete_many(keys)
+
+
+def feed_generation() -> int:
+    """Token identifying the current feed contents; part of every feed snapshot key."""
+    return cache.get_or_set(FEED_GENERATION_KEY, time.time_ns, None)
+
+
+def invalidate_feeds() -> None:
+    """Orphan every cached feed snapshot; they expire on their own."""
+    cache.set(FEED_GENERATION_KEY, time.time_ns(), None)
+
+
+def feed_key(name: str, *parts: Any) -> str:
+    return ":".join(["blog:feed", str(feed_generation()), name, *map(str, parts)])
+
+
+def feed_item_key(post_id: int, updated_at: datetime, content_hash: str) -> str:
+    """
+    Cache key for the rendered feed item of a post. Saves bump `updated_at` and re-renders
+    change `content_hash`, so a changed post misses the cache without explicit invalidation.
+    """
+    return f"blog:feed-item:{post_id}:{updated_at.timestamp()}:{content_hash}"
+
+
+def get_or_build(key: str, build: Callable[[], Tuple[Any, int]]) -> Any:
+    """
+    Return the cached value for `key`, building it on a miss. `build` returns the value and
+    its timeout. Only one caller rebuilds at a time; concurrent callers wait for its result
+    instead of stampeding the database, and build themselves only if it never arrives.
+    """
+    value = cache.get(key)
+    if value is not None:
+        return value
+
+    lock = f"{key}:lock"
+    if cache.add(lock, 1, BUILD_LOCK_TIMEOUT):
+        try:
+            value, timeout = build()
+            cache.set(key, value, timeout)
+        finally:
+            cache.delete(lock)
+        return value
+
+    deadline = time.monotonic() + BUILD_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(BUILD_POLL_INTERVAL)
+        value = cache.get(key)
+        if value is not None:
+            return value
+    return build()[0]
@@ -0,0 +1,62 @@
+from typing import Any, Dict, List
+
+from django.db.models import QuerySet
+
+from blog.models import Comment
+from blog.pagination import CursorPagination
+
+
+def build_comment_tree(comments: QuerySet) -> List[Comment]:
+    """
+    Load the visible comments of `comments` with their authors and post summaries in one
+    query, and link replies to their parents in memory as `thread_children`.
+
+    Replies to a hidden comment are hidden with it. Every visible comment is returned, not
+    only the roots, in the default comment ordering.
+    """
+    ordered = list(
+        comments.filter(visible=True)
+        .select_related("author", "post")
+        .defer("post__content", "post__content_html", "post__excerpt")
+        .order_by("created_at", "id")
+    )
+    nodes: Dict[int, Comment] = {comment.id: comment for comment in ordered}
+
+    thread: List[Comment] = []
+    for comment in ordered:
+        comment.thread_children = []
+        if comment.parent_id is None:
+            thread.append(comment)
+        elif comment.parent_id in nodes:
+            # replies are always created after their parent, which was therefore linked already
+            nodes[comment.parent_id].thread_children.append(comment)
+            thread.append(comment)
+        else:
+            # drop the node so its own replies are hidden as well
+            del nodes[comment.id]
+    return thread
+
+
+def attach_replies(roots: List[Comment]) -> None:
+    """
+    Link the visible reply trees below `roots` as `thread_children`, loading only the threads
+    of their posts, in one query.
+    """
+    post_ids = {root.post_id for root in roots}
+    if not post_ids:
+        return
+    nodes = {
+        node.id: node for node in build_comment_tree(Comment.objects.filter(post_id__in=post_ids))
+    }
+    for root in roots:
+        node = nodes.get(root.id)
+        root.thread_children = node.thread_children if node is not None else []
+
+
+class ThreadPagination(CursorPagination):
+    """Pages a queryset of root comments in SQL, then attaches the replies of that page only."""
+
+    def paginate_queryset(self, queryset, pagination: CursorPagination.Input, **params: Any):
+        page = super().paginate_queryset(queryset, pagination, **params)
+        attach_replies([item for item in page["items"] if not hasattr(item, "thread_children")])
+        return page
@@ -0,0 +1,82 @@
+from collections import defaultdict
+from typing import Dict, List, Sequence, Set, Tuple
+
+import structlog
+from django.db import transaction
+from django.db.models import Q
+
+from files.delete import delete_objects
+from files.storage import same_location, storage_for
+
+from .models import File, FileDerivative, StorageObject
+
+logger = structlog.get_logger(__name__)
+
+
+def delete_files(
+    ids: Sequence[int], orphans: Sequence[Tuple[str, str]] = ()
+) -> Tuple[List[int], int, List[Dict[str, str]]]:
+    """
+    Delete the files with `ids`, their derivatives, and the orphaned (visibility, name) objects
+    in `orphans`. The rows go in one transaction; the objects are then removed in DeleteObjects
+    batches. An object that fails to delete is reported and, its row being gone, shows up as
+    orphaned at the next reconciliation. Orphans some file still refers to are left alone.
+    Returns (deleted file ids, objects deleted, failures).
+    """
+    files = list(File.objects.filter(id__in=ids))
+    derivatives = list(FileDerivative.objects.filter(file__in=files).select_related("file"))
+    objects: Dict[str, Set[str]] = defaultdict(set)
+    for file in files:
+        objects[file.visibility].add(file.name)
+    for derivative in derivatives:
+        objects[derivative.file.visibility].add(derivative.name)
+
+    failures = []
+    names = {name for _, name in orphans}
+    referenced = set(File.objects.filter(name__in=names).values_list("name", flat=True))
+    referenced.update(FileDerivative.objects.filter(name__in=names).values_list("name", flat=True))
+    for visibility, name in orphans:
+        if name in referenced:
+            failures.append(
+                {
+                    "visibility": visibility,
+                    "name": name,
+                    "code": "Referenced",
+                    "message": "A file refers to this object",
+                }
+            )
+        else:
+            objects[visibility].add(name)
+
+    with transaction.atomic():
+        File.objects.filter(id__in=[file.id for file in files]).delete()
+
+    deleted = 0
+    for visibility, names in objects.items():
+        try:
+            refused = delete_objects(storage_for(visibility), sorted(names))
+        except Exception as err:
+            logger.error("Error deleting objects", error=err, visibility=visibility)
+            refused = [(name, "Error", str(err)) for name in names]
+        failures.extend(
+            {"visibility": visibility, "name": name, "code": code, "message": message}
+            for name, code, message in refused
+        )
+        deleted += len(names) - len(refused)
+
+    # drop what is gone from the inventory so the reports do not wait for the next pass
+    failed = {(failure["visibility"], failure["name"]) for failure in failures}
+    gone = Q()
+    for visibility, names in objects.items():
+        # a private storage sharing the public location is inventoried as public
+        if same_location(storage_for(visibility), storage_for("public")):
+            visibility_in_inventory = "public"
+        else:
+            visibility_in_inventory = visibility
+        removed = [name for name in names if (visibility, name) not in failed]
+        gone |= Q(visibility=visibility_in_inventory, name__in=removed)
+    if gone:
+        StorageObject.objects.filter(gone).delete()
+
+    logger.info("Deleted files", files=len(files), objects=deleted, failures=len(failures))
+    return [file.id for file in files], deleted, failures
@@ -0,0 +1,135 @@
+import multiprocessing
+import os
+import uuid
+from collections import defaultdict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Iterable, Optional
+
+import structlog
+from django.core.files.base import ContentFile
+from django.db import connection, transaction
+
+from files.delete import delete_objects
+from files.images import DERIVATIVE_FORMATS, SOURCE_CONTENT_TYPES, render_derivatives
+from files.presign import object_key
+from files.storage import storage_for
+
+from .models import File, FileDerivative
+
+logger = structlog.get_logger(__name__)
+
+# concurrent downloads and uploads; the rendering itself happens in processes
+TRANSFER_WORKERS = 8
+
+_render_pool: Optional[ProcessPoolExecutor] = None
+# one file at a time after uploads, so a burst of uploads cannot starve the web workers
+_background = ThreadPoolExecutor(max_workers=1, thread_name_prefix="derivatives")
+
+
+def render_pool() -> ProcessPoolExecutor:
+    """The process pool shared by background renders, started on first use."""
+    global _render_pool
+    if _render_pool is None:
+        # spawned rather than forked, the server process has threads of its own
+        _render_pool = ProcessPoolExecutor(
+            max_workers=max(1, (os.cpu_count() or 2) // 2),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _render_pool
+
+
+def _download(file: File) -> bytes:
+    storage = storage_for(file.visibility)
+    response = storage.connection.meta.client.get_object(
+        Bucket=storage.bucket_name, Key=object_key(storage, file.name)
+    )
+    return response["Body"].read()
+
+
+def _upload(args) -> FileDerivative:
+    file, run, width, height, name, data = args
+    storage = storage_for(file.visibility)
+    content = ContentFile(data)
+    content.content_type = DERIVATIVE_FORMATS[name]
+    root, _ = os.path.splitext(file.name)
+    stored_name = storage.save(f"{root}.{width}w.{run}.{name}", content)
+    return FileDerivative(
+        file=file,
+        name=stored_name,
+        location=storage.url(stored_name),
+        content_type=DERIVATIVE_FORMATS[name],
+        width=width,
+        height=height,
+        size=len(data),
+    )
+
+
+def generate_derivatives(files: Iterable[File], pool: Optional[Executor] = None) -> int:
+    """
+    Render and store the derivatives of the given image files, replacing any they have.
+    Downloads and uploads run in threads and rendering runs in `pool`, a process pool by
+    default. The previous derivatives keep being served until every new one is stored; if
+    any step fails they stay in place. Returns the number of derivatives created.
+    """
+    files = [file for file in files if file.content_type in SOURCE_CONTENT_TYPES]
+    if not files:
+        return 0
+
+    # names unique to this run, so it never writes over the derivatives being served
+    run = uuid.uuid4().hex[:8]
+    by_id = {file.id: file for file in files}
+    with ThreadPoolExecutor(max_workers=TRANSFER_WORKERS) as transfers:
+        sources = transfers.map(lambda file: (file.id, _download(file)), files)
+        rendered = (pool or render_pool()).map(render_derivatives, sources)
+        uploads = [
+            (by_id[file_id], run, width, height, name, data)
+            for file_id, derivatives in rendered
+            for width, height, name, data in derivatives
+        ]
+        futures = [transfers.submit(_upload, upload) for upload in uploads]
+        wait(futures)
+    created = [future.result() for future in futures if future.exception() is None]
+    errors = [future.exception() for future in futures if future.exception() is not None]
+    if errors:
+        # drop what this run stored; the previous derivatives stay in place
+        _delete_stored(created)
+        raise errors[0]
+
+    with transaction.atomic():
+        superseded = list(FileDerivative.objects.filter(file__in=files).select_related("file"))
+        FileDerivative.objects.filter(id__in=[derivative.id for derivative in superseded]).delete()
+        FileDerivative.objects.bulk_create(created)
+    _delete_stored(superseded)
+    return len(created)
+
+
+def delete_derivatives(files: Iterable[File]) -> None:
+    """Remove the stored derivatives of the given files along with their rows."""
+    derivatives = FileDerivative.objects.filter(file__in=files).select_related("file")
+    _delete_stored(derivatives)
+    derivatives.delete()
+
+
+def _delete_stored(derivatives: Iterable[FileDerivative]) -> None:
+    by_visibility = defaultdict(list)
+    for derivative in derivatives:
+        by_visibility[derivative.file.visibility].append(derivative.name)
+    for visibility, names in by_visibility.items():
+        for name, code, message in delete_objects(storage_for(visibility), names):
+            logger.error("Error deleting derivative", error=message, code=code, name=name)
+
+
+def schedule(file: File) -> None:
+    """Generate the file's derivatives in the background once the current transaction commits."""
+    if file.content_type in SOURCE_CONTENT_TYPES:
+        transaction.on_commit(lambda: _background.submit(_generate_in_background, file.id))
+
+
+def _generate_in_background(file_id: int) -> None:
+    try:
+        generate_derivatives(File.objects.filter(id=file_id))
+    except Exception as err:
+        logger.error("Error generating derivatives", error=err, file=file_id)
+    finally:
+        # the thread's own database connection
+        connection.close()
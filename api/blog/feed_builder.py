@@ -1,7 +1,12 @@
-from typing import List
+from typing import IO, List
+
+from django.utils.feedgenerator import rfc2822_date, rfc3339_date
+from django.utils.xmlutils import SimplerXMLGenerator
 
 from .schema.feed import FeedAuthorSchema, FeedItem, Hub, JSONFeed
 
+ATOM_NS = "http://www.w3.org/2005/Atom"
+
 
 class FeedBuilder:
     """Builder class to help construct JSONFeed objects in a fluent manner."""
@@ -75,3 +80,101 @@ class FeedBuilder:
     def build(self) -> JSONFeed:
         """Build and return the JSONFeed object."""
         return JSONFeed(**self._data)
+
+    def write_rss(self, outfile: IO, encoding: str = "utf-8") -> None:
+        """Write the feed as RSS 2.0 to `outfile`, element by element."""
+        data = self._data
+        handler = SimplerXMLGenerator(outfile, encoding, short_empty_elements=True)
+        handler.startDocument()
+        handler.startElement("rss", {"version": "2.0", "xmlns:atom": ATOM_NS})
+        handler.startElement("channel", {})
+        handler.addQuickElement("title", data["title"])
+        handler.addQuickElement("link", data.get("home_page_url", ""))
+        handler.addQuickElement("description", data.get("description", ""))
+        if data.get("language"):
+            handler.addQuickElement("language", data["language"])
+        for rel in ("self", "next"):
+            url = data.get("feed_url" if rel == "self" else "next_url")
+            if url:
+                handler.addQuickElement("atom:link", None, {"rel": rel, "href": url})
+        for item in data["items"]:
+            handler.startElement("item", {})
+            if item.title:
+                handler.addQuickElement("title", item.title)
+            if item.url:
+                handler.addQuickElement("link", item.url)
+            handler.addQuickElement(
+                "guid", item.url or item.id, {"isPermaLink": str(bool(item.url)).lower()}
+            )
+            if item.content_html or item.summary:
+                handler.addQuickElement("description", item.content_html or item.summary)
+            if item.date_published:
+                handler.addQuickElement("pubDate", rfc2822_date(item.date_published))
+            for tag in item.tags or []:
+                handler.addQuickElement("category", tag)
+            handler.endElement("item")
+        handler.endElement("channel")
+        handler.endElement("rss")
+        handler.endDocument()
+
+    def write_atom(self, outfile: IO, encoding: str = "utf-8") -> None:
+        """Write the feed as Atom 1.0 to `outfile`, element by element."""
+        data = self._data
+        handler = SimplerXMLGenerator(outfile, encoding, short_empty_elements=True)
+        handler.startDocument()
+        attrs = {"xmlns": ATOM_NS}
+        if data.get("language"):
+            attrs["xml:lang"] = data["language"]
+        handler.startElement("feed", attrs)
+        handler.addQuickElement("title", data["title"])
+        handler.addQuickElement("id", data.get("feed_url") or data.get("home_page_url", ""))
+        if data.get("home_page_url"):
+            handler.addQuickElement(
+                "link", None, {"rel": "alternate", "href": data["home_page_url"]}
+            )
+        for rel in ("self", "next"):
+            url = data.get("feed_url" if rel == "self" else "next_url")
+            if url:
+                handler.addQuickElement("link", None, {"rel": rel, "href": url})
+        updated = [item.date_modified or item.date_published for item in data["items"]]
+        updated = [date for date in updated if date]
+        if updated:
+            handler.addQuickElement("updated", rfc3339_date(max(updated)))
+        if data.get("description"):
+            handler.addQuickElement("subtitle", data["description"])
+        if data.get("icon"):
+            handler.addQuickElement("logo", data["icon"])
+        if data.get("favicon"):
+            handler.addQuickElement("icon", data["favicon"])
+        for author in data.get("authors") or []:
+            self._write_atom_author(handler, author)
+        for item in data["items"]:
+            handler.startElement("entry", {})
+            handler.addQuickElement("title", item.title or "")
+            handler.addQuickElement("id", item.url or item.id)
+            if item.url:
+                handler.addQuickElement("link", None, {"rel": "alternate", "href": item.url})
+            if item.date_published:
+                handler.addQuickElement("published", rfc3339_date(item.date_published))
+            if item.date_modified or item.date_published:
+                updated = item.date_modified or item.date_published
+                handler.addQuickElement("updated", rfc3339_date(updated))
+            for author in item.authors or []:
+                self._write_atom_author(handler, author)
+            if item.summary:
+                handler.addQuickElement("summary", item.summary)
+            if item.content_html:
+                handler.addQuickElement("content", item.content_html, {"type": "html"})
+            for tag in item.tags or []:
+                handler.addQuickElement("category", None, {"term": tag})
+            handler.endElement("entry")
+        handler.endElement("feed")
+        handler.endDocument()
+
+    @staticmethod
+    def _write_atom_author(handler: SimplerXMLGenerator, author: FeedAuthorSchema) -> None:
+        handler.startElement("author", {})
+        handler.addQuickElement("name", author.name or "")
+        if author.url:
+            handler.addQuickElement("uri", author.url)
+        handler.endElement("author")
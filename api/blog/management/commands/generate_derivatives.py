@@ -0,0 +1,51 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from blog.derivatives import generate_derivatives
+from blog.models import File
+from files.images import SOURCE_CONTENT_TYPES
+
+
+class Command(BaseCommand):
+    help = "Generate resized WebP and AVIF derivatives for images that have none."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Number of rendering processes (default: CPU count)",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=20, help="Images held in memory at a time"
+        )
+        parser.add_argument(
+            "--force", action="store_true", help="Regenerate derivatives that already exist"
+        )
+
+    def handle(self, *args, workers, batch_size, force, **options):
+        files = File.objects.filter(content_type__in=SOURCE_CONTENT_TYPES).order_by("id")
+        if not force:
+            files = files.filter(derivatives__isnull=True)
+        files = list(files.distinct())
+        if not files:
+            self.stdout.write("All images have derivatives.")
+            return
+
+        created = 0
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            for start in range(0, len(files), batch_size):
+                batch = files[start : start + batch_size]
+                try:
+                    created += generate_derivatives(batch, pool=pool)
+                except Exception as err:
+                    self.stderr.write(
+                        f"Could not process files {batch[0].id}-{batch[-1].id}: {err}"
+                    )
+        self.stdout.write(
+            self.style.SUCCESS(f"Created {created} derivative(s) for {len(files)} image(s).")
+        )
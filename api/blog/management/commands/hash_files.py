@@ -0,0 +1,52 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db.models import Count
+
+from blog.models import File
+from files.hashing import sha256_object
+from files.storage import storage_for
+
+
+class Command(BaseCommand):
+    help = "Compute the SHA-256 of stored files that have none, streaming objects concurrently."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers", type=int, default=8, help="Objects downloaded and hashed concurrently"
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=200, help="Files written per UPDATE batch"
+        )
+
+    def handle(self, *args, workers, batch_size, **options):
+        pending = list(File.objects.filter(sha256="").only("id", "name", "visibility"))
+        if not pending:
+            self.stdout.write("All files are hashed.")
+            return
+
+        storages = {visibility: storage_for(visibility) for visibility in ("public", "private")}
+
+        def hash_file(file):
+            try:
+                file.sha256 = sha256_object(storages[file.visibility], file.name)
+            except Exception as err:
+                self.stderr.write(f"Could not hash {file.name}: {err}")
+            return file
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            hashed = [file for file in pool.map(hash_file, pending) if file.sha256]
+
+        File.objects.bulk_update(hashed, ["sha256"], batch_size=batch_size)
+        duplicates = (
+            File.objects.exclude(sha256="")
+            .values("visibility", "sha256")
+            .annotate(copies=Count("id"))
+            .filter(copies__gt=1)
+            .count()
+        )
+        self.stdout.write(self.style.SUCCESS(f"Hashed {len(hashed)} of {len(pending)} file(s)."))
+        if duplicates:
+            self.stdout.write(
+                f"{duplicates} set(s) of files share content; new uploads reuse the oldest copy."
+            )
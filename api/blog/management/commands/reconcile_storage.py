@@ -0,0 +1,70 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from blog.reconcile import missing_files, orphaned_objects, reconcile, snapshot
+from blog.uploads import collect_abandoned_uploads
+from files.scan import HEAD_WORKERS, LIST_PAGE_SIZE
+
+
+class Command(BaseCommand):
+    help = (
+        "Update the storage inventory incrementally and report objects without File rows and "
+        "File rows without objects. Abandoned resumable uploads are aborted on every run."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--max-pages",
+            type=int,
+            default=None,
+            help="Listing pages per storage per run; the next run resumes from the checkpoint",
+        )
+        parser.add_argument(
+            "--page-size", type=int, default=LIST_PAGE_SIZE, help="Keys per listing request"
+        )
+        parser.add_argument(
+            "--workers", type=int, default=HEAD_WORKERS, help="Concurrent HEAD requests"
+        )
+        parser.add_argument(
+            "--no-head",
+            dest="head",
+            action="store_false",
+            help="Guess content types from names instead of fetching them",
+        )
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=None,
+            help="Keep running as a worker, starting a run every INTERVAL seconds",
+        )
+
+    def handle(self, *args, max_pages, page_size, workers, head, interval, **options):
+        while True:
+            started = time.monotonic()
+            complete = reconcile(
+                max_pages=max_pages, page_size=page_size, head=head, workers=workers
+            )
+            self.report(complete)
+            aborted = collect_abandoned_uploads()
+            if aborted:
+                self.stdout.write(f"Aborted {aborted} abandoned upload(s).")
+            if interval is None:
+                return
+            time.sleep(max(0, interval - (time.monotonic() - started)))
+
+    def report(self, complete):
+        scan = snapshot()
+        if not complete:
+            self.stdout.write("Inventory pass in progress; it resumes on the next run.")
+        if scan is None:
+            return
+        orphaned = orphaned_objects().count()
+        missing = missing_files(scan).count()
+        style = self.style.SUCCESS if not (orphaned or missing) else self.style.WARNING
+        self.stdout.write(
+            style(
+                f"Snapshot of {scan.snapshot_at:%Y-%m-%d %H:%M:%S}: {orphaned} orphaned object(s), "
+                f"{missing} file(s) missing from storage."
+            )
+        )
@@ -0,0 +1,52 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from blog import cache as post_cache
+from blog.models import Post
+from blog.rendering import content_hash, render_keyed
+
+
+class Command(BaseCommand):
+    help = "Render post Markdown to HTML in bulk, skipping posts whose content is unchanged."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Number of rendering processes (default: CPU count)",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=200, help="Posts written per UPDATE batch"
+        )
+        parser.add_argument(
+            "--force", action="store_true", help="Re-render even if the content hash matches"
+        )
+
+    def handle(self, *args, workers, batch_size, force, **options):
+        pending = [
+            (post_id, content)
+            for post_id, content, digest in Post.objects.values_list(
+                "id", "content", "content_hash"
+            ).iterator()
+            if force or digest != content_hash(content)
+        ]
+        if not pending:
+            self.stdout.write("All posts are up to date.")
+            return
+
+        rendered = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for post_id, html, digest in pool.map(render_keyed, pending, chunksize=16):
+                rendered.append(Post(id=post_id, content_html=html, content_hash=digest))
+
+        Post.objects.bulk_update(rendered, ["content_html", "content_hash"], batch_size=batch_size)
+        post_cache.invalidate_post_details(
+            Post.objects.filter(id__in=[post.id for post in rendered]).values_list(
+                "slug", "published_at"
+            )
+        )
+        post_cache.invalidate_feeds()
+        self.stdout.write(self.style.SUCCESS(f"Rendered {len(rendered)} post(s)."))
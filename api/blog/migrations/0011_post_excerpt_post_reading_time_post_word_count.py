@@ -0,0 +1,71 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:00
+
+import math
+import re
+
+from django.db import migrations, models
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+
+# A frozen copy of blog.summary as of this migration, so later changes to it do not change
+# what this migration computes.
+EXCERPT_LENGTH = 300
+WORDS_PER_MINUTE = 200
+
+FENCED_CODE = re.compile(r'^(```|~~~).*?^\1', re.MULTILINE | re.DOTALL)
+IMAGE = re.compile(r'!\[([^\]]*)\]\([^)]*\)')
+LINK = re.compile(r'\[([^\]]*)\]\([^)]*\)')
+INLINE_CODE = re.compile(r'`([^`]*)`')
+LINE_MARKUP = re.compile(r'^\s{0,3}(#{1,6}\s+|>\s?|[-*+]\s+|\d+\.\s+)', re.MULTILINE)
+EMPHASIS = re.compile(r'(\*\*|__|\*|_|~~)(\S.*?\S|\S)\1')
+WHITESPACE = re.compile(r'\s+')
+
+
+def summarize(markdown):
+    text = FENCED_CODE.sub(' ', markdown or '')
+    text = IMAGE.sub(r'\1', text)
+    text = LINK.sub(r'\1', text)
+    text = INLINE_CODE.sub(r'\1', text)
+    text = LINE_MARKUP.sub('', text)
+    text = EMPHASIS.sub(r'\2', text)
+    text = WHITESPACE.sub(' ', strip_tags(text)).strip()
+    word_count = len(text.split())
+    return (
+        Truncator(text).chars(EXCERPT_LENGTH),
+        word_count,
+        math.ceil(word_count / WORDS_PER_MINUTE),
+    )
+
+
+def backfill_summaries(apps, schema_editor):
+    Post = apps.get_model('blog', 'Post')
+    posts = list(Post.objects.only('id', 'content'))
+    for post in posts:
+        post.excerpt, post.word_count, post.reading_time = summarize(post.content)
+    Post.objects.bulk_update(posts, ['excerpt', 'word_count', 'reading_time'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0010_comment_blog_commen_created_88b29f_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='excerpt',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='reading_time',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_summaries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:03
+
+import hashlib
+
+import markdown
+from django.db import migrations, models
+
+# A frozen copy of the blog.rendering settings as of this migration, so later changes to them do
+# not change what this migration renders. `render_posts --force` re-renders with the current ones.
+MARKDOWN_EXTENSIONS = ['extra', 'sane_lists', 'codehilite', 'toc']
+MARKDOWN_EXTENSION_CONFIGS = {
+    'codehilite': {'css_class': 'highlight', 'guess_lang': False},
+    'toc': {'permalink': '#', 'permalink_class': 'heading-anchor'},
+}
+
+
+def backfill_content_html(apps, schema_editor):
+    Post = apps.get_model('blog', 'Post')
+    posts = list(Post.objects.only('id', 'content'))
+    for post in posts:
+        post.content_html = markdown.markdown(
+            post.content,
+            extensions=MARKDOWN_EXTENSIONS,
+            extension_configs=MARKDOWN_EXTENSION_CONFIGS,
+            output_format='html',
+        )
+        post.content_hash = hashlib.sha256(post.content.encode()).hexdigest()
+    Post.objects.bulk_update(posts, ['content_html', 'content_hash'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0011_post_excerpt_post_reading_time_post_word_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='content_hash',
+            field=models.CharField(blank=True, default='', editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='content_html',
+            field=models.TextField(blank=True, default='', editable=False),
+        ),
+        migrations.RunPython(backfill_content_html, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0013_post_search_vector_post_blog_post_search__528e75_gin'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='file',
+            name='name',
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+    ]
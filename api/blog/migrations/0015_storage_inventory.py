@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0014_file_name_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StorageScan',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('visibility', models.CharField(choices=[('public', 'public'), ('private', 'private')], unique=True)),
+                ('start_after', models.CharField(blank=True, max_length=1024)),
+                ('started_at', models.DateTimeField(null=True)),
+                ('snapshot_at', models.DateTimeField(null=True)),
+                ('completed_at', models.DateTimeField(null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='StorageObject',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('visibility', models.CharField(choices=[('public', 'public'), ('private', 'private')])),
+                ('name', models.CharField(db_index=True, max_length=1024)),
+                ('size', models.BigIntegerField()),
+                ('etag', models.CharField(blank=True, max_length=255)),
+                ('content_type', models.CharField(blank=True)),
+                ('last_modified', models.DateTimeField(null=True)),
+                ('seen_at', models.DateTimeField()),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('visibility', 'name'), name='blog_storageobject_visibility_name')],
+            },
+        ),
+    ]
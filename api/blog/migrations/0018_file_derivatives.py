@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0017_file_sha256'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FileDerivative',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('location', models.CharField()),
+                ('content_type', models.CharField()),
+                ('width', models.PositiveIntegerField()),
+                ('height', models.PositiveIntegerField()),
+                ('size', models.IntegerField()),
+                ('file', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='derivatives', to='blog.file')),
+            ],
+            options={
+                'ordering': ['content_type', 'width'],
+                'constraints': [models.UniqueConstraint(fields=('file', 'content_type', 'width'), name='blog_filederivative_variant')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 08:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0020_file_size_bigint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='uploadsession',
+            name='state',
+            field=models.CharField(choices=[('open', 'open'), ('completing', 'completing'), ('assembled', 'assembled')], default='open'),
+        ),
+    ]
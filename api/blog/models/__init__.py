@@ -1,7 +1,10 @@
 # blog.models package
 # Import all models here for compatibility
 from .comment import Comment
+from .derivative import FileDerivative
 from .file import File
+from .inventory import StorageObject, StorageScan
 from .post import Post
 from .series import Series
 from .sharecode import ShareCode
+from .upload import UploadPart, UploadSession
@@ -19,6 +19,7 @@ class Comment(models.Model):
 
     class Meta:
         ordering = ["created_at"]
+        indexes = [models.Index(fields=["created_at", "id"])]
 
     def __str__(self):
         return f"Comment by {self.author} on {self.post}"
@@ -0,0 +1,24 @@
+from django.db import models
+
+
+class FileDerivative(models.Model):
+    """A resized, re-encoded copy of an image `File`, stored next to the original."""
+
+    file = models.ForeignKey("File", on_delete=models.CASCADE, related_name="derivatives")
+    name = models.CharField(max_length=255)
+    location = models.CharField()
+    content_type = models.CharField()
+    width = models.PositiveIntegerField()
+    height = models.PositiveIntegerField()
+    size = models.IntegerField()  # bytes
+
+    class Meta:
+        ordering = ["content_type", "width"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["file", "content_type", "width"], name="blog_filederivative_variant"
+            )
+        ]
+
+    def __str__(self):
+        return self.name
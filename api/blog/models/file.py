@@ -7,15 +7,23 @@ class File(models.Model):
     """
 
     posts = models.ManyToManyField("Post", related_name="files")
-    name = models.CharField(max_length=255)
+    name = models.CharField(max_length=255, db_index=True)
     content_type = models.CharField()
     charset = models.CharField(blank=True, null=True)
     visibility = models.CharField(
         choices=[("public", "public"), ("private", "private")], default="public"
     )
-    size = models.IntegerField()  # bytes
+    size = models.BigIntegerField()  # bytes
     location = models.CharField()
     created_at = models.DateTimeField(auto_now_add=True)
+    # hex SHA-256 of the content; uploads of identical content reuse the file
+    sha256 = models.CharField(max_length=64, blank=True, default="")
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["visibility", "sha256"]),
+            models.Index(fields=["visibility", "created_at"]),
+        ]
 
     def __str__(self):
         return self.name
@@ -0,0 +1,43 @@
+from django.db import models
+
+VISIBILITY_CHOICES = [("public", "public"), ("private", "private")]
+
+
+class StorageObject(models.Model):
+    """
+    Last known state of an object in storage, maintained by the `reconcile_storage` command so
+    drift between the buckets and `File` rows can be read without listing the buckets.
+    """
+
+    visibility = models.CharField(choices=VISIBILITY_CHOICES)
+    name = models.CharField(max_length=1024, db_index=True)  # relative to the storage location
+    size = models.BigIntegerField()  # bytes
+    etag = models.CharField(max_length=255, blank=True)
+    content_type = models.CharField(blank=True)
+    last_modified = models.DateTimeField(null=True)
+    seen_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["visibility", "name"], name="blog_storageobject_visibility_name"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.visibility}:{self.name}"
+
+
+class StorageScan(models.Model):
+    """Checkpoint of the incremental inventory pass over one storage backend."""
+
+    visibility = models.CharField(choices=VISIBILITY_CHOICES, unique=True)
+    # last key of the last page stored in the current pass; empty between passes
+    start_after = models.CharField(max_length=1024, blank=True)
+    started_at = models.DateTimeField(null=True)
+    # the start and end of the last complete pass, i.e. the inventory snapshot
+    snapshot_at = models.DateTimeField(null=True)
+    completed_at = models.DateTimeField(null=True)
+
+    def __str__(self):
+        return f"StorageScan({self.visibility})"
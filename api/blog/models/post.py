@@ -1,8 +1,15 @@
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from django.urls import reverse
 from django.utils.text import slugify
 
+from blog import cache as post_cache
+from blog.rendering import content_hash, render_markdown
+from blog.search import post_search_vector
+from blog.summary import summarize
+
 User = get_user_model()
 
 
@@ -11,6 +18,15 @@ class Post(models.Model):
     slug = models.SlugField(max_length=200, unique_for_date="published_at", blank=True)
     author = models.ForeignKey(User, on_delete=models.CASCADE, related_name="blog_posts")
     content = models.TextField()
+    # derived from content on save so listings never need to load the full body
+    excerpt = models.TextField(blank=True, default="", editable=False)
+    word_count = models.PositiveIntegerField(default=0, editable=False)
+    reading_time = models.PositiveIntegerField(default=0, editable=False)  # minutes
+    # rendered once per distinct content; see the render_posts management command
+    content_html = models.TextField(blank=True, default="", editable=False)
+    content_hash = models.CharField(max_length=64, blank=True, default="", editable=False)
+    # weighted title/content document for full-text search, refreshed on save
+    search_vector = SearchVectorField(null=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     published_at = models.DateTimeField(null=True, blank=True, db_index=True)
@@ -18,15 +34,42 @@ class Post(models.Model):
         "Series", on_delete=models.SET_NULL, null=True, blank=True, related_name="posts"
     )
 
+    class Meta:
+        indexes = [GinIndex(fields=["search_vector"])]
+
     def __str__(self):
         return self.title
 
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title)
+        self.excerpt, self.word_count, self.reading_time = summarize(self.content)
+        self.render_content()
         # Ensure slug is unique for the publication date if published_at is set
         # This logic might be more complex depending on how you handle drafts vs published slugs
+        stale = [(self.slug, self.published_at)]
+        if self.pk:
+            # a slug or publication date change moves the cache key, so drop the old one too
+            stale += Post.objects.filter(pk=self.pk).values_list("slug", "published_at")
         super().save(*args, **kwargs)
+        # the vector is computed by Postgres from the row that was just written
+        Post.objects.filter(pk=self.pk).update(search_vector=post_search_vector())
+        post_cache.invalidate_post_details(stale)
+        post_cache.invalidate_feeds()
+
+    def render_content(self, force: bool = False) -> bool:
+        """Render content to HTML unless it is unchanged since the last render."""
+        digest = content_hash(self.content)
+        if digest == self.content_hash and not force:
+            return False
+        self.content_html = render_markdown(self.content)
+        self.content_hash = digest
+        return True
+
+    def delete(self, *args, **kwargs):
+        post_cache.invalidate_post_details([(self.slug, self.published_at)])
+        post_cache.invalidate_feeds()
+        return super().delete(*args, **kwargs)
 
     def get_absolute_url(self):
         if self.published_at:
@@ -0,0 +1,57 @@
+import uuid
+
+from django.conf import settings
+from django.db import models
+
+from .inventory import VISIBILITY_CHOICES
+
+# "completing" while storage assembles the parts, "assembled" once it has
+UPLOAD_STATE_CHOICES = [
+    ("open", "open"),
+    ("completing", "completing"),
+    ("assembled", "assembled"),
+]
+
+
+class UploadSession(models.Model):
+    """
+    A resumable upload, backed by an S3 multipart upload. Parts can be appended in any order
+    and concurrently; completing assembles them into the object and creates the `File` row.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="upload_sessions"
+    )
+    name = models.CharField(max_length=255)
+    content_type = models.CharField()
+    visibility = models.CharField(choices=VISIBILITY_CHOICES, default="public")
+    size = models.BigIntegerField(null=True, blank=True)  # declared total, if known
+    post_ids = models.JSONField(default=list, blank=True)
+    upload_id = models.CharField(max_length=1024)
+    state = models.CharField(choices=UPLOAD_STATE_CHOICES, default="open")
+    file = models.OneToOneField(
+        "File", null=True, blank=True, on_delete=models.SET_NULL, related_name="upload_session"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    # bumped by every appended part; sessions idle for too long are garbage collected
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+    def __str__(self):
+        return f"UploadSession({self.name})"
+
+
+class UploadPart(models.Model):
+    session = models.ForeignKey(UploadSession, on_delete=models.CASCADE, related_name="parts")
+    number = models.PositiveIntegerField()
+    size = models.BigIntegerField()
+    etag = models.CharField(max_length=255)
+
+    class Meta:
+        ordering = ["number"]
+        constraints = [
+            models.UniqueConstraint(fields=["session", "number"], name="blog_uploadpart_number")
+        ]
+
+    def __str__(self):
+        return f"UploadPart({self.session_id}, {self.number})"
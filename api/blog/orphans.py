@@ -0,0 +1,67 @@
+from typing import Iterator, Set, Tuple
+
+import structlog
+from storages.backends.s3boto3 import S3Boto3Storage
+
+from files.scan import (
+    HEAD_WORKERS,
+    LIST_PAGE_SIZE,
+    StoredObject,
+    iter_object_pages,
+    with_content_types,
+)
+from files.storage import same_location, storage_for
+
+from .models import File, FileDerivative
+
+logger = structlog.get_logger(__name__)
+
+
+def _unknown(
+    storage: S3Boto3Storage,
+    head: bool,
+    workers: int,
+    page_size: int,
+    skip: Set[str],
+    seen: Set[str],
+) -> Iterator[StoredObject]:
+    """
+    Objects in `storage` without a `File` or `FileDerivative` row, checked against the database
+    a page at a time.
+    """
+    for page in iter_object_pages(storage, page_size):
+        names = [obj.name for obj in page]
+        seen.update(names)
+        known = set(
+            File.objects.filter(name__in=names)
+            .values_list("name", flat=True)
+            .union(FileDerivative.objects.filter(name__in=names).values_list("name", flat=True))
+        )
+        orphans = (obj for obj in page if obj.name not in known and obj.name not in skip)
+        yield from with_content_types(storage, orphans, head=head, workers=workers)
+
+
+def iter_orphaned_files(
+    head: bool = True, workers: int = HEAD_WORKERS, page_size: int = LIST_PAGE_SIZE
+) -> Iterator[Tuple[str, StoredObject, str]]:
+    """
+    Yield (visibility, object, url) for every object in storage that has no `File` row, nor is
+    a derivative of one, as the buckets are listed. An object present in both public and
+    private storage counts as public.
+    """
+    public_storage = storage_for("public")
+    private_storage = storage_for("private")
+
+    public_names: Set[str] = set()
+    count = 0
+    for obj in _unknown(public_storage, head, workers, page_size, set(), public_names):
+        count += 1
+        yield "public", obj, public_storage.url(obj.name)
+
+    # both backends usually share a bucket and prefix, in which case everything is public
+    if not same_location(public_storage, private_storage):
+        for obj in _unknown(private_storage, head, workers, page_size, public_names, set()):
+            count += 1
+            yield "private", obj, private_storage.url(obj.name)
+
+    logger.info("Scanned storage for orphaned files", orphans=count)
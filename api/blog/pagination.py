@@ -0,0 +1,179 @@
+import base64
+import binascii
+import json
+from datetime import date, time
+from math import inf
+from typing import Any, List, Optional, Tuple
+
+from django.core.exceptions import FieldDoesNotExist
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q, QuerySet
+from ninja import Field, Schema
+from ninja.conf import settings
+from ninja.errors import HttpError
+from ninja.pagination import PaginationBase
+
+
+class CursorPagination(PaginationBase):
+    """
+    Limit/offset pagination with an opt-in keyset (cursor) mode.
+
+    Every page carries a `next_cursor` encoding the sort key of its last item, with the primary
+    key as tie-breaker. Passing it back as `cursor` selects the following page with a `WHERE` on
+    that key instead of an `OFFSET`, so the cost of a page does not grow with its depth.
+    `with_count=false` skips the `COUNT(*)` query entirely.
+
+    Views may also return an already evaluated list of model instances (e.g. an assembled
+    comment thread); it must be in the model's default ordering and is paged in memory.
+    """
+
+    class Input(Schema):
+        limit: int = Field(
+            settings.PAGINATION_PER_PAGE,
+            ge=1,
+            le=settings.PAGINATION_MAX_LIMIT if settings.PAGINATION_MAX_LIMIT != inf else None,
+        )
+        offset: int = Field(0, ge=0, description="Ignored when a cursor is given.")
+        cursor: Optional[str] = Field(None, description="`next_cursor` of the previous page.")
+        with_count: bool = Field(True, description="Set to false to skip counting all items.")
+
+    class Output(Schema):
+        items: List[Any]
+        count: Optional[int] = None
+        next_cursor: Optional[str] = None
+
+    def paginate_queryset(self, queryset: QuerySet, pagination: Input, **params: Any) -> Any:
+        limit = min(pagination.limit, settings.PAGINATION_MAX_LIMIT)
+        count = self._items_count(queryset) if pagination.with_count else None
+
+        if isinstance(queryset, QuerySet):
+            ordering = _keyset_ordering(queryset)
+            queryset = queryset.order_by(*ordering)
+            if pagination.cursor:
+                values = _decode_cursor(queryset.model, ordering, pagination.cursor)
+                rows = list(queryset.filter(_after(ordering, values))[: limit + 1])
+            else:
+                rows = list(queryset[pagination.offset : pagination.offset + limit + 1])
+        else:
+            items = list(queryset)
+            model = type(items[0]) if items else None
+            ordering = _keyset_ordering(model._default_manager.all()) if model else []
+            if pagination.cursor and model:
+                values = _decode_cursor(model, ordering, pagination.cursor)
+                items = [item for item in items if _is_after(item, ordering, values)]
+            elif not pagination.cursor:
+                items = items[pagination.offset :]
+            rows = items[: limit + 1]
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = _encode_cursor(ordering, rows[-1])
+
+        return {"items": rows, "count": count, "next_cursor": next_cursor}
+
+
+def _keyset_ordering(queryset: QuerySet) -> List[str]:
+    """The queryset's ordering as field names, made total by appending the primary key."""
+    ordering = list(queryset.query.order_by or queryset.model._meta.ordering)
+    if any(not isinstance(field, str) for field in ordering):
+        raise TypeError("Cursor pagination only supports ordering by field names")
+    names = [field.lstrip("-") for field in ordering]
+    if "pk" not in names and queryset.model._meta.pk.name not in names:
+        descending = bool(ordering) and ordering[-1].startswith("-")
+        ordering.append("-pk" if descending else "pk")
+    return ordering
+
+
+def _split(field: str) -> Tuple[str, bool]:
+    return field.lstrip("-"), field.startswith("-")
+
+
+def _item_values(ordering: List[str], item: Any) -> List[Any]:
+    values = []
+    for field in ordering:
+        value = item
+        for part in _split(field)[0].split("__"):
+            value = getattr(value, part)
+        values.append(value)
+    return values
+
+
+def _encode_cursor(ordering: List[str], item: Any) -> str:
+    values = _item_values(ordering, item)
+    # isoformat keeps full microsecond precision; DjangoJSONEncoder would truncate it
+    payload = json.dumps({"o": ordering, "v": values}, default=_json_default)
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    return str(value)
+
+
+def _decode_cursor(model, ordering: List[str], cursor: str) -> List[Any]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if payload["o"] != ordering or len(payload["v"]) != len(ordering):
+            raise ValueError("cursor was issued for a different ordering")
+        values = []
+        for field, raw in zip(ordering, payload["v"], strict=True):
+            model_field = _model_field(model, _split(field)[0])
+            # annotations (e.g. a search rank) have no model field and round-trip as JSON
+            values.append(raw if raw is None or model_field is None else model_field.to_python(raw))
+        return values
+    except (ValueError, KeyError, TypeError, binascii.Error, DjangoValidationError) as err:
+        raise HttpError(400, "Invalid cursor") from err
+
+
+def _model_field(model, name: str):
+    opts = model._meta
+    *path, last = name.split("__")
+    for part in path:
+        opts = opts.get_field(part).related_model._meta
+    if last == "pk":
+        return opts.pk
+    try:
+        return opts.get_field(last)
+    except FieldDoesNotExist:
+        return None
+
+
+def _after(ordering: List[str], values: List[Any]) -> Q:
+    """
+    Rows strictly after `values` in `ordering`, as a lexicographic comparison. NULLs follow
+    Postgres semantics: they sort last ascending and first descending.
+    """
+    result = Q(pk__in=[])
+    equal = Q()
+    for field, value in zip(ordering, values, strict=True):
+        name, descending = _split(field)
+        if value is None:
+            greater = Q(**{f"{name}__isnull": False}) if descending else None
+            same = Q(**{f"{name}__isnull": True})
+        elif descending:
+            greater = Q(**{f"{name}__lt": value})
+            same = Q(**{name: value})
+        else:
+            greater = Q(**{f"{name}__gt": value}) | Q(**{f"{name}__isnull": True})
+            same = Q(**{name: value})
+        if greater is not None:
+            result |= equal & greater
+        equal &= same
+    return result
+
+
+def _is_after(item: Any, ordering: List[str], values: List[Any]) -> bool:
+    """In-memory counterpart of `_after` for lists that are already ordered."""
+    for field, cursor_value, value in zip(
+        ordering, values, _item_values(ordering, item), strict=True
+    ):
+        if value == cursor_value:
+            continue
+        descending = _split(field)[1]
+        if value is None or cursor_value is None:
+            # NULLs sort last ascending and first descending
+            return (value is None) != descending
+        return value < cursor_value if descending else value > cursor_value
+    return False
@@ -0,0 +1,141 @@
+from typing import List, Optional, Tuple
+
+import structlog
+from django.db.models import QuerySet
+from django.utils import timezone
+from storages.backends.s3boto3 import S3Boto3Storage
+
+from files.scan import HEAD_WORKERS, LIST_PAGE_SIZE, iter_object_pages, with_content_types
+from files.storage import same_location, storage_for
+
+from .models import File, FileDerivative, StorageObject, StorageScan
+
+logger = structlog.get_logger(__name__)
+
+
+def storages() -> List[Tuple[str, S3Boto3Storage]]:
+    """Storage backends to inventory; a private storage sharing the public location is skipped."""
+    public_storage, private_storage = storage_for("public"), storage_for("private")
+    if same_location(public_storage, private_storage):
+        return [("public", public_storage)]
+    return [("public", public_storage), ("private", private_storage)]
+
+
+def scan_storage(
+    visibility: str,
+    storage: S3Boto3Storage,
+    max_pages: Optional[int] = None,
+    page_size: int = LIST_PAGE_SIZE,
+    head: bool = True,
+    workers: int = HEAD_WORKERS,
+) -> bool:
+    """
+    Advance the inventory pass over `storage` by up to `max_pages` listing pages, resuming from
+    the stored checkpoint. Only new or changed objects (by ETag) are fetched with HEAD. Returns
+    whether the pass completed, in which case objects it did not see are dropped and the
+    inventory becomes the new snapshot.
+    """
+    scan, _ = StorageScan.objects.get_or_create(visibility=visibility)
+    if not scan.start_after or scan.started_at is None:
+        scan.start_after = ""
+        scan.started_at = timezone.now()
+        scan.save(update_fields=["start_after", "started_at"])
+
+    pages = 0
+    for page in iter_object_pages(storage, page_size, start_after=scan.start_after):
+        now = timezone.now()
+        known = dict(
+            StorageObject.objects.filter(
+                visibility=visibility, name__in=[obj.name for obj in page]
+            ).values_list("name", "etag")
+        )
+        changed = [obj for obj in page if known.get(obj.name) != obj.etag or not obj.etag]
+        changed_names = {obj.name for obj in changed}
+        StorageObject.objects.bulk_create(
+            [
+                StorageObject(
+                    visibility=visibility,
+                    name=obj.name,
+                    size=obj.size,
+                    etag=obj.etag,
+                    content_type=obj.content_type,
+                    last_modified=obj.last_modified,
+                    seen_at=now,
+                )
+                for obj in with_content_types(storage, changed, head=head, workers=workers)
+            ],
+            update_conflicts=True,
+            unique_fields=["visibility", "name"],
+            update_fields=["size", "etag", "content_type", "last_modified", "seen_at"],
+        )
+        unchanged = [obj.name for obj in page if obj.name not in changed_names]
+        if unchanged:
+            StorageObject.objects.filter(visibility=visibility, name__in=unchanged).update(
+                seen_at=now
+            )
+
+        scan.start_after = page[-1].key
+        scan.save(update_fields=["start_after"])
+        pages += 1
+        if max_pages is not None and pages >= max_pages:
+            return False
+
+    removed, _ = StorageObject.objects.filter(
+        visibility=visibility, seen_at__lt=scan.started_at
+    ).delete()
+    scan.start_after = ""
+    scan.snapshot_at = scan.started_at
+    scan.completed_at = timezone.now()
+    scan.save(update_fields=["start_after", "snapshot_at", "completed_at"])
+    logger.info("Completed storage inventory pass", visibility=visibility, removed=removed)
+    return True
+
+
+def reconcile(max_pages: Optional[int] = None, **options) -> bool:
+    """Advance the inventory of every storage backend; True once all passes are complete."""
+    # every storage advances, even when an earlier pass is still incomplete
+    completed = [
+        scan_storage(visibility, storage, max_pages=max_pages, **options)
+        for visibility, storage in storages()
+    ]
+    return all(completed)
+
+
+def snapshot() -> Optional[StorageScan]:
+    """
+    The oldest complete inventory pass, which bounds how current the reported drift is, or None
+    before every storage has been inventoried once.
+    """
+    visibilities = [visibility for visibility, _ in storages()]
+    scans = list(StorageScan.objects.filter(visibility__in=visibilities))
+    if len(scans) < len(visibilities) or any(scan.snapshot_at is None for scan in scans):
+        return None
+    return min(scans, key=lambda scan: scan.snapshot_at)
+
+
+def orphaned_objects() -> QuerySet:
+    """
+    Inventoried objects without a `File` or `FileDerivative` row; an object in both storages
+    counts as public.
+    """
+    return (
+        StorageObject.objects.exclude(name__in=File.objects.values("name"))
+        .exclude(name__in=FileDerivative.objects.values("name"))
+        .exclude(
+            visibility="private",
+            name__in=StorageObject.objects.filter(visibility="public").values("name"),
+        )
+        .order_by("visibility", "name")
+    )
+
+
+def missing_files(scan: StorageScan) -> QuerySet:
+    """
+    `File` rows whose object was not in storage as of the snapshot. Files created since the
+    snapshot pass started are left out, as it may not have listed them.
+    """
+    return (
+        File.objects.filter(created_at__lt=scan.snapshot_at)
+        .exclude(name__in=StorageObject.objects.values("name"))
+        .order_by("-created_at")
+    )
@@ -0,0 +1,35 @@
+import hashlib
+from typing import Any, Tuple
+
+import markdown
+
+MARKDOWN_EXTENSIONS = ["extra", "sane_lists", "codehilite", "toc"]
+MARKDOWN_EXTENSION_CONFIGS = {
+    # classes only; the UI ships the Pygments stylesheet
+    "codehilite": {"css_class": "highlight", "guess_lang": False},
+    "toc": {"permalink": "#", "permalink_class": "heading-anchor"},
+}
+
+
+def content_hash(content: str) -> str:
+    """Fingerprint of the Markdown source, used to skip re-rendering unchanged content."""
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def render_markdown(content: str) -> str:
+    """Render Markdown to HTML with syntax-highlighted code blocks and anchored headings."""
+    return markdown.markdown(
+        content,
+        extensions=MARKDOWN_EXTENSIONS,
+        extension_configs=MARKDOWN_EXTENSION_CONFIGS,
+        output_format="html",
+    )
+
+
+def render_keyed(item: Tuple[Any, str]) -> Tuple[Any, str, str]:
+    """
+    Render a (key, content) pair to (key, html, hash). Kept free of Django imports so it can
+    run in worker processes regardless of the multiprocessing start method.
+    """
+    key, content = item
+    return key, render_markdown(content), content_hash(content)
@@ -3,7 +3,7 @@ from typing import List, Optional
 
 from ninja import Schema
 
-from .post import PostDetails
+from .post import PostDetails, PostSummary
 from .user import AuthorSummary
 
 
@@ -14,7 +14,12 @@ class CommentList(Schema):
     children: List["CommentList"]
     created_at: datetime
     updated_at: datetime
-    post: PostDetails
+    post: PostSummary
+
+    @staticmethod
+    def resolve_children(obj):
+        # replies are attached by blog.comment_tree.build_comment_tree; never query per node
+        return getattr(obj, "thread_children", [])
 
 
 class AdminChildCommentList(Schema):
@@ -1,11 +1,21 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Literal, Optional
+from uuid import UUID
 
-from ninja import Schema
+from django.db.models import Q
+from ninja import FilterSchema, Schema
+from pydantic import Field
 
 from .post import PostSummary
 
 
+class ImageSource(Schema):
+    location: str
+    content_type: str
+    width: int
+    height: int
+
+
 class FileDetails(Schema):
     id: int
     name: str
@@ -16,6 +26,26 @@ class FileDetails(Schema):
     created_at: datetime
     posts: List[PostSummary]
     visibility: str
+    srcset: List[ImageSource] = Field(
+        [],
+        description="Resized copies of an image in modern formats, by format and width. "
+        "Filled in shortly after upload.",
+    )
+
+    @staticmethod
+    def resolve_srcset(obj) -> List:
+        return obj.derivatives.all()
+
+
+class FileFilters(FilterSchema):
+    visibility: Literal["public", "private", "all"] = "all"
+    content_type: Optional[str] = Field(None, description="Prefix, e.g. `image/` for every image.")
+
+    def filter_visibility(self, value: str) -> Q:
+        return Q() if value == "all" else Q(visibility=value)
+
+    def filter_content_type(self, value: Optional[str]) -> Q:
+        return Q(content_type__startswith=value) if value else Q()
 
 
 class FileMetadata(Schema):
@@ -23,8 +53,104 @@ class FileMetadata(Schema):
     visibility: str = "public"
 
 
+class FileUploadRequest(Schema):
+    name: str
+    content_type: str = "application/octet-stream"
+    visibility: Literal["public", "private"] = "public"
+    posts: Optional[List[int]] = None
+    sha256: Optional[str] = Field(
+        None, pattern="^[0-9a-f]{64}$", description="Hex SHA-256 of the content."
+    )
+
+
+class FileUploadTicket(Schema):
+    name: str = Field(..., description="The name the object will be stored under.")
+    url: Optional[str] = Field(None, description="Presigned URL to PUT the file's bytes to.")
+    method: str = "PUT"
+    headers: Dict[str, str] = Field({}, description="Headers the upload request must send.")
+    expires_at: Optional[datetime] = None
+    token: Optional[str] = Field(
+        None, description="Pass to completeFileUpload once the upload finished."
+    )
+    file: Optional[FileDetails] = Field(
+        None, description="An existing file with the same content; there is nothing to upload."
+    )
+
+
+class FileUploadComplete(Schema):
+    token: str
+
+
+class UploadSessionCreate(Schema):
+    name: str
+    content_type: str = "application/octet-stream"
+    visibility: Literal["public", "private"] = "public"
+    size: Optional[int] = Field(
+        None, ge=0, description="Total size in bytes, checked on completion."
+    )
+    posts: Optional[List[int]] = None
+
+
+class UploadPartDetails(Schema):
+    number: int
+    size: int
+    etag: str
+
+
+class UploadSessionDetails(Schema):
+    id: UUID
+    name: str
+    content_type: str
+    visibility: str
+    size: Optional[int]
+    min_part_size: int = Field(..., description="Every part but the last must be this large.")
+    max_part_size: int
+    parts: List[UploadPartDetails]
+    received: int = Field(..., description="Bytes stored so far.")
+    expires_at: datetime = Field(
+        ..., description="When the session is discarded unless a part arrives."
+    )
+    file: Optional[FileDetails]
+
+
 class FileMutateMetadata(Schema):
     posts: Optional[List[int]] = None
+    visibility: Optional[Literal["public", "private"]] = None
+
+
+class FileDownload(Schema):
+    url: str
+    expires_at: Optional[datetime] = Field(
+        None, description="When the URL stops working; never for public files."
+    )
+
+
+class FileVisibilityUpdate(Schema):
+    ids: List[int]
+    visibility: Literal["public", "private"]
+
+
+class OrphanedObject(Schema):
+    name: str
+    visibility: Literal["public", "private"]
+
+
+class FileBulkDelete(Schema):
+    ids: List[int] = []
+    orphans: List[OrphanedObject] = []
+
+
+class ObjectDeleteFailure(Schema):
+    name: str
+    visibility: str
+    code: str
+    message: str
+
+
+class FileBulkDeleteResult(Schema):
+    files: List[int] = Field(..., description="IDs of the deleted files.")
+    objects: int = Field(..., description="Objects removed from storage.")
+    failures: List[ObjectDeleteFailure]
 
 
 class OrphanedFileDetails(Schema):
@@ -39,3 +165,27 @@ class OrphanedFileDetails(Schema):
 class OrphanedFiles(Schema):
     public: List[OrphanedFileDetails]
     private: List[OrphanedFileDetails]
+    snapshot_at: Optional[datetime] = None
+    complete: bool = Field(
+        True,
+        description="False when a live scan failed part way; the lists are then partial and "
+        "must not be acted on.",
+    )
+    error: Optional[str] = None
+
+
+class MissingFiles(Schema):
+    snapshot_at: Optional[datetime]
+    files: List[FileDetails]
+
+
+class StorageCallStats(Schema):
+    count: int
+    errors: int
+    total_seconds: float
+    max_seconds: float
+
+
+class StorageStats(Schema):
+    clients_created: int
+    calls: Dict[str, StorageCallStats]
@@ -35,6 +35,7 @@ class PostUpdate(Schema):
 class PostPublic(PostBase):
     id: int
     slug: str
+    content_html: str = Field("", description="Content rendered to HTML on save")
     author: UserPublic
     created_at: datetime
     updated_at: datetime
@@ -44,8 +45,29 @@ class PostPublic(PostBase):
     )
 
 
-class PostListPublic(PostPublic):
-    pass
+class PostListPublic(Schema):
+    """A post as shown on listings: the body is replaced by its precomputed excerpt."""
+
+    id: int
+    title: str
+    slug: str
+    excerpt: str
+    word_count: int
+    reading_time: int = Field(..., description="Estimated reading time in minutes")
+    published_at: Optional[datetime] = None
+    series_id: Optional[int] = None
+    author: UserPublic
+    created_at: datetime
+    updated_at: datetime
+    comment_count: int = 0
+    series: Optional[SeriesPublic] = Field(
+        None, description="Full details of the series this post belongs to"
+    )
+
+
+class PostSearchResult(PostListPublic):
+    rank: float = Field(..., description="Relevance; title matches weigh more than body matches")
+    headline: str = Field(..., description="Matching excerpt with hits wrapped in <mark> tags")
 
 
 class PostListResponse(Schema):
@@ -72,3 +94,7 @@ class PostSummary(Schema):
     title: str
     published: Optional[datetime] = None
     slug: str
+
+    @staticmethod
+    def resolve_published(obj) -> Optional[datetime]:
+        return obj.published_at
@@ -0,0 +1,36 @@
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank, SearchVector
+from django.db.models import FloatField
+from django.db.models.functions import Cast
+
+SEARCH_CONFIG = "english"
+
+
+def post_search_vector() -> SearchVector:
+    """Weighted document stored in Post.search_vector: title matches outrank body matches."""
+    return SearchVector("title", weight="A", config=SEARCH_CONFIG) + SearchVector(
+        "content", weight="B", config=SEARCH_CONFIG
+    )
+
+
+def search_query(text: str) -> SearchQuery:
+    """Parse user input with web search syntax (quoted phrases, `or`, `-exclusions`)."""
+    return SearchQuery(text, search_type="websearch", config=SEARCH_CONFIG)
+
+
+def matching_posts(queryset, text: str):
+    """Filter posts matching `text` through the GIN index and annotate `rank` and `headline`."""
+    query = search_query(text)
+    return queryset.filter(search_vector=query).annotate(
+        # ts_rank returns a float4; casting keeps the value exact when it round-trips through
+        # a pagination cursor
+        rank=Cast(SearchRank("search_vector", query), FloatField()),
+        headline=SearchHeadline(
+            "content",
+            query,
+            config=SEARCH_CONFIG,
+            start_sel="<mark>",
+            stop_sel="</mark>",
+            max_words=35,
+            min_words=15,
+        ),
+    )
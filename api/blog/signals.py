@@ -0,0 +1,42 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from blog import cache as post_cache
+from blog.models import Comment, Post, Series
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=Series)
+@receiver(pre_delete, sender=Series)
+def invalidate_series_posts(sender, instance: Series, **kwargs):
+    """Cached post bodies embed their series, so refresh every post in it."""
+    post_cache.invalidate_post_details(
+        Post.objects.filter(series=instance).values_list("slug", "published_at")
+    )
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def invalidate_comment_post(sender, instance: Comment, **kwargs):
+    """Cached post bodies embed the visible comment count."""
+    post_cache.invalidate_post_details(
+        Post.objects.filter(pk=instance.post_id).values_list("slug", "published_at")
+    )
+
+
+@receiver(post_save, sender=User)
+@receiver(pre_delete, sender=User)
+def invalidate_author_posts(sender, instance, **kwargs):
+    """Cached post bodies embed their author, so refresh every post they wrote."""
+    post_cache.invalidate_post_details(
+        Post.objects.filter(author_id=instance.pk).values_list("slug", "published_at")
+    )
+
+
+@receiver(pre_delete, sender=User)
+def invalidate_feeds_for_author(sender, instance, **kwargs):
+    """Deleting an author cascades to their posts without calling Post.delete."""
+    if Post.objects.filter(author_id=instance.pk).exists():
+        post_cache.invalidate_feeds()
@@ -0,0 +1,46 @@
+import math
+import re
+from typing import NamedTuple
+
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+
+EXCERPT_LENGTH = 300
+WORDS_PER_MINUTE = 200
+
+_FENCED_CODE = re.compile(r"^(```|~~~).*?^\1", re.MULTILINE | re.DOTALL)
+_IMAGE = re.compile(r"!\[([^\]]*)\]\([^)]*\)")
+_LINK = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_INLINE_CODE = re.compile(r"`([^`]*)`")
+_LINE_MARKUP = re.compile(r"^\s{0,3}(#{1,6}\s+|>\s?|[-*+]\s+|\d+\.\s+)", re.MULTILINE)
+_EMPHASIS = re.compile(r"(\*\*|__|\*|_|~~)(\S.*?\S|\S)\1")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class Summary(NamedTuple):
+    excerpt: str
+    word_count: int
+    reading_time: int  # minutes
+
+
+def plain_text(markdown: str) -> str:
+    """Reduce Markdown to readable plain text. Code blocks are dropped entirely."""
+    text = _FENCED_CODE.sub(" ", markdown)
+    text = _IMAGE.sub(r"\1", text)
+    text = _LINK.sub(r"\1", text)
+    text = _INLINE_CODE.sub(r"\1", text)
+    text = _LINE_MARKUP.sub("", text)
+    text = _EMPHASIS.sub(r"\2", text)
+    text = strip_tags(text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def summarize(markdown: str) -> Summary:
+    """Compute the excerpt, word count and reading time shown on post listings."""
+    text = plain_text(markdown or "")
+    word_count = len(text.split())
+    return Summary(
+        excerpt=Truncator(text).chars(EXCERPT_LENGTH),
+        word_count=word_count,
+        reading_time=math.ceil(word_count / WORDS_PER_MINUTE),
+    )
@@ -1,9 +1,16 @@
+import boto3
 import pytest
+from django.core.cache import cache
 from django.utils import timezone
+from moto import mock_aws
 from ninja_jwt.tokens import RefreshToken
 
 from accounts.models import User
+from auth.blacklist import blacklist
+from auth.token_cache import token_cache
+from auth.user_cache import user_cache
 from blog.models import Comment, Post, Series
+from files.storage import PrivateStorage, PublicStorage, reset_storages
 
 
 @pytest.fixture
@@ -63,9 +70,39 @@ def comment(db, post, regular_user):
     )
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # cached responses and users outlive the per-test database rollback
+    cache.clear()
+    user_cache.clear()
+    token_cache.clear()
+    blacklist.clear()
+    yield
+
+
 @pytest.fixture(autouse=True)
 def mock_s3_storage(monkeypatch):
     # Patch PublicStorage and PrivateStorage to use FileSystemStorage
     # monkeypatch.setattr("files.storage.PublicStorage", FileSystemStorage)
     # monkeypatch.setattr("files.storage.PrivateStorage", FileSystemStorage)
     yield
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    """An in-memory S3 bucket behind both storage backends."""
+    with mock_aws():
+        for storage in (PublicStorage, PrivateStorage):
+            monkeypatch.setattr(storage, "access_key", "testing")
+            monkeypatch.setattr(storage, "secret_key", "testing")
+            monkeypatch.setattr(storage, "bucket_name", "test-bucket")
+            monkeypatch.setattr(storage, "region_name", "us-east-1")
+            monkeypatch.setattr(storage, "endpoint_url", None)
+            monkeypatch.setattr(storage, "custom_domain", None)
+            monkeypatch.setattr(storage, "location", "media")
+        # the shared storages are built from the patched settings and dropped afterwards
+        reset_storages()
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket="test-bucket")
+        yield client
+        reset_storages()
@@ -65,3 +65,60 @@ class TestCommentsAPI:
         )
         assert response.status_code == 200 or response.status_code == 204
         assert not Comment.objects.filter(id=comment.id).exists()
+
+    def test_list_comments_builds_thread_in_constant_queries(
+        self, client: Client, post, regular_user, django_assert_max_num_queries
+    ):
+        root = Comment.objects.create(post=post, author=regular_user, content="root")
+        parent = root
+        for i in range(30):
+            parent = Comment.objects.create(
+                post=post, author=regular_user, content=f"reply {i}", parent=parent
+            )
+        hidden = Comment.objects.create(
+            post=post, author=regular_user, content="hidden", visible=False
+        )
+        Comment.objects.create(post=post, author=regular_user, content="orphan", parent=hidden)
+
+        with django_assert_max_num_queries(1):
+            response = client.get(f"/api/comments/?post_id={post.id}&top_level=true")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] == 1
+        node, depth = data["items"][0], 0
+        while node["children"]:
+            node, depth = node["children"][0], depth + 1
+        assert depth == 30
+        assert node["content"] == "reply 29"
+
+    @pytest.mark.parametrize("auth_token", ["superuser"], indirect=True)
+    def test_staff_listing_pages_roots_in_sql(
+        self, client: Client, auth_token: str, post, regular_user, django_assert_max_num_queries
+    ):
+        from blog.models import Post
+
+        other = Post.objects.create(title="Other", slug="other", author=regular_user, content="x")
+        roots = []
+        for index in range(3):
+            for target in (post, other):
+                root = Comment.objects.create(post=target, author=regular_user, content=f"{index}")
+                Comment.objects.create(
+                    post=target, author=regular_user, content="reply", parent=root
+                )
+                roots.append(root.id)
+        Comment.objects.create(post=post, author=regular_user, content="hidden", visible=False)
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {auth_token}"}
+        client.get("/api/comments/?limit=1", **headers)
+
+        # count, page and the threads of the page's posts
+        with django_assert_max_num_queries(3):
+            response = client.get("/api/comments/?limit=4", **headers)
+        data = response.json()
+        assert data["count"] == 6
+        assert [item["id"] for item in data["items"]] == roots[:4]
+        assert all(
+            [child["content"] for child in item["children"]] == ["reply"] for item in data["items"]
+        )
+
+        response = client.get(f"/api/comments/?cursor={data['next_cursor']}", **headers)
+        assert [item["id"] for item in response.json()["items"]] == roots[4:]
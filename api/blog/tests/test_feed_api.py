@@ -1,6 +1,10 @@
+from xml.etree import ElementTree
+
 import pytest
 from django.test.client import Client
 
+from blog.feed_builder import ATOM_NS
+
 
 @pytest.mark.django_db
 class TestFeedAPI:
@@ -11,3 +15,63 @@ class TestFeedAPI:
         data = response.json()
         assert "items" in data
         assert isinstance(data["items"], list)
+
+    def test_feed_snapshot_is_cached_until_posts_change(
+        self, client: Client, post, django_assert_num_queries
+    ):
+        first = client.get("/api/feed/")
+        with django_assert_num_queries(0):
+            second = client.get("/api/feed/")
+        assert second.content == first.content
+
+        post.title = "Updated"
+        post.save()
+        assert client.get("/api/feed/").json()["items"][0]["title"] == "Updated"
+
+    def test_feed_conditional_requests(self, client: Client, post):
+        response = client.get("/api/feed/")
+        etag = response["ETag"]
+        assert response["Last-Modified"]
+
+        response = client.get("/api/feed/", HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304
+        assert response.content == b""
+
+        response = client.get("/api/feed/", HTTP_IF_NONE_MATCH='"stale"')
+        assert response.status_code == 200
+
+    def test_rss_feed(self, client: Client, post):
+        response = client.get("/api/feed/rss")
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("application/rss+xml")
+        root = ElementTree.fromstring(response.content)
+        assert root.tag == "rss"
+        item = root.find("channel/item")
+        assert item.findtext("title") == post.title
+        assert item.findtext("description") == post.content_html
+        assert item.findtext("pubDate")
+
+    def test_atom_feed(self, client: Client, post):
+        response = client.get("/api/feed/atom")
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("application/atom+xml")
+        root = ElementTree.fromstring(response.content)
+        assert root.tag == f"{{{ATOM_NS}}}feed"
+        entry = root.find(f"{{{ATOM_NS}}}entry")
+        assert entry.findtext(f"{{{ATOM_NS}}}title") == post.title
+        content = entry.find(f"{{{ATOM_NS}}}content")
+        assert content.get("type") == "html"
+        assert content.text == post.content_html
+
+    def test_formats_share_rendered_items(self, client: Client, post, django_assert_num_queries):
+        client.get("/api/feed/")
+        # page ids and the next scheduled post; items come from the cache
+        with django_assert_num_queries(2):
+            client.get("/api/feed/rss")
+        with django_assert_num_queries(2):
+            client.get("/api/feed/atom")
+
+        post.title = "Updated"
+        post.save()
+        root = ElementTree.fromstring(client.get("/api/feed/rss").content)
+        assert root.findtext("channel/item/title") == "Updated"
@@ -0,0 +1,898 @@
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO, StringIO
+
+import pytest
+from botocore.exceptions import EndpointConnectionError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import connection
+from django.test.client import Client
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from ninja.errors import HttpError
+from PIL import Image
+
+from blog import derivatives, reconcile, uploads
+from blog.api import files as files_api
+from blog.models import (
+    File,
+    FileDerivative,
+    StorageObject,
+    StorageScan,
+    UploadPart,
+    UploadSession,
+)
+from blog.orphans import iter_orphaned_files
+from blog.schema.file import FileDetails
+from files import download, multipart, presign
+from files.delete import delete_objects
+from files.scan import StoredObject
+from files.storage import PrivateStorage, stats, storage_for
+
+
+def orphaned(response) -> dict:
+    return json.loads(b"".join(response.streaming_content))
+
+
+@pytest.mark.django_db
+class TestFileListing:
+    def create_files(self, post, count, **fields):
+        fields = {"content_type": "application/pdf", **fields}
+        for index in range(count):
+            file = File.objects.create(
+                name=f"{fields['content_type'][:5]}{index}", size=1, location="/x", **fields
+            )
+            file.posts.add(post)
+
+    @pytest.mark.parametrize("auth_token", ["superuser"], indirect=True)
+    def test_page_costs_constant_queries(self, client: Client, auth_token, post):
+        headers = {"Authorization": f"Bearer {auth_token}"}
+        self.create_files(post, 2)
+        # the first request also loads the user
+        client.get("/api/files/", headers=headers)
+        with CaptureQueriesContext(connection) as few:
+            assert len(client.get("/api/files/", headers=headers).json()["items"]) == 2
+
+        self.create_files(post, 20, content_type="image/png")
+        with CaptureQueriesContext(connection) as many:
+            items = client.get("/api/files/", headers=headers).json()["items"]
+        assert len(items) == 22
+        assert len(many) == len(few)
+        summary = items[0]["posts"][0]
+        assert (summary["id"], summary["slug"]) == (post.id, post.slug)
+        assert summary["published"].startswith(post.published_at.strftime("%Y-%m-%dT%H:%M:%S"))
+
+    @pytest.mark.parametrize("auth_token", ["superuser"], indirect=True)
+    def test_filters_compose(self, client: Client, auth_token, post):
+        headers = {"Authorization": f"Bearer {auth_token}"}
+        self.create_files(post, 2, content_type="image/png")
+        self.create_files(post, 1, content_type="image/gif", visibility="private")
+        self.create_files(post, 3)
+
+        def count(url):
+            response = client.get(url, headers=headers).json()
+            return len(response["items"] if "items" in response else response)
+
+        assert count("/api/files/?visibility=public") == 5
+        assert count("/api/files/?content_type=image/") == 3
+        assert count("/api/files/?content_type=image/&visibility=private") == 1
+        assert count(f"/api/posts/{post.id}/files?visibility=private") == 1
+        assert count(f"/api/posts/{post.id}/files") == 6
+
+
+@pytest.mark.django_db
+class TestOrphanedFiles:
+    @pytest.mark.parametrize("auth_token", ["superuser"], indirect=True)
+    def test_lists_objects_without_file_rows(self, client: Client, auth_token, s3):
+        s3.put_object(Bucket="test-bucket", Key="media/known.png", Body=b"x")
+        s3.put_object(
+            Bucket="test-bucket", Key="media/orphan.pdf", Body=b"abc", ContentType="application/pdf"
+        )
+        File.objects.create(
+            name="known.png", content_type="image/png", size=1, location="/known.png"
+        )
+
+        response = client.get(
+            "/api/files/orphaned", headers={"Authorization": f"Bearer {auth_token}"}
+        )
+        assert response.status_code == 200
+        data = orphaned(response)
+        assert data["private"] == []
+        assert [(f["name"], f["size"], f["content_type"]) for f in data["public"]] == [
+            ("orphan.pdf", 3, "application/pdf")
+        ]
+        assert (data["complete"], data["error"]) == (True, None)
+
+    @pytest.mark.parametrize("auth_token", ["superuser"], indirect=True)
+    def test_failed_scan_is_marked_incomplete(self, client: Client, auth_token, monkeypatch):
+        def failing(head):
+            yield (
+                "public",
+                StoredObject(
+                    "first.pdf", "media/first.pdf", 1, None, content_type="application/pdf"
+                ),
+                "/first.pdf",
+            )
+            raise RuntimeError("listing failed")
+
+        monkeypatch.setattr(files_api, "iter_orphaned_files", failing)
+        response = client.get(
+            "/api/files/orphaned", headers={"Authorization": f"Bearer {auth_token}"}
+        )
+        assert response.status_code == 200
+        data = orphaned(response)
+        assert [f["name"] for f in data["public"]] == ["first.pdf"]
+        assert data["complete"] is False
+        assert data["error"]
+
+    @pytest.mark.parametrize("auth_token", ["superuser"], indirect=True)
+    def test_guesses_content_types_without_head_requests(self, client: Client, auth_token, s3):
+        s3.put_object(Bucket="test-bucket", Key="media/orphan.txt", Body=b"abc")
+
+        response = client.get(
+            "/api/files/orphaned?exact_content_types=false",
+            headers={"Authorization": f"Bearer {auth_token}"},
+        )
+        assert orphaned(response)["public"][0]["content_type"] == "text/plain"
+
+    @pytest.mark.parametrize("live", [True, False])
+    def test_derivatives_are_not_orphans(self, s3, live):
+        s3.put_object(Bucket="test-bucket", Key="media/pic.png", Body=b"x")
+        s3.put_object(Bucket="test-bucket", Key="media/pic.480w.avif", Body=b"x")
+        s3.put_object(Bucket="test-bucket", Key="media/stray.480w.avif", Body=b"x")
+        file = File.objects.create(
+            name="pic.png", content_type="image/png", size=1, location="/pic.png"
+        )
+        FileDerivative.objects.create(
+            file=file,
+            name="pic.480w.avif",
+            location="/pic.480w.avif",
+            content_type="image/avif",
+            width=480,
+            height=480,
+            size=1,
+        )
+
+        if live:
+            names = [obj.name for _, obj, _ in iter_orphaned_files(head=False)]
+        else:
+            out = StringIO()
+            call_command("reconcile_storage", stdout=out)
+            assert "1 orphaned object(s)" in out.getvalue()
+            names = [obj.name for obj in reconcile.orphaned_objects()]
+        assert names == ["stray.480w.avif"]
+
+    def test_scan_pages_through_the_listing(self, s3, django_assert_num_queries):
+        for index in range(25):
+            s3.put_object(Bucket="test-bucket", Key=f"media/file-{index:02}", Body=b"x")
+
+        # one name lookup per page of the listing
+        with django_assert_num_queries(3):
+            names = [obj.name for _, obj, _ in iter_orphaned_files(workers=4, page_size=10)]
+        assert names == [f"file-{index:02}" for index in range(25)]
+
+
+@pytest.mark.django_db
+class TestSharedStorage:
+    @pytest.mark.parametrize("auth_token", ["superuser"], indirect=True)
+    def test_uploads_reuse_one_client(self, client: Client, auth_token, s3):
+        stats.reset()
+        headers = {"Authorization": f"Bearer {auth_token}"}
+        for content in (b"first", b"second", b"third"):
+            response = client.post(
+                "/api/files/",
+                {
+                    "metadata": json.dumps({"visibility": "public"}),
+                    "upload": SimpleUploadedFile("shot.png", content, "image/png"),
+                },
+                headers=headers,
+            )
+            assert response.status_code == 200
+
+        response = client.get("/api/files/storage/stats", headers=headers).json()
+        assert response["clients_created"] == 1
+        assert response["calls"]["PutObject"]["count"] == 3
+        assert response["calls"]["PutObject"]["errors"] == 0
+
+    def test_threads_share_the_storage_not_the_connection(self, s3):
+        shared = storage_for("private")
+        assert storage_for("private") is shared
+        assert shared.connection.meta.client.meta.config.max_pool_connections == 32
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            seen = list(executor.map(lambda _: (storage_for("private"), shared.bucket), range(2)))
+        assert all(found is shared for found, _ in seen)
+        assert all(bucket is not shared.bucket for _, bucket in seen)
+
+    def test_threads_share_one_client(self, s3):
+        stats.reset()
+        shared = storage_for("public")
+        s3.put_object(Bucket="test-bucket", Key="media/shared", Body=b"x")
+
+        def head(_):
+            assert shared.exists("shared")
+            return shared.connection.meta.client
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            clients = list(executor.map(head, range(8)))
+        assert all(found is shared.client for found in clients)
+        assert stats.snapshot()["clients_created"] == 1
+
+
+@pytest.mark.django_db
+class TestStorageReconciliation:
+    def test_inventory_resumes_from_checkpoint(self, s3):
+        for index in range(5):
+            s3.put_object(Bucket="test-bucket", Key=f"media/file-{index}", Body=b"x")
+
+        assert reconcile.reconcile(max_pages=2, page_size=2) is False
+        scan = StorageScan.objects.get(visibility="public")
+        assert scan.start_after == "media/file-3"
+        assert scan.snapshot_at is None
+        assert reconcile.snapshot() is None
+
+        assert reconcile.reconcile(max_pages=2, page_size=2) is True
+        assert StorageObject.objects.count() == 5
+        assert reconcile.snapshot().start_after == ""
+
+    def test_completed_pass_drops_deleted_objects(self, s3):
+        s3.put_object(Bucket="test-bucket", Key="media/kept", Body=b"x")
+        s3.put_object(Bucket="test-bucket", Key="media/deleted", Body=b"x")
+        reconcile.reconcile()
+
+        s3.delete_object(Bucket="test-bucket", Key="media/deleted")
+        reconcile.reconcile()
+        assert list(StorageObject.objects.values_list("name", flat=True)) == ["kept"]
+
+    @pytest.mark.parametrize("auth_token", ["superuser"], indirect=True)
+    def test_endpoints_read_the_snapshot(
+        self, client: Client, auth_token, s3, django_assert_max_num_queries
+    ):
+        s3.put_object(Bucket="test-bucket", Key="media/orphan.pdf", Body=b"abc")
+        s3.put_object(Bucket="test-bucket", Key="media/known.png", Body=b"x")
+        File.objects.create(
+            name="known.png", content_type="image/png", size=1, location="/known.png"
+        )
+        File.objects.create(
+            name="missing.png", content_type="image/png", size=1, location="/missing.png"
+        )
+        call_command("reconcile_storage", stdout=StringIO())
+        headers = {"Authorization": f"Bearer {auth_token}"}
+
+        # the bucket is not listed again
+        s3.put_object(Bucket="test-bucket", Key="media/later.pdf", Body=b"abc")
+        with django_assert_max_num_queries(4):
+            response = client.get("/api/files/orphaned", headers=headers)
+        data = response.json()
+        assert data["snapshot_at"]
+        assert [f["name"] for f in data["public"]] == ["orphan.pdf"]
+
+        # files created after the snapshot pass started may not have been listed yet
+        File.objects.create(name="new.png", content_type="image/png", size=1, location="/new.png")
+        response = client.get("/api/files/missing", headers=headers)
+        assert [f["name"] for f in response.json()["files"]] == ["missing.png"]
+
+        live = orphaned(client.get("/api/files/orphaned?live=true", headers=headers))
+        assert sorted(f["name"] for f in live["public"]) == ["later.pdf", "orphan.pdf"]
+
+
+@pytest.mark.django_db
+class TestDirectUploads:
+    @pytest.mark.parametrize("auth_token", ["superuser"], indirect=True)
+    def test_presigned_upload_flow(self, client: Client, auth_token, s3, post):
+        headers = {"Authorization": f"Bearer {auth_token}"}
+        response = client.post(
+            "/api/files/uploads",
+            {"name": "video.mp4", "content_type": "video/mp4", "posts": [post.id]},
+            content_type="application/json",
+            headers=headers,
+        )
+        assert response.status_code == 200
+        ticket = response.json()
+        assert ticket["name"] == "video.mp4"
+        assert "Signature=" in ticket["url"]
+        assert ticket["headers"] == {"Content-Type": "video/mp4", "x-amz-acl": "public-read"}
+
+        complete = {"token": ticket["token"]}
+        response = client.post(
+            "/api/files/uploads/complete",
+            complete,
+            content_type="application/json",
+            headers=headers,
+        )
+        assert response.status_code == 409
+
+        # stands in for the client's PUT to the presigned URL
+        s3.put_object(
+            Bucket="test-bucket", Key="media/video.mp4", Body=b"1234", ContentType="video/mp4"
+        )
+        response = client.post(
+            "/api/files/uploads/complete",
+            complete,
+            content_type="application/json",
+            headers=headers,
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert (data["name"], data["size"], data["content_type"]) == ("video.mp4", 4, "video/mp4")
+        assert [p["id"] for p in data["posts"]] == [post.id]
+
+        response = client.post(
+            "/api/files/uploads/complete",
+            complete,
+            content_type="application/json",
+            headers=headers,
+        )
+        assert response.json()["id"] == data["id"]
+        assert File.objects.count() == 1
+
+    @pytest.mark.parametrize("auth_token", ["superuser"], indirect=True)
+    def test_rejects_tampered_tokens(self, client: Client, auth_token, s3):
+        response = client.post(
+            "/api/files/uploads/complete",
+            {"token": "forged"},
+            content_type="application/json",
+            headers={"Authorization": f"Bearer {auth_token}"},
+        )
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize("auth_token", ["regular_user"], indirect=True)
+    def test_staff_only(self, client: Client, auth_token, s3):
+        response = client.post(
+            "/api/files/uploads",
+            {"name": "video.mp4"},
+            content_type="application/json",
+            headers={"Authorization": f"Bearer {auth_token}"},
+        )
+        assert response.status_code in (401, 403)
+
+
+@pytest.mark.django_db
+class TestUploadSessions:
+    @pytest.mark.parametrize("auth_token", ["superuser"], indirect=True)
+    def test_resumable_upload(self, client: Client, auth_token, s3, post):
+        headers = {"Authorization": f"Bearer {auth_token}"}
+        first, last = b"a" * multipart.MIN_PART_SIZE, b"tail"
+        response = client.post(
+            "/api/files/sessions",
+            {"name": "big.bin", "size": len(first) + len(last), "posts": [post.id]},
+            content_type="application/json",
+            headers=headers,
+        )
+        assert response.status_code == 200
+        session = response.json()
+        url = f"/api/files/sessions/{session['id']}"
+
+        # parts may arrive out of order
+        response = client.put(
+            f"{url}/parts/2", last, content_type="application/octet-stream", headers=headers
+        )
+        assert response.json()["size"] == len(last)
+        response = client.post(f"{url}/complete", headers=headers)
+        assert response.status_code == 400
+
+        status = client.get(url, headers=headers).json()
+        assert [part["number"] for part in status["parts"]] == [2]
+        assert status["received"] == len(last)
+
+        client.put(
+            f"{url}/parts/1", first, content_type="application/octet-stream", headers=headers
+        )
+        response = client.post(f"{url}/complete", headers=headers)
+        assert response.status_code == 200
+        file = response.json()
+        assert (file["name"], file["size"]) == ("big.bin", len(first) + len(last))
+        assert [p["id"] for p in file["posts"]] == [post.id]
+        body = s3.get_object(Bucket="test-bucket", Key="media/big.bin")["Body"].read()
+        assert body == first + last
+
+        assert client.post(f"{url}/complete", headers=headers).json()["id"] == file["id"]
+
+    def test_parts_stream_concurrently(self, s3, superuser):
+        session = uploads.start_session(
+            superuser, "parallel.bin", "application/octet-stream", "public"
+        )
+        storage = storage_for("public")
+        parts = [bytes([65 + number]) * multipart.MIN_PART_SIZE for number in range(3)] + [b"end"]
+        reads = []
+
+        class Body:
+            """A request stream: read in chunks, never rewound."""
+
+            def __init__(self, data):
+                self.stream = BytesIO(data)
+
+            def read(self, size=-1):
+                reads.append(size)
+                return self.stream.read(size)
+
+        def send(number):
+            data = parts[number - 1]
+            etag = multipart.upload_part(
+                storage, session.name, session.upload_id, number, Body(data), len(data)
+            )
+            return number, len(data), etag
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            sent = list(executor.map(send, range(1, 5)))
+        # no part was read into memory whole
+        assert 0 < max(reads) < multipart.MIN_PART_SIZE
+        for number, size, etag in sent:
+            UploadPart.objects.create(session=session, number=number, size=size, etag=etag)
+
+        uploads.complete_session(session)
+        body = s3.get_object(Bucket="test-bucket", Key="media/parallel.bin")["Body"].read()
+        assert body == b"".join(parts)
+
+    @pytest.mark.parametrize("auth_token", ["superuser"], indirect=True)
+    def test_oversized_parts_are_refused_unread(self, client: Client, auth_token, s3):
+        headers = {"Authorization": f"Bearer {auth_token}"}
+        session = client.post(
+            "/api/files/sessions",
+            {"name": "big.bin"},
+            content_type="application/json",
+            headers=headers,
+        ).json()
+        response = client.put(
+            f"/api/files/sessions/{session['id']}/parts/1",
+            b"x",
+            content_type="application/octet-stream",
+            headers=headers,
+            CONTENT_LENGTH=str(multipart.MAX_PART_SIZE + 1),
+        )
+        assert response.status_code == 413
+        assert not UploadPart.objects.exists()
+
+    def test_files_above_2_gib(self, s3, superuser, monkeypatch):
+        session = uploads.start_session(superuser, "huge.bin", "application/octet-stream", "public")
+        for number in (1, 2):
+            UploadPart.objects.create(
+                session=session, number=number, size=multipart.MAX_PART_SIZE * 24, etag="x"
+            )
+        # stands in for assembling the 3 GiB object
+        monkeypatch.setattr(multipart, "complete", lambda *args: None)
+
+        file = uploads.complete_session(session)
+        file.refresh_from_db()
+        assert file.size == multipart.MAX_PART_SIZE * 48
+
+    def test_failed_completion_can_be_retried(self, s3, superuser, monkeypatch):
+        session = uploads.start_session(
+            superuser, "retry.bin", "application/octet-stream", "public"
+        )
+        uploads.append_part(session, 1, BytesIO(b"content"), 7)
+        assembled = []
+        complete = multipart.complete
+        monkeypatch.setattr(multipart, "complete", lambda *args: assembled.append(complete(*args)))
+
+        def fail(file):
+            raise RuntimeError("database went away")
+
+        monkeypatch.setattr(derivatives, "schedule", fail)
+        with pytest.raises(RuntimeError):
+            uploads.complete_session(session)
+        session.refresh_from_db()
+        assert (session.state, session.file_id, File.objects.count()) == ("assembled", None, 0)
+        with pytest.raises(HttpError):
+            uploads.append_part(session, 2, BytesIO(b"late"), 4)
+
+        monkeypatch.setattr(derivatives, "schedule", lambda file: None)
+        file = uploads.complete_session(session)
+        assert len(assembled) == 1
+        assert file.size == len(b"content")
+        body = s3.get_object(Bucket="test-bucket", Key="media/retry.bin")["Body"].read()
+        assert body == b"content"
+
+    def test_storage_errors_release_the_session(self, s3, superuser, monkeypatch):
+        session = uploads.start_session(
+            superuser, "flaky.bin", "application/octet-stream", "public"
+        )
+        uploads.append_part(session, 1, BytesIO(b"content"), 7)
+
+        complete = multipart.complete
+
+        def fail(*args):
+            raise ConnectionError("storage went away")
+
+        monkeypatch.setattr(multipart, "complete", fail)
+        with pytest.raises(ConnectionError):
+            uploads.complete_session(session)
+        session.refresh_from_db()
+        assert session.state == "open"
+
+        monkeypatch.setattr(multipart, "complete", complete)
+        assert uploads.complete_session(session).size == len(b"content")
+
+    def test_completed_uploads_are_hashed(self, s3, superuser, django_capture_on_commit_callbacks):
+        session = uploads.start_session(
+            superuser, "small.bin", "application/octet-stream", "public"
+        )
+        uploads.append_part(session, 1, BytesIO(b"content"), 7)
+        with django_capture_on_commit_callbacks() as callbacks:
+            file = uploads.complete_session(session)
+        # derivatives are only rendered for images
+        assert len(callbacks) == 1
+        assert file.sha256 == ""
+
+        assert uploads.hash_file(file.id) == hashlib.sha256(b"content").hexdigest()
+        file.refresh_from_db()
+        assert file.sha256 == hashlib.sha256(b"content").hexdigest()
+        assert uploads.hash_file(file.id) is None
+        assert uploads.reuse_duplicate("public", file.sha256) == file
+
+    def test_abandoned_uploads_are_collected(self, s3, superuser):
+        stale = uploads.start_session(superuser, "stale.bin", "application/octet-stream", "public")
+        fresh = uploads.start_session(superuser, "fresh.bin", "application/octet-stream", "public")
+        UploadSession.objects.filter(pk=stale.pk).update(
+            updated_at=timezone.now() - uploads.UPLOAD_SESSION_TTL * 2
+        )
+        stray = s3.create_multipart_upload(Bucket="test-bucket", Key="media/stray.bin")
+
+        # the stray upload has no session; moto reports every upload as initiated long ago
+        assert uploads.collect_abandoned_uploads() == 2
+        assert list(UploadSession.objects.all()) == [fresh]
+        remaining = s3.list_multipart_uploads(Bucket="test-bucket")["Uploads"]
+        assert [upload["UploadId"] for upload in remaining] == [fresh.upload_id]
+        assert stray["Key"] not in [upload["Key"] for upload in remaining]
+
+
+@pytest.mark.django_db
+class TestDeduplication:
+    @pytest.mark.parametrize("auth_token", ["superuser"], indirect=True)
+    def test_identical_uploads_reuse_the_file(self, client: Client, auth_token, s3, post):
+        headers = {"Authorization": f"Bearer {auth_token}"}
+
+        def upload(posts):
+            return client.post(
+                "/api/files/",
+                {
+                    "metadata": json.dumps({"visibility": "public", "posts": posts}),
+                    "upload": SimpleUploadedFile("shot.png", b"pixels", "image/png"),
+                },
+                headers=headers,
+            )
+
+        first = upload([])
+        assert first.status_code == 200
+        assert File.objects.get().sha256 == hashlib.sha256(b"pixels").hexdigest()
+
+        second = upload([post.id])
+        assert second.json()["id"] == first.json()["id"]
+        assert [p["id"] for p in second.json()["posts"]] == [post.id]
+        assert File.objects.count() == 1
+        assert s3.list_objects_v2(Bucket="test-bucket")["KeyCount"] == 1
+
+    @pytest.mark.parametrize("auth_token", ["superuser"], indirect=True)
+    def test_presigned_upload_of_known_content(self, client: Client, auth_token, s3):
+        digest = hashlib.sha256(b"pixels").hexdigest()
+        existing = File.objects.create(
+            name="shot.png", content_type="image/png", size=6, location="/shot.png", sha256=digest
+        )
+        request = {"name": "copy.png", "content_type": "image/png", "sha256": digest}
+        response = client.post(
+            "/api/files/uploads",
+            request,
+            content_type="application/json",
+            headers={"Authorization": f"Bearer {auth_token}"},
+        )
+        ticket = response.json()
+        assert ticket["file"]["id"] == existing.id
+        assert ticket["url"] is None
+
+        request["visibility"] = "private"
+        response = client.post(
+            "/api/files/uploads",
+            request,
+            content_type="application/json",
+            headers={"Authorization": f"Bearer {auth_token}"},
+        )
+        ticket = response.json()
+        assert ticket["file"] is None
+        assert ticket["headers"]["x-amz-checksum-sha256"]
+
+    def test_backfill_hashes_stored_objects(self, s3):
+        s3.put_object(Bucket="test-bucket", Key="media/old.png", Body=b"old")
+        File.objects.create(name="old.png", content_type="image/png", size=3, location="/old.png")
+        File.objects.create(name="gone.png", content_type="image/png", size=3, location="/gone.png")
+
+        call_command("hash_files", workers=2, stdout=StringIO(), stderr=StringIO())
+        assert dict(File.objects.values_list("name", "sha256")) == {
+            "old.png": hashlib.sha256(b"old").hexdigest(),
+            "gone.png": "",
+        }
+
+
+def png(width: int, height: int) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", (width, height), "teal").save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+@pytest.mark.django_db
+class TestImageDerivatives:
+    def test_generates_srcset(self, client: Client, s3):
+        s3.put_object(Bucket="test-bucket", Key="media/photo.png", Body=png(1000, 500))
+        file = File.objects.create(
+            name="photo.png", content_type="image/png", size=1, location="/photo.png"
+        )
+
+        with ThreadPoolExecutor() as pool:
+            assert derivatives.generate_derivatives([file], pool=pool) == 6
+
+        srcset = FileDetails.from_orm(File.objects.get()).srcset
+        assert [(s.content_type, s.width, s.height) for s in srcset] == [
+            ("image/avif", 480, 240),
+            ("image/avif", 960, 480),
+            ("image/avif", 1000, 500),
+            ("image/webp", 480, 240),
+            ("image/webp", 960, 480),
+            ("image/webp", 1000, 500),
+        ]
+        name = file.derivatives.get(content_type="image/webp", width=480).name
+        stored = s3.head_object(Bucket="test-bucket", Key=f"media/{name}")
+        assert stored["ContentType"] == "image/webp"
+
+        # regenerating replaces the previous derivatives
+        with ThreadPoolExecutor() as pool:
+            derivatives.generate_derivatives([file], pool=pool)
+        assert file.derivatives.count() == 6
+        assert not file.derivatives.filter(name=name).exists()
+        assert s3.list_objects_v2(Bucket="test-bucket")["KeyCount"] == 7
+
+    def test_failed_runs_keep_the_previous_derivatives(self, s3, monkeypatch):
+        s3.put_object(Bucket="test-bucket", Key="media/photo.png", Body=png(600, 300))
+        file = File.objects.create(
+            name="photo.png", content_type="image/png", size=1, location="/photo.png"
+        )
+        with ThreadPoolExecutor() as pool:
+            derivatives.generate_derivatives([file], pool=pool)
+        served = set(file.derivatives.values_list("name", flat=True))
+
+        upload = derivatives._upload
+
+        def flaky(args):
+            if args[-2] == "avif":
+                raise ConnectionError("storage went away")
+            return upload(args)
+
+        monkeypatch.setattr(derivatives, "_upload", flaky)
+        with ThreadPoolExecutor() as pool, pytest.raises(ConnectionError):
+            derivatives.generate_derivatives([file], pool=pool)
+
+        assert set(file.derivatives.values_list("name", flat=True)) == served
+        keys = {obj["Key"] for obj in s3.list_objects_v2(Bucket="test-bucket")["Contents"]}
+        assert keys == {"media/photo.png"} | {f"media/{name}" for name in served}
+
+    @pytest.mark.parametrize("auth_token", ["superuser"], indirect=True)
+    def test_uploads_schedule_derivatives(
+        self, client: Client, auth_token, s3, django_capture_on_commit_callbacks
+    ):
+        with django_capture_on_commit_callbacks() as callbacks:
+            client.post(
+                "/api/files/",
+                {
+                    "metadata": json.dumps({"visibility": "public"}),
+                    "upload": SimpleUploadedFile("photo.png", png(10, 10), "image/png"),
+                },
+                headers={"Authorization": f"Bearer {auth_token}"},
+            )
+            client.post(
+                "/api/files/",
+                {
+                    "metadata": json.dumps({"visibility": "public"}),
+                    "upload": SimpleUploadedFile("notes.txt", b"notes", "text/plain"),
+                },
+                headers={"Authorization": f"Bearer {auth_token}"},
+            )
+        assert len(callbacks) == 1
+
+    def test_backfill_command(self, s3):
+        s3.put_object(Bucket="test-bucket", Key="media/photo.png", Body=png(600, 300))
+        File.objects.create(
+            name="photo.png", content_type="image/png", size=1, location="/photo.png"
+        )
+
+        call_command("generate_derivatives", workers=1, stdout=StringIO())
+        assert FileDerivative.objects.count() == 4
+
+
+@pytest.mark.django_db
+class TestVisibilityChanges:
+    def grants(self, s3, key):
+        return {
+            grant["Permission"]
+            for grant in s3.get_object_acl(Bucket="test-bucket", Key=key)["Grants"]
+        }
+
+    @pytest.mark.parametrize("auth_token", ["superuser"], indirect=True)
+    def test_shared_location_changes_the_acl(self, client: Client, auth_token, s3):
+        s3.put_object(Bucket="test-bucket", Key="media/doc.pdf", Body=b"x", ACL="public-read")
+        file = File.objects.create(
+            name="doc.pdf", content_type="application/pdf", size=1, location="/doc.pdf"
+        )
+
+        response = client.put(
+            f"/api/files/{file.id}",
+            {"visibility": "private"},
+            content_type="application/json",
+            headers={"Authorization": f"Bearer {auth_token}"},
+        )
+        assert response.status_code == 200
+        assert response.json()["visibility"] == "private"
+        assert "READ" not in self.grants(s3, "media/doc.pdf")
+
+    @pytest.mark.parametrize("auth_token", ["superuser"], indirect=True)
+    def test_batch_copies_between_locations(
+        self, client: Client, auth_token, s3, monkeypatch, django_capture_on_commit_callbacks
+    ):
+        monkeypatch.setattr(PrivateStorage, "location", "private")
+        files = []
+        for name in ("a.pdf", "b.pdf"):
+            s3.put_object(Bucket="test-bucket", Key=f"private/{name}", Body=name.encode())
+            files.append(
+                File.objects.create(
+                    name=name,
+                    content_type="application/pdf",
+                    size=5,
+                    location=f"/{name}",
+                    visibility="private",
+                )
+            )
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = client.put(
+                "/api/files/visibility",
+                {"ids": [file.id for file in files], "visibility": "public"},
+                content_type="application/json",
+                headers={"Authorization": f"Bearer {auth_token}"},
+            )
+        assert response.status_code == 200
+        assert {f["visibility"] for f in response.json()} == {"public"}
+        keys = [obj["Key"] for obj in s3.list_objects_v2(Bucket="test-bucket")["Contents"]]
+        assert keys == ["media/a.pdf", "media/b.pdf"]
+        assert s3.get_object(Bucket="test-bucket", Key="media/a.pdf")["Body"].read() == b"a.pdf"
+        assert "READ" in self.grants(s3, "media/a.pdf")
+
+
+@pytest.mark.django_db
+class TestBulkDelete:
+    @pytest.mark.parametrize("auth_token", ["superuser"], indirect=True)
+    def test_deletes_files_and_orphans(self, client: Client, auth_token, s3):
+        for key in ("media/a.pdf", "media/a.480w.webp", "media/orphan.txt", "media/kept.pdf"):
+            s3.put_object(Bucket="test-bucket", Key=key, Body=b"x")
+        file = File.objects.create(
+            name="a.pdf", content_type="application/pdf", size=1, location="/a.pdf"
+        )
+        FileDerivative.objects.create(
+            file=file,
+            name="a.480w.webp",
+            location="/a.480w.webp",
+            content_type="image/webp",
+            width=480,
+            height=480,
+            size=1,
+        )
+        kept = File.objects.create(
+            name="kept.pdf", content_type="application/pdf", size=1, location="/kept.pdf"
+        )
+
+        response = client.post(
+            "/api/files/delete",
+            {
+                "ids": [file.id],
+                "orphans": [
+                    {"name": "orphan.txt", "visibility": "public"},
+                    {"name": "kept.pdf", "visibility": "public"},
+                ],
+            },
+            content_type="application/json",
+            headers={"Authorization": f"Bearer {auth_token}"},
+        )
+        assert response.status_code == 200
+        assert response.json()["files"] == [file.id]
+        assert response.json()["objects"] == 3
+        assert [f["name"] for f in response.json()["failures"]] == ["kept.pdf"]
+        assert list(File.objects.all()) == [kept]
+        assert not FileDerivative.objects.exists()
+        keys = [obj["Key"] for obj in s3.list_objects_v2(Bucket="test-bucket")["Contents"]]
+        assert keys == ["media/kept.pdf"]
+
+    def test_objects_are_deleted_in_batches(self, s3):
+        stats.reset()
+        for index in range(5):
+            s3.put_object(Bucket="test-bucket", Key=f"media/{index}.txt", Body=b"x")
+
+        names = [f"{index}.txt" for index in range(5)]
+        assert delete_objects(storage_for("public"), names, batch_size=2) == []
+        assert stats.snapshot()["calls"]["DeleteObjects"]["count"] == 3
+        assert s3.list_objects_v2(Bucket="test-bucket")["KeyCount"] == 0
+
+
+@pytest.mark.django_db
+class TestPrivateDownloads:
+    @pytest.fixture
+    def private_file(self, s3):
+        presign.signed_urls.clear()
+        s3.put_object(Bucket="test-bucket", Key="media/report.pdf", Body=b"0123456789")
+        return File.objects.create(
+            name="report.pdf",
+            content_type="application/pdf",
+            size=10,
+            location="/report.pdf",
+            visibility="private",
+        )
+
+    @pytest.mark.parametrize("auth_token", ["superuser"], indirect=True)
+    def test_presigned_urls_are_reused(self, client: Client, auth_token, private_file):
+        headers = {"Authorization": f"Bearer {auth_token}"}
+        first = client.get(f"/api/files/{private_file.id}/download", headers=headers).json()
+        assert "Signature=" in first["url"]
+        assert first["expires_at"]
+        second = client.get(f"/api/files/{private_file.id}/download", headers=headers).json()
+        assert second == first
+
+    @pytest.mark.parametrize("auth_token", ["regular_user"], indirect=True)
+    def test_readers_download_files_of_published_posts(
+        self, client: Client, auth_token, private_file, post
+    ):
+        headers = {"Authorization": f"Bearer {auth_token}"}
+        url = f"/api/files/{private_file.id}/download"
+        assert client.get(url, headers=headers).status_code == 404
+        assert client.get(url).status_code == 403
+
+        private_file.posts.add(post)
+        assert client.get(url, headers=headers).status_code == 200
+
+    @pytest.mark.parametrize("auth_token", ["superuser"], indirect=True)
+    def test_streams_ranges(self, client: Client, auth_token, private_file):
+        headers = {"Authorization": f"Bearer {auth_token}"}
+        url = f"/api/files/{private_file.id}/content"
+
+        response = client.get(url, headers=headers)
+        assert response.status_code == 200
+        assert b"".join(response.streaming_content) == b"0123456789"
+        assert response["Accept-Ranges"] == "bytes"
+
+        response = client.get(url, headers={**headers, "Range": "bytes=2-4"})
+        assert response.status_code == 206
+        assert response["Content-Range"] == "bytes 2-4/10"
+        assert b"".join(response.streaming_content) == b"234"
+
+        response = client.get(url, headers={**headers, "Range": "bytes=20-"})
+        assert response.status_code == 416
+        assert response["Content-Range"] == "bytes */10"
+
+    @pytest.mark.parametrize("auth_token", ["superuser"], indirect=True)
+    def test_hands_off_to_nginx(self, client: Client, auth_token, private_file, monkeypatch):
+        monkeypatch.setattr(download, "ACCEL_REDIRECT_PREFIX", "/_s3/")
+        response = client.get(
+            f"/api/files/{private_file.id}/content",
+            headers={"Authorization": f"Bearer {auth_token}"},
+        )
+        assert response.status_code == 200
+        target = response["X-Accel-Redirect"]
+        assert target.startswith("/_s3/https/")
+        assert "/media/report.pdf?" in target
+        assert not response.content
+
+    @pytest.mark.parametrize("auth_token", ["superuser"], indirect=True)
+    @pytest.mark.parametrize("accel", [True, False])
+    def test_storage_errors_are_bad_gateway(
+        self, client: Client, auth_token, private_file, monkeypatch, accel
+    ):
+        monkeypatch.setattr(download, "ACCEL_REDIRECT_PREFIX", "/_s3/" if accel else "")
+        presign.signed_urls.clear()
+
+        def fail(*args, **kwargs):
+            raise EndpointConnectionError(endpoint_url="https://storage.invalid")
+
+        s3_client = storage_for("private").connection.meta.client
+        monkeypatch.setattr(s3_client, "generate_presigned_url", fail)
+        monkeypatch.setattr(s3_client, "get_object", fail)
+        response = client.get(
+            f"/api/files/{private_file.id}/content",
+            headers={"Authorization": f"Bearer {auth_token}"},
+        )
+        assert response.status_code == 502
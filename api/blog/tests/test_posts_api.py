@@ -14,6 +14,114 @@ class TestPostsAPI:
         data = response.json()
         assert "items" in data or isinstance(data, list)
 
+    def test_list_posts_returns_excerpt_not_content(self, client: Client, post):
+        post.content = "# Heading\n\nSome **bold** text with a [link](https://example.com)."
+        post.save()
+
+        response = client.get("/api/posts/")
+        item = response.json()["items"][0]
+        assert "content" not in item
+        assert item["excerpt"] == "Heading Some bold text with a link."
+        assert item["word_count"] == 7
+        assert item["reading_time"] == 1
+
+    def test_migration_backfills_summaries(self, post):
+        import importlib
+
+        from django.apps import apps
+
+        migration = importlib.import_module(
+            "blog.migrations.0011_post_excerpt_post_reading_time_post_word_count"
+        )
+        Post.objects.filter(id=post.id).update(
+            content="# Heading\n\nSome **bold** text.", excerpt="", word_count=0, reading_time=0
+        )
+        migration.backfill_summaries(apps, None)
+        post.refresh_from_db()
+        assert (post.excerpt, post.word_count, post.reading_time) == (
+            "Heading Some bold text.",
+            4,
+            1,
+        )
+
+    def test_migration_backfills_search_vectors(self, client: Client, post):
+        import importlib
+
+        from django.apps import apps
+
+        migration = importlib.import_module(
+            "blog.migrations.0013_post_search_vector_post_blog_post_search__528e75_gin"
+        )
+        Post.objects.filter(id=post.id).update(search_vector=None)
+        migration.backfill_search_vectors(apps, None)
+
+        response = client.get("/api/posts/search", {"q": "test"})
+        assert [item["id"] for item in response.json()["items"]] == [post.id]
+
+    def test_content_rendered_on_save(self, client: Client, post):
+        post.content = "## Setup\n\n```python\nprint('hi')\n```"
+        post.save()
+        rendered_hash = post.content_hash
+
+        data = client.get(f"/api/posts/{post.id}").json()
+        assert 'id="setup"' in data["content_html"]
+        assert 'class="highlight"' in data["content_html"]
+
+        post.title = "Retitled"
+        post.save()
+        assert post.content_hash == rendered_hash
+        assert post.render_content() is False
+
+    def test_render_posts_command(self, post):
+        from django.core.management import call_command
+
+        Post.objects.filter(id=post.id).update(content_html="", content_hash="")
+        call_command("render_posts", workers=1)
+        post.refresh_from_db()
+        assert post.content_html == "<p>Test content</p>"
+
+    def test_migration_backfills_content_html(self, post):
+        import importlib
+
+        from django.apps import apps
+
+        migration = importlib.import_module(
+            "blog.migrations.0012_post_content_hash_post_content_html"
+        )
+        Post.objects.filter(id=post.id).update(content_html="", content_hash="")
+        migration.backfill_content_html(apps, None)
+        post.refresh_from_db()
+        assert post.content_html == "<p>Test content</p>"
+        assert post.content_hash
+
+    def test_comment_count_counts_visible_comments(
+        self, client: Client, post, regular_user, django_assert_num_queries
+    ):
+        from blog.models import Comment
+
+        Comment.objects.create(post=post, author=regular_user, content="shown")
+        hidden = Comment.objects.create(post=post, author=regular_user, content="hidden")
+        hidden.visible = False
+        hidden.save()
+        other = Post.objects.create(
+            title="Other",
+            slug="other",
+            author=regular_user,
+            content="x",
+            published_at=post.published_at,
+        )
+
+        # a page costs one query for the rows and one for the count, however many posts it holds
+        with django_assert_num_queries(2):
+            items = client.get("/api/posts/").json()["items"]
+        counts = {item["id"]: item["comment_count"] for item in items}
+        assert counts == {post.id: 1, other.id: 0}
+
+        url = f"/api/posts/slug/{post.published_at.year}/{post.slug}"
+        assert client.get(url).json()["comment_count"] == 1
+        Comment.objects.create(post=post, author=regular_user, content="another")
+        assert client.get(url).json()["comment_count"] == 2
+
     @pytest.mark.parametrize("auth_token", ["superuser"], indirect=True)
     def test_create_post_staff(self, client: Client, auth_token: str, superuser):
         payload = {
@@ -50,6 +158,31 @@ class TestPostsAPI:
         assert data["id"] == post.id
         assert data["title"] == post.title
 
+    def test_get_post_by_slug_is_cached(self, client: Client, post, django_assert_num_queries):
+        url = f"/api/posts/slug/{post.published_at.year}/{post.slug}"
+        first = client.get(url)
+        assert first.status_code == 200
+
+        with django_assert_num_queries(0):
+            second = client.get(url)
+        assert second.status_code == 200
+        assert second.json() == first.json()
+
+    def test_get_post_by_slug_cache_invalidated_on_save(self, client: Client, post, series):
+        url = f"/api/posts/slug/{post.published_at.year}/{post.slug}"
+        client.get(url)
+
+        post.title = "Edited Title"
+        post.save()
+        assert client.get(url).json()["title"] == "Edited Title"
+
+        series.title = "Renamed Series"
+        series.save()
+        assert client.get(url).json()["series"]["title"] == "Renamed Series"
+
+        post.delete()
+        assert client.get(url).status_code == 404
+
     @pytest.mark.parametrize("auth_token", ["superuser"], indirect=True)
     def test_update_post_staff(self, client: Client, auth_token: str, post, superuser):
         # Make the post author the superuser for update
@@ -178,3 +311,64 @@ class TestPostsAPI:
         items = data["items"] if "items" in data else data
         # Should be ordered by updated_at (oldest first)
         assert [item["title"] for item in items] == ["Draft A", "Draft B", "Draft C"]
+
+    def test_list_posts_cursor_pagination(self, client: Client, regular_user):
+        import datetime
+
+        from django.utils import timezone
+
+        now = timezone.now()
+        for i in range(5):
+            Post.objects.create(
+                title=f"Post {i}",
+                slug=f"post-{i}",
+                author=regular_user,
+                content="content",
+                published_at=now - datetime.timedelta(days=i),
+            )
+
+        response = client.get("/api/posts/?limit=2&with_count=false")
+        data = response.json()
+        assert data["count"] is None
+        titles = [item["title"] for item in data["items"]]
+
+        while data["next_cursor"]:
+            response = client.get(f"/api/posts/?limit=2&cursor={data['next_cursor']}")
+            assert response.status_code == 200
+            data = response.json()
+            titles += [item["title"] for item in data["items"]]
+
+        assert data["count"] == 5
+        assert titles == [f"Post {i}" for i in range(5)]
+
+    def test_list_posts_invalid_cursor(self, client: Client, post):
+        response = client.get("/api/posts/?cursor=not-a-cursor")
+        assert response.status_code == 400
+
+    def test_search_posts_ranks_title_matches_first(self, client: Client, regular_user):
+        from django.utils import timezone
+
+        body_match = Post.objects.create(
+            title="Weekend notes",
+            author=regular_user,
+            content="Some thoughts about gardening and compost.",
+            published_at=timezone.now(),
+        )
+        title_match = Post.objects.create(
+            title="Gardening for beginners",
+            author=regular_user,
+            content="Start small.",
+            published_at=timezone.now(),
+        )
+        Post.objects.create(title="Gardening draft", author=regular_user, content="wip")
+
+        response = client.get("/api/posts/search?q=gardening&limit=1")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] == 2
+        assert [item["id"] for item in data["items"]] == [title_match.id]
+
+        response = client.get(f"/api/posts/search?q=gardening&cursor={data['next_cursor']}")
+        item = response.json()["items"][0]
+        assert item["id"] == body_match.id
+        assert "<mark>gardening</mark>" in item["headline"]
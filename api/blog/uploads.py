@@ -0,0 +1,257 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import BinaryIO, List, Optional, Tuple
+
+import structlog
+from botocore.exceptions import ClientError
+from django.db import connection, transaction
+from django.utils import timezone
+from ninja.errors import HttpError
+
+from files import multipart
+from files.hashing import sha256_object
+from files.storage import storage_for
+
+from . import derivatives
+from .models import File, UploadPart, UploadSession
+
+logger = structlog.get_logger(__name__)
+
+# sessions without a new part for this long are aborted along with their stored parts
+UPLOAD_SESSION_TTL = timedelta(days=1)
+# a session left completing for this long is from an attempt that died; it may be completed again
+COMPLETE_TIMEOUT = timedelta(minutes=15)
+
+# one object at a time: hashing streams the whole object back from storage
+_hashing = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hashing")
+
+
+def reuse_duplicate(
+    visibility: str, sha256: Optional[str], posts: Optional[List[int]] = None
+) -> Optional[File]:
+    """
+    The existing file with identical content and visibility, if any, associated with `posts`
+    as well. Uploads of content we already store return it instead of storing a copy.
+    """
+    if not sha256:
+        return None
+    file = File.objects.filter(visibility=visibility, sha256=sha256).order_by("id").first()
+    if file and posts:
+        file.posts.add(*posts)
+    return file
+
+
+def hash_file(file_id: int) -> Optional[str]:
+    """
+    Stream the object of a file stored without a hash and record its SHA-256, so later
+    uploads of the same content reuse it. Returns the digest, or None if already hashed.
+    """
+    file = File.objects.filter(id=file_id, sha256="").only("id", "name", "visibility").first()
+    if file is None:
+        return None
+    digest = sha256_object(storage_for(file.visibility), file.name)
+    File.objects.filter(id=file.id, sha256="").update(sha256=digest)
+    return digest
+
+
+def schedule_hash(file: File) -> None:
+    """Hash the file in the background once the current transaction commits, if it has none."""
+    if not file.sha256:
+        transaction.on_commit(lambda: _hashing.submit(_hash_in_background, file.id))
+
+
+def _hash_in_background(file_id: int) -> None:
+    try:
+        hash_file(file_id)
+    except Exception as err:
+        logger.error("Error hashing file", error=err, file=file_id)
+    finally:
+        # the thread's own database connection
+        connection.close()
+
+
+def start_session(
+    owner,
+    name: str,
+    content_type: str,
+    visibility: str,
+    size: Optional[int] = None,
+    posts: Optional[List[int]] = None,
+) -> UploadSession:
+    """Reserve a storage name and start the multipart upload behind a new session."""
+    if size is not None and size > multipart.MAX_PART_SIZE * multipart.MAX_PARTS:
+        raise HttpError(400, "File is too large")
+    storage = storage_for(visibility)
+    name = storage.get_available_name(storage.generate_filename(name))
+    return UploadSession.objects.create(
+        owner=owner,
+        name=name,
+        content_type=content_type,
+        visibility=visibility,
+        size=size,
+        post_ids=posts or [],
+        upload_id=multipart.create(storage, name, content_type),
+    )
+
+
+def append_part(session: UploadSession, number: int, body: BinaryIO, size: int) -> UploadPart:
+    """
+    Stream part `number` of the upload, `size` bytes read from `body`, to storage. Re-sending a
+    part replaces it, so a client resumes by sending whatever parts the session does not list yet.
+    """
+    if session.file_id or session.state != "open":
+        raise HttpError(409, "Upload is already complete")
+    if not 1 <= number <= multipart.MAX_PARTS:
+        raise HttpError(400, f"Part number must be between 1 and {multipart.MAX_PARTS}")
+    if not size:
+        raise HttpError(400, "Part is empty")
+    if size > multipart.MAX_PART_SIZE:
+        raise HttpError(413, f"Parts may be at most {multipart.MAX_PART_SIZE} bytes")
+
+    etag = multipart.upload_part(
+        storage_for(session.visibility), session.name, session.upload_id, number, body, size
+    )
+    with transaction.atomic():
+        # completing lists the parts once it has claimed the session; parts arriving later are late
+        if not UploadSession.objects.filter(pk=session.pk, state="open").update(
+            updated_at=timezone.now()
+        ):
+            raise HttpError(409, "Upload is already complete")
+        part, _ = UploadPart.objects.update_or_create(
+            session=session, number=number, defaults={"size": size, "etag": etag}
+        )
+    return part
+
+
+def complete_session(session: UploadSession) -> File:
+    """
+    Assemble the parts into the object and create its `File`. Completing twice is a no-op.
+
+    The session is claimed in one short transaction, storage assembles the parts outside of it,
+    and the `File` is created in a second one. If that fails the object is already assembled and
+    completing again only creates the row.
+    """
+    session, size = _claim(session)
+    if session.file_id:
+        return session.file
+
+    if session.state == "completing":
+        storage = storage_for(session.visibility)
+        parts = session.parts.values_list("number", "etag")
+        try:
+            multipart.complete(storage, session.name, session.upload_id, list(parts))
+        except ClientError as err:
+            # a previous attempt assembled the object and stopped before recording it
+            code = err.response.get("Error", {}).get("Code")
+            if code != "NoSuchUpload" or not storage.exists(session.name):
+                _release(session)
+                raise
+        except Exception:
+            _release(session)
+            raise
+        UploadSession.objects.filter(pk=session.pk).update(
+            state="assembled", updated_at=timezone.now()
+        )
+
+    with transaction.atomic():
+        session = UploadSession.objects.select_for_update().get(pk=session.pk)
+        if session.file_id:
+            return session.file
+        file = File.objects.create(
+            location=storage_for(session.visibility).url(session.name),
+            name=session.name,
+            content_type=session.content_type,
+            size=size,
+            visibility=session.visibility,
+        )
+        if session.post_ids:
+            file.posts.set(session.post_ids)
+        session.file = file
+        session.save(update_fields=["file", "updated_at"])
+        derivatives.schedule(file)
+        schedule_hash(file)
+    return file
+
+
+def _claim(session: UploadSession) -> Tuple[UploadSession, int]:
+    """Check the parts and mark the session as completing. Returns it with the total size."""
+    with transaction.atomic():
+        session = UploadSession.objects.select_for_update().get(pk=session.pk)
+        if session.file_id:
+            return session, session.file.size
+        if _completing(session):
+            raise HttpError(409, "Upload is already being completed")
+
+        parts = list(session.parts.all())
+        if not parts:
+            raise HttpError(400, "No parts have been uploaded")
+        if any(part.size < multipart.MIN_PART_SIZE for part in parts[:-1]):
+            raise HttpError(400, "Every part but the last must be at least 5 MiB")
+        size = sum(part.size for part in parts)
+        if session.size is not None and size != session.size:
+            raise HttpError(400, f"Received {size} of {session.size} bytes")
+
+        if session.state != "assembled":
+            # a stale claim is from an attempt that died before storage answered
+            session.state = "completing"
+            session.save(update_fields=["state", "updated_at"])
+    return session, size
+
+
+def _completing(session: UploadSession) -> bool:
+    """Whether another attempt is assembling the session's parts right now."""
+    return session.state == "completing" and session.updated_at > timezone.now() - COMPLETE_TIMEOUT
+
+
+def _release(session: UploadSession) -> None:
+    """Let a session whose parts storage failed to assemble take parts and be completed again."""
+    UploadSession.objects.filter(pk=session.pk, state="completing").update(
+        state="open", updated_at=timezone.now()
+    )
+
+
+def abort_session(session: UploadSession) -> None:
+    """Discard an unfinished upload and its stored parts, or its object if already assembled."""
+    if not session.file_id:
+        if _completing(session):
+            raise HttpError(409, "Upload is being completed")
+        storage = storage_for(session.visibility)
+        if session.state == "assembled":
+            storage.delete(session.name)
+        else:
+            try:
+                multipart.abort(storage, session.name, session.upload_id)
+            except ClientError as err:
+                # already aborted or completed on the storage side
+                if err.response.get("Error", {}).get("Code") != "NoSuchUpload":
+                    raise
+    session.delete()
+
+
+def collect_abandoned_uploads(now: Optional[datetime] = None) -> int:
+    """
+    Abort sessions idle for longer than `UPLOAD_SESSION_TTL`, drop finished sessions as old,
+    and abort multipart uploads older than that which no session knows about (e.g. when the
+    session could not be saved). Returns the number of uploads aborted.
+    """
+    cutoff = (now or timezone.now()) - UPLOAD_SESSION_TTL
+    aborted = 0
+    for session in UploadSession.objects.filter(updated_at__lt=cutoff):
+        if not session.file_id:
+            aborted += 1
+        abort_session(session)
+
+    known = set(UploadSession.objects.values_list("upload_id", flat=True))
+    seen = set()
+    for storage in (storage_for("public"), storage_for("private")):
+        for name, upload_id, initiated in multipart.iter_uploads(storage):
+            # public and private storage usually share a bucket and list the same uploads
+            if upload_id in known or upload_id in seen or initiated >= cutoff:
+                continue
+            seen.add(upload_id)
+            multipart.abort(storage, name, upload_id)
+            aborted += 1
+
+    if aborted:
+        logger.info("Aborted abandoned uploads", count=aborted)
+    return aborted
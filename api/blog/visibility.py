@@ -0,0 +1,74 @@
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Sequence
+
+import structlog
+from django.db import transaction
+
+from files.copy import move_object
+from files.delete import delete_objects
+from files.storage import same_location, storage_for
+
+from .models import File, FileDerivative
+
+logger = structlog.get_logger(__name__)
+
+# objects moved concurrently; each move is a server-side request, so this bounds S3 load
+MOVE_WORKERS = 8
+
+
+def change_visibility(files: Sequence[File], visibility: str) -> List[File]:
+    """
+    Move files, and their derivatives, to the storage of `visibility` without their bytes
+    passing through this process. Objects are copied server side (or only re-ACLed when both
+    storages share a location), the rows are updated in one transaction, and the old objects
+    are deleted once it commits. Returns the files in their new state.
+    """
+    moving = [file for file in files if file.visibility != visibility]
+    if not moving:
+        return list(files)
+
+    def move(item):
+        source_visibility, name = item
+        return move_object(storage_for(source_visibility), name, storage_for(visibility))
+
+    derivatives = list(FileDerivative.objects.filter(file__in=moving).select_related("file"))
+    objects = [(file.visibility, file.name) for file in moving] + [
+        (derivative.file.visibility, derivative.name) for derivative in derivatives
+    ]
+    with ThreadPoolExecutor(max_workers=MOVE_WORKERS) as pool:
+        names = list(pool.map(move, objects))
+
+    target = storage_for(visibility)
+    stale = [
+        (source_visibility, name)
+        for source_visibility, name in objects
+        if not same_location(storage_for(source_visibility), target)
+    ]
+    for instance, name in zip([*moving, *derivatives], names, strict=True):
+        instance.name = name
+        instance.location = target.url(name)
+    for file in moving:
+        file.visibility = visibility
+
+    with transaction.atomic():
+        File.objects.bulk_update(moving, ["name", "location", "visibility"])
+        FileDerivative.objects.bulk_update(derivatives, ["name", "location"])
+        transaction.on_commit(lambda: _delete_objects(stale))
+
+    logger.info("Changed file visibility", files=len(moving), visibility=visibility)
+    return list(files)
+
+
+def _delete_objects(objects) -> None:
+    by_visibility = defaultdict(list)
+    for source_visibility, name in objects:
+        by_visibility[source_visibility].append(name)
+    for source_visibility, names in by_visibility.items():
+        try:
+            failures = delete_objects(storage_for(source_visibility), names)
+        except Exception as err:
+            failures = [(name, "Error", str(err)) for name in names]
+        for name, code, message in failures:
+            # the reconciliation job reports it as orphaned
+            logger.error("Error deleting moved object", error=message, code=code, name=name)
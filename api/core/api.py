@@ -14,6 +14,7 @@ from ninja_jwt.tokens import RefreshToken
 from accounts.api import accounts_router
 from accounts.contenttypes import contenttypes_router
 from accounts.groups import groups_router, permissions_router
+from auth.middleware import forget_token
 from blog.api.comments import comments_router
 from blog.api.feed import feed_router
 from blog.api.files import files_router
@@ -62,6 +63,7 @@ def login(request, username: str, password: str):
 # --- Custom logout view that clears cookies ---
 @api.post("/auth/logout", operation_id="logout", tags=["auth"])
 def logout(request):
+    forget_token(request)
     response = JsonResponse({"success": True})
     response.delete_cookie("access_token")
     response.delete_cookie("refresh_token")
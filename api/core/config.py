@@ -25,6 +25,11 @@ class S3(BaseModel):
     endpoint_url: str = ""
     prefix: str = ""
     cdn_endpoint: str = ""
+    max_pool_connections: int = 32
+    max_attempts: int = 5
+    # Set (e.g. to "/_s3/") to hand private downloads to an internal nginx location that proxies
+    # the presigned URL appended to it, rather than streaming them through the API.
+    accel_redirect_prefix: str = ""
 
 
 class Database(BaseModel):
@@ -39,6 +44,13 @@ class CORS(BaseModel):
     allowed_origins: List[str] = ["*"]
 
 
+class Cache(BaseModel):
+    # An empty location keeps the per-process local memory cache. Point this at a shared
+    # backend (e.g. redis://) when running more than one worker so invalidation is global.
+    backend: str = "django.core.cache.backends.locmem.LocMemCache"
+    location: str = ""
+
+
 class Configuration(BaseSettings):
     model_config = SettingsConfigDict(
         # right side is preferred
@@ -54,6 +66,7 @@ class Configuration(BaseSettings):
     cors: CORS
     secret_key: str
     s3: Optional[S3] = S3()
+    cache: Cache = Cache()
 
 
 @lru_cache()
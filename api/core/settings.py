@@ -49,6 +49,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "corsheaders",
     "ninja",
     "ninja_extra",
@@ -79,6 +80,9 @@ NINJA_JWT = {
     "BLACKLIST_AFTER_ROTATION": True,
     "ROTATE_REFRESH_TOKENS": True,
     "USER_ID_FIELD": "id",
+    # check the blacklist in memory; see auth.blacklist
+    "TOKEN_OBTAIN_PAIR_REFRESH_INPUT_SCHEMA": "auth.schema.TokenRefreshInputSchema",
+    "TOKEN_VERIFY_INPUT_SCHEMA": "auth.schema.TokenVerifyInputSchema",
 }
 
 TEMPLATES = [
@@ -158,6 +162,12 @@ STORAGES = {
     },
 }
 
+# the default handlers, hashing uploads as they stream in for deduplication
+FILE_UPLOAD_HANDLERS = [
+    "files.handlers.SHA256MemoryFileUploadHandler",
+    "files.handlers.SHA256TemporaryFileUploadHandler",
+]
+
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.1/ref/settings/#default-auto-field
@@ -201,6 +211,13 @@ DATABASES = {
         "PORT": config.database.port,
     }
 }
+CACHES = {
+    "default": {
+        "BACKEND": config.cache.backend,
+        "LOCATION": config.cache.location,
+    }
+}
+
 if ENVIRONMENT == "prod":
     DATABASES["default"]["OPTIONS"] = (
         {
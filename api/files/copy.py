@@ -0,0 +1,35 @@
+from boto3.s3.transfer import TransferConfig
+from storages.backends.s3boto3 import S3Boto3Storage
+
+from .presign import object_key
+from .storage import same_location
+
+# objects above this are copied in parts of this size, several at a time, all server side
+COPY_CONFIG = TransferConfig(
+    multipart_threshold=64 * 1024 * 1024, multipart_chunksize=64 * 1024 * 1024, max_concurrency=4
+)
+
+
+def move_object(source: S3Boto3Storage, name: str, target: S3Boto3Storage) -> str:
+    """
+    Give the object the target storage's location and ACL without the bytes leaving S3, and
+    return its name in the target. When both storages share a location only the ACL changes;
+    otherwise the object is copied (with UploadPartCopy when large) and the caller deletes the
+    source once it no longer refers to it.
+    """
+    client = target.connection.meta.client
+    acl = target.default_acl or "private"
+    if same_location(source, target):
+        client.put_object_acl(Bucket=target.bucket_name, Key=object_key(target, name), ACL=acl)
+        return name
+
+    target_name = target.get_available_name(name)
+    client.copy(
+        {"Bucket": source.bucket_name, "Key": object_key(source, name)},
+        target.bucket_name,
+        object_key(target, target_name),
+        ExtraArgs={"ACL": acl, "MetadataDirective": "COPY"},
+        SourceClient=source.connection.meta.client,
+        Config=COPY_CONFIG,
+    )
+    return target_name
@@ -0,0 +1,37 @@
+from typing import Iterable, List, Tuple
+
+from storages.backends.s3boto3 import S3Boto3Storage
+
+from .presign import object_key
+from .scan import storage_prefix
+
+# the most keys a single DeleteObjects request accepts
+DELETE_BATCH_SIZE = 1000
+
+
+def delete_objects(
+    storage: S3Boto3Storage, names: Iterable[str], batch_size: int = DELETE_BATCH_SIZE
+) -> List[Tuple[str, str, str]]:
+    """
+    Delete objects from `storage` with DeleteObjects, `batch_size` keys per request. Missing
+    objects count as deleted. Returns (name, code, message) for each object S3 refused to delete.
+    """
+    client = storage.connection.meta.client
+    prefix = storage_prefix(storage)
+    names = list(dict.fromkeys(names))
+    failures = []
+    for start in range(0, len(names), batch_size):
+        batch = names[start : start + batch_size]
+        response = client.delete_objects(
+            Bucket=storage.bucket_name,
+            Delete={
+                "Objects": [{"Key": object_key(storage, name)} for name in batch],
+                # only failures are listed in the response
+                "Quiet": True,
+            },
+        )
+        failures.extend(
+            (error["Key"][len(prefix) :], error.get("Code", ""), error.get("Message", ""))
+            for error in response.get("Errors", [])
+        )
+    return failures
@@ -0,0 +1,67 @@
+import re
+from typing import Iterator, Optional
+from urllib.parse import urlsplit
+
+from storages.backends.s3boto3 import S3Boto3Storage
+
+from core.config import get_config
+
+from .presign import object_key
+
+config = get_config()
+
+# hand downloads to nginx with X-Accel-Redirect when set; see accel_redirect
+ACCEL_REDIRECT_PREFIX = config.s3.accel_redirect_prefix
+# bytes read from storage and written to the client at a time
+CHUNK_SIZE = 64 * 1024
+
+# a single range; clients asking for several get the whole object, as HTTP allows
+_BYTE_RANGE = re.compile(r"^bytes=(\d+-\d*|-\d+)$")
+
+
+def byte_range(header: Optional[str]) -> Optional[str]:
+    """The `Range` header to forward to storage, or None to fetch the whole object."""
+    if not header:
+        return None
+    header = header.replace(" ", "")
+    return header if _BYTE_RANGE.match(header) else None
+
+
+def get_object(storage: S3Boto3Storage, name: str, range_header: Optional[str] = None) -> dict:
+    """
+    The GetObject response for the object, limited to the byte range of `range_header` if it
+    holds a single one. Raises ClientError with code InvalidRange when it cannot be satisfied.
+    """
+    params = {"Bucket": storage.bucket_name, "Key": object_key(storage, name)}
+    requested = byte_range(range_header)
+    if requested:
+        params["Range"] = requested
+    return storage.connection.meta.client.get_object(**params)
+
+
+def iter_body(body, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Relay a streaming body chunk by chunk as it arrives from storage, so a download of any size
+    holds one chunk in memory. The connection goes back to the pool once the body is consumed
+    or the client goes away.
+    """
+    try:
+        yield from body.iter_chunks(chunk_size)
+    finally:
+        body.close()
+
+
+def accel_redirect(url: str, prefix: str) -> str:
+    """
+    The `X-Accel-Redirect` target handing a presigned URL to nginx, which then fetches and
+    serves the object itself (Range requests included). It expects an internal location like
+
+        location ~ ^/_s3/(https?)/([^/]+)/(.*)$ {
+            internal;
+            proxy_pass $1://$2/$3$is_args$args;
+        }
+
+    with `prefix` "/_s3/".
+    """
+    parts = urlsplit(url)
+    return f"{prefix.rstrip('/')}/{parts.scheme}/{parts.netloc}{parts.path}?{parts.query}"
@@ -0,0 +1,36 @@
+import hashlib
+
+from django.core.files.uploadhandler import MemoryFileUploadHandler, TemporaryFileUploadHandler
+
+
+class SHA256Mixin:
+    """
+    Hashes each uploaded file as its chunks arrive and sets the hex digest as `sha256` on the
+    resulting uploaded file, so it never has to be read back to be hashed.
+    """
+
+    def new_file(self, *args, **kwargs):
+        # before super(): a handler that takes the file raises StopFutureHandlers
+        self.sha256 = hashlib.sha256()
+        super().new_file(*args, **kwargs)
+
+    def receive_data_chunk(self, raw_data, start):
+        passed_on = super().receive_data_chunk(raw_data, start)
+        # only the handler that keeps the data hashes it
+        if passed_on is None:
+            self.sha256.update(raw_data)
+        return passed_on
+
+    def file_complete(self, file_size):
+        file = super().file_complete(file_size)
+        if file is not None:
+            file.sha256 = self.sha256.hexdigest()
+        return file
+
+
+class SHA256MemoryFileUploadHandler(SHA256Mixin, MemoryFileUploadHandler):
+    pass
+
+
+class SHA256TemporaryFileUploadHandler(SHA256Mixin, TemporaryFileUploadHandler):
+    pass
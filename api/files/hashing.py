@@ -0,0 +1,23 @@
+import hashlib
+from typing import Iterable
+
+from storages.backends.s3boto3 import S3Boto3Storage
+
+from .presign import object_key
+
+CHUNK_SIZE = 1024 * 1024
+
+
+def sha256_chunks(chunks: Iterable[bytes]) -> str:
+    digest = hashlib.sha256()
+    for chunk in chunks:
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def sha256_object(storage: S3Boto3Storage, name: str) -> str:
+    """Hash a stored object by streaming it, without holding it in memory."""
+    response = storage.connection.meta.client.get_object(
+        Bucket=storage.bucket_name, Key=object_key(storage, name)
+    )
+    return sha256_chunks(response["Body"].iter_chunks(CHUNK_SIZE))
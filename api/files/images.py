@@ -0,0 +1,40 @@
+from io import BytesIO
+from typing import Any, List, Sequence, Tuple
+
+from PIL import Image, ImageOps
+
+# widths offered in srcset; images are never scaled up, and their own width is always included
+DERIVATIVE_WIDTHS = (480, 960, 1600)
+DERIVATIVE_FORMATS = {"webp": "image/webp", "avif": "image/avif"}
+DERIVATIVE_QUALITY = 75
+# formats Pillow decodes that are worth re-encoding; SVGs and GIFs are served as they are
+SOURCE_CONTENT_TYPES = {"image/jpeg", "image/png", "image/webp"}
+
+
+def render_derivatives(
+    item: Tuple[Any, bytes],
+    widths: Sequence[int] = DERIVATIVE_WIDTHS,
+    formats: Sequence[str] = tuple(DERIVATIVE_FORMATS),
+) -> Tuple[Any, List[Tuple[int, int, str, bytes]]]:
+    """
+    Resize the image in `item` to each width in each format, as (width, height, format,
+    bytes). Takes and returns a key for use with `ProcessPoolExecutor.map`, and imports
+    nothing from Django so worker processes stay light.
+    """
+    key, data = item
+    derivatives = []
+    with Image.open(BytesIO(data)) as source:
+        image = ImageOps.exif_transpose(source)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+        sizes = sorted({width for width in widths if width < image.width} | {image.width})
+        for width in sizes:
+            height = max(1, round(image.height * width / image.width))
+            resized = image
+            if width != image.width:
+                resized = image.resize((width, height), Image.Resampling.LANCZOS)
+            for name in formats:
+                buffer = BytesIO()
+                resized.save(buffer, format=name.upper(), quality=DERIVATIVE_QUALITY)
+                derivatives.append((width, height, name, buffer.getvalue()))
+    return key, derivatives
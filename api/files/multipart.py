@@ -0,0 +1,72 @@
+from datetime import datetime
+from typing import BinaryIO, Iterator, List, Tuple
+
+from storages.backends.s3boto3 import S3Boto3Storage
+
+from .presign import object_key
+from .scan import storage_prefix
+
+# S3 rejects parts below 5 MiB, except the last one, and allows at most 10,000 parts
+MIN_PART_SIZE = 5 * 1024 * 1024
+MAX_PART_SIZE = 64 * 1024 * 1024
+MAX_PARTS = 10_000
+
+
+def create(storage: S3Boto3Storage, name: str, content_type: str) -> str:
+    """Start a multipart upload of `name` and return its upload id."""
+    params = {
+        "Bucket": storage.bucket_name,
+        "Key": object_key(storage, name),
+        "ContentType": content_type,
+    }
+    if storage.default_acl:
+        params["ACL"] = storage.default_acl
+    return storage.connection.meta.client.create_multipart_upload(**params)["UploadId"]
+
+
+def upload_part(
+    storage: S3Boto3Storage, name: str, upload_id: str, number: int, body: BinaryIO, size: int
+) -> str:
+    """
+    Stream `size` bytes of `body` into one part and return its ETag. Parts of one upload may be
+    sent concurrently.
+    """
+    response = storage.connection.meta.client.upload_part(
+        Bucket=storage.bucket_name,
+        Key=object_key(storage, name),
+        UploadId=upload_id,
+        PartNumber=number,
+        Body=body,
+        ContentLength=size,
+    )
+    return response["ETag"]
+
+
+def complete(
+    storage: S3Boto3Storage, name: str, upload_id: str, parts: List[Tuple[int, str]]
+) -> None:
+    """Assemble the (number, etag) parts into the object; S3 does this server side."""
+    storage.connection.meta.client.complete_multipart_upload(
+        Bucket=storage.bucket_name,
+        Key=object_key(storage, name),
+        UploadId=upload_id,
+        MultipartUpload={
+            "Parts": [{"PartNumber": number, "ETag": etag} for number, etag in sorted(parts)]
+        },
+    )
+
+
+def abort(storage: S3Boto3Storage, name: str, upload_id: str) -> None:
+    """Discard an upload and the parts stored for it so far."""
+    storage.connection.meta.client.abort_multipart_upload(
+        Bucket=storage.bucket_name, Key=object_key(storage, name), UploadId=upload_id
+    )
+
+
+def iter_uploads(storage: S3Boto3Storage) -> Iterator[Tuple[str, str, datetime]]:
+    """Yield (name, upload_id, initiated) for every unfinished upload under the storage location."""
+    prefix = storage_prefix(storage)
+    paginator = storage.connection.meta.client.get_paginator("list_multipart_uploads")
+    for page in paginator.paginate(Bucket=storage.bucket_name, Prefix=prefix):
+        for upload in page.get("Uploads", []):
+            yield upload["Key"][len(prefix) :], upload["UploadId"], upload["Initiated"]
@@ -0,0 +1,120 @@
+import base64
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+
+from botocore.exceptions import ClientError
+from storages.backends.s3boto3 import S3Boto3Storage
+
+from .scan import storage_prefix
+
+# how long a presigned upload URL may be used
+UPLOAD_URL_EXPIRY = 60 * 60
+# how long a presigned download URL may be used; cached URLs are handed out for half of it
+DOWNLOAD_URL_EXPIRY = 5 * 60
+# presigned download URLs kept per process
+DOWNLOAD_URL_CACHE_SIZE = 1024
+
+
+def object_key(storage: S3Boto3Storage, name: str) -> str:
+    """The full bucket key of a name relative to the storage location."""
+    return storage_prefix(storage) + name
+
+
+def presigned_put(
+    storage: S3Boto3Storage,
+    name: str,
+    content_type: str,
+    sha256: Optional[str] = None,
+    expires_in: int = UPLOAD_URL_EXPIRY,
+) -> Tuple[str, Dict[str, str]]:
+    """
+    A URL the client can PUT the object's bytes to directly, and the headers it must send with
+    them. The content type and the storage's ACL are part of the signature; given the hex
+    `sha256` of the content, storage also rejects bytes that do not match it.
+    """
+    params = {
+        "Bucket": storage.bucket_name,
+        "Key": object_key(storage, name),
+        "ContentType": content_type,
+    }
+    headers = {"Content-Type": content_type}
+    if storage.default_acl:
+        params["ACL"] = storage.default_acl
+        headers["x-amz-acl"] = storage.default_acl
+    if sha256:
+        checksum = base64.b64encode(bytes.fromhex(sha256)).decode()
+        params["ChecksumSHA256"] = checksum
+        headers["x-amz-checksum-sha256"] = checksum
+    url = storage.connection.meta.client.generate_presigned_url(
+        "put_object", Params=params, ExpiresIn=expires_in, HttpMethod="PUT"
+    )
+    return url, headers
+
+
+def head(storage: S3Boto3Storage, name: str) -> Optional[dict]:
+    """The object's HEAD response, or None if it does not exist."""
+    try:
+        return storage.connection.meta.client.head_object(
+            Bucket=storage.bucket_name, Key=object_key(storage, name)
+        )
+    except ClientError as err:
+        if err.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+            return None
+        raise
+
+
+class _SignedUrls:
+    """A bounded, thread-safe LRU of presigned URLs and the time they expire at."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._lock = threading.Lock()
+        self._urls: OrderedDict = OrderedDict()
+
+    def get(self, key: tuple, fresh_until: float) -> Optional[Tuple[str, float]]:
+        with self._lock:
+            entry = self._urls.get(key)
+            if entry is None or entry[1] < fresh_until:
+                return None
+            self._urls.move_to_end(key)
+            return entry
+
+    def put(self, key: tuple, url: str, expires: float) -> None:
+        with self._lock:
+            self._urls[key] = (url, expires)
+            self._urls.move_to_end(key)
+            while len(self._urls) > self.size:
+                self._urls.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._urls.clear()
+
+
+signed_urls = _SignedUrls(DOWNLOAD_URL_CACHE_SIZE)
+
+
+def presigned_get(
+    storage: S3Boto3Storage, name: str, expires_in: int = DOWNLOAD_URL_EXPIRY
+) -> Tuple[str, datetime]:
+    """
+    A URL anyone holding it can GET the object from until the returned time. Signing is reused:
+    a URL is handed out again while at least half of its lifetime is left, so repeated
+    downloads of the same object share a URL (and any cache keyed on it).
+    """
+    key = (storage.endpoint_url, storage.bucket_name, object_key(storage, name), expires_in)
+    now = time.time()
+    entry = signed_urls.get(key, fresh_until=now + expires_in / 2)
+    if entry is None:
+        url = storage.connection.meta.client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": storage.bucket_name, "Key": object_key(storage, name)},
+            ExpiresIn=expires_in,
+        )
+        entry = (url, now + expires_in)
+        signed_urls.put(key, *entry)
+    url, expires = entry
+    return url, datetime.fromtimestamp(expires, tz=timezone.utc)
@@ -0,0 +1,106 @@
+import mimetypes
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional
+
+from botocore.exceptions import ClientError
+from storages.backends.s3boto3 import S3Boto3Storage
+
+# S3 returns at most 1000 keys per ListObjectsV2 call
+LIST_PAGE_SIZE = 1000
+# concurrent HEAD requests per scan; boto3 clients are thread safe
+HEAD_WORKERS = 16
+
+
+@dataclass
+class StoredObject:
+    """An object in a storage bucket, named relative to the storage location."""
+
+    name: str
+    key: str
+    size: int
+    last_modified: Optional[datetime]
+    etag: str = ""
+    content_type: Optional[str] = None
+
+
+def storage_prefix(storage: S3Boto3Storage) -> str:
+    return storage.location.rstrip("/") + "/" if storage.location else ""
+
+
+def iter_object_pages(
+    storage: S3Boto3Storage, page_size: int = LIST_PAGE_SIZE, start_after: str = ""
+) -> Iterator[List[StoredObject]]:
+    """
+    Lazily page through every object under the storage location with ListObjectsV2, in key
+    order and resuming after the full key `start_after` if given. Only one page is held in
+    memory at a time.
+    """
+    prefix = storage_prefix(storage)
+    paginator = storage.connection.meta.client.get_paginator("list_objects_v2")
+    params = {"Bucket": storage.bucket_name, "Prefix": prefix}
+    if start_after:
+        params["StartAfter"] = start_after
+    pages = paginator.paginate(**params, PaginationConfig={"PageSize": page_size})
+    for page in pages:
+        objects = [
+            StoredObject(
+                name=obj["Key"][len(prefix) :],
+                key=obj["Key"],
+                size=obj["Size"],
+                last_modified=obj.get("LastModified"),
+                etag=obj.get("ETag", "").strip('"'),
+            )
+            for obj in page.get("Contents", [])
+            if obj["Key"] != prefix
+        ]
+        if objects:
+            yield objects
+
+
+def with_content_types(
+    storage: S3Boto3Storage,
+    objects: Iterable[StoredObject],
+    head: bool = True,
+    workers: int = HEAD_WORKERS,
+) -> Iterator[StoredObject]:
+    """
+    Fill in `content_type` for each object, in order, dropping objects deleted meanwhile.
+    Listings do not carry content types, so with `head` they are read with HEAD requests, at
+    most `workers` in flight at a time; without it they are guessed from the names and no
+    requests are made.
+    """
+    if not head:
+        for obj in objects:
+            obj.content_type = mimetypes.guess_type(obj.name)[0] or "application/octet-stream"
+            yield obj
+        return
+
+    client = storage.connection.meta.client
+
+    def fetch(obj: StoredObject) -> Optional[StoredObject]:
+        try:
+            response = client.head_object(Bucket=storage.bucket_name, Key=obj.key)
+        except ClientError as err:
+            # deleted between the listing and now
+            if err.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                return None
+            raise
+        obj.content_type = response.get("ContentType") or "application/octet-stream"
+        return obj
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for obj in objects:
+            pending.append(executor.submit(fetch, obj))
+            # bound the window so a huge listing does not queue every request up front
+            if len(pending) >= workers * 2:
+                result = pending.popleft().result()
+                if result is not None:
+                    yield result
+        while pending:
+            result = pending.popleft().result()
+            if result is not None:
+                yield result
@@ -1,11 +1,145 @@
+import threading
+import time
+from typing import Dict
+
+import structlog
+from botocore.config import Config
 from storages.backends.s3boto3 import S3Boto3Storage
 
 from core.config import get_config
 
 config = get_config()
+logger = structlog.get_logger(__name__)
+
+# shared by every client of the process; sized for the thread pools that scan and copy objects
+CLIENT_CONFIG = Config(
+    max_pool_connections=config.s3.max_pool_connections,
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=60,
+    retries={"max_attempts": config.s3.max_attempts, "mode": "standard"},
+)
+
+
+class StorageStats:
+    """Counts of boto3 clients created and per-operation S3 call latency, process wide."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.clients_created = 0
+            self.calls: Dict[str, Dict[str, float]] = {}
+
+    def client_created(self) -> None:
+        with self._lock:
+            self.clients_created += 1
+
+    def record(self, operation: str, seconds: float, failed: bool) -> None:
+        with self._lock:
+            calls = self.calls.setdefault(
+                operation, {"count": 0, "errors": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+            )
+            calls["count"] += 1
+            calls["errors"] += int(failed)
+            calls["total_seconds"] += seconds
+            calls["max_seconds"] = max(calls["max_seconds"], seconds)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "clients_created": self.clients_created,
+                "calls": {operation: dict(calls) for operation, calls in self.calls.items()},
+            }
+
+
+stats = StorageStats()
+
+
+def _start_timer(context, **kwargs) -> None:
+    context["started"] = time.perf_counter()
+
+
+def _record_call(context, event_name, http_response=None, **kwargs) -> None:
+    started = context.pop("started", None)
+    if started is None:
+        return
+    seconds = time.perf_counter() - started
+    # "after-call.s3.GetObject", or "after-call-error.s3.GetObject" when no response came back
+    operation = event_name.rsplit(".", 1)[-1]
+    failed = http_response is None or http_response.status_code >= 400
+    stats.record(operation, seconds, failed)
+    logger.debug("S3 call", operation=operation, duration_ms=round(seconds * 1000, 2))
+
 
+class PooledStorage(S3Boto3Storage):
+    """
+    An S3 storage safe to share between threads. Every thread uses one low-level client (botocore
+    clients are thread safe) with the tuned connection pool of `CLIENT_CONFIG`; only the boto3
+    resource and bucket, which are not thread safe, are kept per thread.
+    """
 
-class PublicStorage(S3Boto3Storage):
+    client_config = CLIENT_CONFIG
+
+    def __init__(self, **settings):
+        super().__init__(**settings)
+        self._lock = threading.Lock()
+        self._client = None
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state.pop("_lock", None)
+        state.pop("_client", None)
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        self._lock = threading.Lock()
+        self._client = None
+
+    @property
+    def client(self):
+        """The storage's S3 client, created on first use and shared by every thread."""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    client = self._create_session().client(
+                        "s3",
+                        region_name=self.region_name,
+                        use_ssl=self.use_ssl,
+                        endpoint_url=self.endpoint_url,
+                        config=self.client_config,
+                        verify=self.verify,
+                    )
+                    events = client.meta.events
+                    events.register("before-call.s3", _start_timer)
+                    events.register("after-call.s3", _record_call)
+                    events.register("after-call-error.s3", _record_call)
+                    stats.client_created()
+                    logger.info("Created S3 client", storage=type(self).__name__)
+                    self._client = client
+        return self._client
+
+    @property
+    def connection(self):
+        connection = getattr(self._connections, "connection", None)
+        if connection is None:
+            connection = super().connection
+            # the resource is per thread, the client (and its connection pool) is not
+            connection.meta.client = self.client
+        return connection
+
+    @property
+    def bucket(self):
+        bucket = getattr(self._connections, "bucket", None)
+        if bucket is None:
+            bucket = self._connections.bucket = self.connection.Bucket(self.bucket_name)
+        return bucket
+
+
+class PublicStorage(PooledStorage):
     access_key = config.s3.access_key_id
     secret_key = config.s3.secret_access_key
     bucket_name = config.s3.bucket_name
@@ -17,7 +151,7 @@ class PublicStorage(S3Boto3Storage):
     location = config.s3.prefix
 
 
-class PrivateStorage(S3Boto3Storage):
+class PrivateStorage(PooledStorage):
     access_key = config.s3.access_key_id
     secret_key = config.s3.secret_access_key
     bucket_name = config.s3.bucket_name
@@ -27,3 +161,34 @@ class PrivateStorage(S3Boto3Storage):
     file_overwrite = False
     custom_domain = config.s3.cdn_endpoint
     location = config.s3.prefix
+
+
+_storages: Dict[str, PooledStorage] = {}
+_storages_lock = threading.Lock()
+
+
+def storage_for(visibility: str) -> PooledStorage:
+    """The process-wide storage for a visibility, created on first use."""
+    storage = _storages.get(visibility)
+    if storage is None:
+        with _storages_lock:
+            storage = _storages.get(visibility)
+            if storage is None:
+                storage = PublicStorage() if visibility == "public" else PrivateStorage()
+                _storages[visibility] = storage
+    return storage
+
+
+def reset_storages() -> None:
+    """Drop the shared storages so the next use creates them from the current settings."""
+    with _storages_lock:
+        _storages.clear()
+
+
+def same_location(first: S3Boto3Storage, second: S3Boto3Storage) -> bool:
+    """Whether two storages keep objects under the same keys of the same bucket."""
+    return (first.endpoint_url, first.bucket_name, first.location) == (
+        second.endpoint_url,
+        second.bucket_name,
+        second.location,
+    )
@@ -20,6 +20,7 @@ import type {
   AuthError,
   NewAccount,
   PagedAdminUserDetails,
+  TokenRevocation,
   UpdateAccount,
   UserSelf,
 } from '../models/index';
@@ -34,6 +35,8 @@ import {
     NewAccountToJSON,
     PagedAdminUserDetailsFromJSON,
     PagedAdminUserDetailsToJSON,
+    TokenRevocationFromJSON,
+    TokenRevocationToJSON,
     UpdateAccountFromJSON,
     UpdateAccountToJSON,
     UserSelfFromJSON,
@@ -55,6 +58,10 @@ export interface ListUsersRequest {
     offset?: number;
 }
 
+export interface RevokeUserTokensRequest {
+    userId: number;
+}
+
 export interface SignUpRequest {
     newAccount: NewAccount;
 }
@@ -245,6 +252,85 @@ export class AccountsApi extends runtime.BaseAPI {
         return await response.value();
     }
 
+    /**
+     * Logs the calling user out everywhere by revoking all of their refresh tokens
+     * Revoke Self Tokens
+     */
+    async revokeSelfTokensRaw(initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<TokenRevocation>> {
+        const queryParameters: any = {};
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+        if (this.configuration && this.configuration.accessToken) {
+            const token = this.configuration.accessToken;
+            const tokenString = await token("JWTAuth", []);
+
+            if (tokenString) {
+                headerParameters["Authorization"] = `Bearer ${tokenString}`;
+            }
+        }
+        const response = await this.request({
+            path: `/api/accounts/me/revoke_tokens`,
+            method: 'POST',
+            headers: headerParameters,
+            query: queryParameters,
+        }, initOverrides);
+
+        return new runtime.JSONApiResponse(response, (jsonValue) => TokenRevocationFromJSON(jsonValue));
+    }
+
+    /**
+     * Logs the calling user out everywhere by revoking all of their refresh tokens
+     * Revoke Self Tokens
+     */
+    async revokeSelfTokens(initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<TokenRevocation> {
+        const response = await this.revokeSelfTokensRaw(initOverrides);
+        return await response.value();
+    }
+
+    /**
+     * Logs a user out everywhere by revoking all of their refresh tokens
+     * Revoke Tokens
+     */
+    async revokeUserTokensRaw(requestParameters: RevokeUserTokensRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<TokenRevocation>> {
+        if (requestParameters['userId'] == null) {
+            throw new runtime.RequiredError(
+                'userId',
+                'Required parameter "userId" was null or undefined when calling revokeUserTokens().'
+            );
+        }
+
+        const queryParameters: any = {};
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+        if (this.configuration && this.configuration.accessToken) {
+            const token = this.configuration.accessToken;
+            const tokenString = await token("JWTAuth", []);
+
+            if (tokenString) {
+                headerParameters["Authorization"] = `Bearer ${tokenString}`;
+            }
+        }
+        const response = await this.request({
+            path: `/api/accounts/{user_id}/revoke_tokens`.replace(`{${"user_id"}}`, encodeURIComponent(String(requestParameters['userId']))),
+            method: 'POST',
+            headers: headerParameters,
+            query: queryParameters,
+        }, initOverrides);
+
+        return new runtime.JSONApiResponse(response, (jsonValue) => TokenRevocationFromJSON(jsonValue));
+    }
+
+    /**
+     * Logs a user out everywhere by revoking all of their refresh tokens
+     * Revoke Tokens
+     */
+    async revokeUserTokens(requestParameters: RevokeUserTokensRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<TokenRevocation> {
+        const response = await this.revokeUserTokensRaw(requestParameters, initOverrides);
+        return await response.value();
+    }
+
     /**
      * Creates a new user
      * Sign Up
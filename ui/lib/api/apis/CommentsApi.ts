@@ -48,6 +48,8 @@ export interface ListCommentsRequest {
     topLevel?: boolean;
     limit?: number;
     offset?: number;
+    cursor?: string | null;
+    withCount?: boolean;
 }
 
 export interface UpdateCommentRequest {
@@ -190,7 +192,7 @@ export class CommentsApi extends runtime.BaseAPI {
     }
 
     /**
-     * List all comments for a post
+     * List all visible comments for a post, each with its visible replies nested below it. The whole thread is loaded in one query and assembled in memory. Without `post_id` (staff only) the visible top-level comments of every post are listed, paged in the database, with the replies of each page loaded alongside.
      * List Comments
      */
     async listCommentsRaw(requestParameters: ListCommentsRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<PagedCommentList>> {
@@ -212,6 +214,14 @@ export class CommentsApi extends runtime.BaseAPI {
             queryParameters['offset'] = requestParameters['offset'];
         }
 
+        if (requestParameters['cursor'] != null) {
+            queryParameters['cursor'] = requestParameters['cursor'];
+        }
+
+        if (requestParameters['withCount'] != null) {
+            queryParameters['with_count'] = requestParameters['withCount'];
+        }
+
         const headerParameters: runtime.HTTPHeaders = {};
 
         if (this.configuration && this.configuration.accessToken) {
@@ -233,7 +243,7 @@ export class CommentsApi extends runtime.BaseAPI {
     }
 
     /**
-     * List all comments for a post
+     * List all visible comments for a post, each with its visible replies nested below it. The whole thread is loaded in one query and assembled in memory. Without `post_id` (staff only) the visible top-level comments of every post are listed, paged in the database, with the replies of each page loaded alongside.
      * List Comments
      */
     async listComments(requestParameters: ListCommentsRequest = {}, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<PagedCommentList> {
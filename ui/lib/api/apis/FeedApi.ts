@@ -22,17 +22,71 @@ import {
     JSONFeedToJSON,
 } from '../models/index';
 
+export interface GetAtomFeedRequest {
+    limit?: number;
+    offset?: number;
+}
+
 export interface GetFeedRequest {
     limit?: number;
     offset?: number;
 }
 
+export interface GetRssFeedRequest {
+    limit?: number;
+    offset?: number;
+}
+
 /**
  * 
  */
 export class FeedApi extends runtime.BaseAPI {
 
     /**
+     * Atom 1.0 rendering of the JSON feed, cached and validated the same way.
+     * Atom Feed
+     */
+    async getAtomFeedRaw(requestParameters: GetAtomFeedRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<void>> {
+        const queryParameters: any = {};
+
+        if (requestParameters['limit'] != null) {
+            queryParameters['limit'] = requestParameters['limit'];
+        }
+
+        if (requestParameters['offset'] != null) {
+            queryParameters['offset'] = requestParameters['offset'];
+        }
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+        if (this.configuration && this.configuration.accessToken) {
+            const token = this.configuration.accessToken;
+            const tokenString = await token("JWTAuth", []);
+
+            if (tokenString) {
+                headerParameters["Authorization"] = `Bearer ${tokenString}`;
+            }
+        }
+        const response = await this.request({
+            path: `/api/feed/atom`,
+            method: 'GET',
+            headers: headerParameters,
+            query: queryParameters,
+        }, initOverrides);
+
+        return new runtime.VoidApiResponse(response);
+    }
+
+    /**
+     * Atom 1.0 rendering of the JSON feed, cached and validated the same way.
+     * Atom Feed
+     */
+    async getAtomFeed(requestParameters: GetAtomFeedRequest = {}, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<void> {
+        await this.getAtomFeedRaw(requestParameters, initOverrides);
+    }
+
+    /**
+     * JSON Feed of published posts. Pages are served from a snapshot rebuilt only after posts change, and honour `If-None-Match`/`If-Modified-Since` with `304 Not Modified`.
      * Feed
      */
     async getFeedRaw(requestParameters: GetFeedRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<JSONFeed>> {
@@ -67,6 +121,7 @@ export class FeedApi extends runtime.BaseAPI {
     }
 
     /**
+     * JSON Feed of published posts. Pages are served from a snapshot rebuilt only after posts change, and honour `If-None-Match`/`If-Modified-Since` with `304 Not Modified`.
      * Feed
      */
     async getFeed(requestParameters: GetFeedRequest = {}, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<JSONFeed> {
@@ -74,4 +129,47 @@ export class FeedApi extends runtime.BaseAPI {
         return await response.value();
     }
 
+    /**
+     * RSS 2.0 rendering of the JSON feed, cached and validated the same way.
+     * Rss Feed
+     */
+    async getRssFeedRaw(requestParameters: GetRssFeedRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<void>> {
+        const queryParameters: any = {};
+
+        if (requestParameters['limit'] != null) {
+            queryParameters['limit'] = requestParameters['limit'];
+        }
+
+        if (requestParameters['offset'] != null) {
+            queryParameters['offset'] = requestParameters['offset'];
+        }
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+        if (this.configuration && this.configuration.accessToken) {
+            const token = this.configuration.accessToken;
+            const tokenString = await token("JWTAuth", []);
+
+            if (tokenString) {
+                headerParameters["Authorization"] = `Bearer ${tokenString}`;
+            }
+        }
+        const response = await this.request({
+            path: `/api/feed/rss`,
+            method: 'GET',
+            headers: headerParameters,
+            query: queryParameters,
+        }, initOverrides);
+
+        return new runtime.VoidApiResponse(response);
+    }
+
+    /**
+     * RSS 2.0 rendering of the JSON feed, cached and validated the same way.
+     * Rss Feed
+     */
+    async getRssFeed(requestParameters: GetRssFeedRequest = {}, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<void> {
+        await this.getRssFeedRaw(requestParameters, initOverrides);
+    }
+
 }
@@ -15,42 +15,122 @@
 
 import * as runtime from '../runtime';
 import type {
+  FileBulkDelete,
+  FileBulkDeleteResult,
   FileDetails,
+  FileDownload,
   FileMetadata,
   FileMutateMetadata,
+  FileUploadComplete,
+  FileUploadRequest,
+  FileUploadTicket,
+  FileVisibilityUpdate,
+  MissingFiles,
   OrphanedFiles,
   PagedFileDetails,
+  StorageStats,
+  UploadPartDetails,
+  UploadSessionCreate,
+  UploadSessionDetails,
 } from '../models/index';
 import {
+    FileBulkDeleteFromJSON,
+    FileBulkDeleteToJSON,
+    FileBulkDeleteResultFromJSON,
+    FileBulkDeleteResultToJSON,
     FileDetailsFromJSON,
     FileDetailsToJSON,
+    FileDownloadFromJSON,
+    FileDownloadToJSON,
     FileMetadataFromJSON,
     FileMetadataToJSON,
     FileMutateMetadataFromJSON,
     FileMutateMetadataToJSON,
+    FileUploadCompleteFromJSON,
+    FileUploadCompleteToJSON,
+    FileUploadRequestFromJSON,
+    FileUploadRequestToJSON,
+    FileUploadTicketFromJSON,
+    FileUploadTicketToJSON,
+    FileVisibilityUpdateFromJSON,
+    FileVisibilityUpdateToJSON,
+    MissingFilesFromJSON,
+    MissingFilesToJSON,
     OrphanedFilesFromJSON,
     OrphanedFilesToJSON,
     PagedFileDetailsFromJSON,
     PagedFileDetailsToJSON,
+    StorageStatsFromJSON,
+    StorageStatsToJSON,
+    UploadPartDetailsFromJSON,
+    UploadPartDetailsToJSON,
+    UploadSessionCreateFromJSON,
+    UploadSessionCreateToJSON,
+    UploadSessionDetailsFromJSON,
+    UploadSessionDetailsToJSON,
 } from '../models/index';
 
+export interface AbortUploadSessionRequest {
+    sessionId: string;
+}
+
+export interface CompleteFileUploadRequest {
+    fileUploadComplete: FileUploadComplete;
+}
+
+export interface CompleteUploadSessionRequest {
+    sessionId: string;
+}
+
 export interface CreateFileRequest {
     upload: Blob;
     metadata: FileMetadata;
 }
 
+export interface CreateFileUploadRequest {
+    fileUploadRequest: FileUploadRequest;
+}
+
+export interface CreateUploadSessionRequest {
+    uploadSessionCreate: UploadSessionCreate;
+}
+
 export interface DeleteFileRequest {
     id: number;
 }
 
+export interface DeleteFilesRequest {
+    fileBulkDelete: FileBulkDelete;
+}
+
 export interface GetFileRequest {
     id: number;
 }
 
+export interface GetFileContentRequest {
+    id: number;
+}
+
+export interface GetFileDownloadRequest {
+    id: number;
+}
+
+export interface GetUploadSessionRequest {
+    sessionId: string;
+}
+
 export interface ListFilesRequest {
     visibility?: ListFilesVisibilityEnum;
+    contentType?: string | null;
     limit?: number;
     offset?: number;
+    cursor?: string | null;
+    withCount?: boolean;
+}
+
+export interface ListOrphanedFilesRequest {
+    live?: boolean;
+    exactContentTypes?: boolean;
 }
 
 export interface UpdateFileRequest {
@@ -58,13 +138,153 @@ export interface UpdateFileRequest {
     fileMutateMetadata: FileMutateMetadata;
 }
 
+export interface UpdateFilesVisibilityRequest {
+    fileVisibilityUpdate: FileVisibilityUpdate;
+}
+
+export interface UploadSessionPartRequest {
+    sessionId: string;
+    number: number;
+}
+
 /**
  * 
  */
 export class FilesApi extends runtime.BaseAPI {
 
     /**
-     * Creates a file with or without post associations.
+     * Discards a resumable upload and the parts stored for it.
+     * Abort Upload Session
+     */
+    async abortUploadSessionRaw(requestParameters: AbortUploadSessionRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<void>> {
+        if (requestParameters['sessionId'] == null) {
+            throw new runtime.RequiredError(
+                'sessionId',
+                'Required parameter "sessionId" was null or undefined when calling abortUploadSession().'
+            );
+        }
+
+        const queryParameters: any = {};
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+        if (this.configuration && this.configuration.accessToken) {
+            const token = this.configuration.accessToken;
+            const tokenString = await token("JWTAuth", []);
+
+            if (tokenString) {
+                headerParameters["Authorization"] = `Bearer ${tokenString}`;
+            }
+        }
+        const response = await this.request({
+            path: `/api/files/sessions/{session_id}`.replace(`{${"session_id"}}`, encodeURIComponent(String(requestParameters['sessionId']))),
+            method: 'DELETE',
+            headers: headerParameters,
+            query: queryParameters,
+        }, initOverrides);
+
+        return new runtime.VoidApiResponse(response);
+    }
+
+    /**
+     * Discards a resumable upload and the parts stored for it.
+     * Abort Upload Session
+     */
+    async abortUploadSession(requestParameters: AbortUploadSessionRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<void> {
+        await this.abortUploadSessionRaw(requestParameters, initOverrides);
+    }
+
+    /**
+     * Records a file uploaded with createFileUpload once its object is in storage. Size and content type are taken from the stored object. Completing twice returns the same file. Without a `sha256` from the client the content is hashed in the background.
+     * Complete File Upload
+     */
+    async completeFileUploadRaw(requestParameters: CompleteFileUploadRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<FileDetails>> {
+        if (requestParameters['fileUploadComplete'] == null) {
+            throw new runtime.RequiredError(
+                'fileUploadComplete',
+                'Required parameter "fileUploadComplete" was null or undefined when calling completeFileUpload().'
+            );
+        }
+
+        const queryParameters: any = {};
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+        headerParameters['Content-Type'] = 'application/json';
+
+        if (this.configuration && this.configuration.accessToken) {
+            const token = this.configuration.accessToken;
+            const tokenString = await token("JWTAuth", []);
+
+            if (tokenString) {
+                headerParameters["Authorization"] = `Bearer ${tokenString}`;
+            }
+        }
+        const response = await this.request({
+            path: `/api/files/uploads/complete`,
+            method: 'POST',
+            headers: headerParameters,
+            query: queryParameters,
+            body: FileUploadCompleteToJSON(requestParameters['fileUploadComplete']),
+        }, initOverrides);
+
+        return new runtime.JSONApiResponse(response, (jsonValue) => FileDetailsFromJSON(jsonValue));
+    }
+
+    /**
+     * Records a file uploaded with createFileUpload once its object is in storage. Size and content type are taken from the stored object. Completing twice returns the same file. Without a `sha256` from the client the content is hashed in the background.
+     * Complete File Upload
+     */
+    async completeFileUpload(requestParameters: CompleteFileUploadRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<FileDetails> {
+        const response = await this.completeFileUploadRaw(requestParameters, initOverrides);
+        return await response.value();
+    }
+
+    /**
+     * Assembles the uploaded parts into the file and records it; its content is hashed in the background. Completing twice returns the same file.
+     * Complete Upload Session
+     */
+    async completeUploadSessionRaw(requestParameters: CompleteUploadSessionRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<FileDetails>> {
+        if (requestParameters['sessionId'] == null) {
+            throw new runtime.RequiredError(
+                'sessionId',
+                'Required parameter "sessionId" was null or undefined when calling completeUploadSession().'
+            );
+        }
+
+        const queryParameters: any = {};
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+        if (this.configuration && this.configuration.accessToken) {
+            const token = this.configuration.accessToken;
+            const tokenString = await token("JWTAuth", []);
+
+            if (tokenString) {
+                headerParameters["Authorization"] = `Bearer ${tokenString}`;
+            }
+        }
+        const response = await this.request({
+            path: `/api/files/sessions/{session_id}/complete`.replace(`{${"session_id"}}`, encodeURIComponent(String(requestParameters['sessionId']))),
+            method: 'POST',
+            headers: headerParameters,
+            query: queryParameters,
+        }, initOverrides);
+
+        return new runtime.JSONApiResponse(response, (jsonValue) => FileDetailsFromJSON(jsonValue));
+    }
+
+    /**
+     * Assembles the uploaded parts into the file and records it; its content is hashed in the background. Completing twice returns the same file.
+     * Complete Upload Session
+     */
+    async completeUploadSession(requestParameters: CompleteUploadSessionRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<FileDetails> {
+        const response = await this.completeUploadSessionRaw(requestParameters, initOverrides);
+        return await response.value();
+    }
+
+    /**
+     * Creates a file with or without post associations. If a file with identical content and visibility exists, it is associated with the posts and returned instead.
      * Create File
      */
     async createFileRaw(requestParameters: CreateFileRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<FileDetails>> {
@@ -130,7 +350,7 @@ export class FilesApi extends runtime.BaseAPI {
     }
 
     /**
-     * Creates a file with or without post associations.
+     * Creates a file with or without post associations. If a file with identical content and visibility exists, it is associated with the posts and returned instead.
      * Create File
      */
     async createFile(requestParameters: CreateFileRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<FileDetails> {
@@ -138,6 +358,98 @@ export class FilesApi extends runtime.BaseAPI {
         return await response.value();
     }
 
+    /**
+     * Starts a direct upload to storage. The client PUTs the file to the returned URL with the returned headers, then calls completeFileUpload with the token to record the file. Given the content\'s `sha256`, storage verifies the upload against it, and if a file with identical content and visibility exists it is returned as `file` with nothing to upload.
+     * Create File Upload
+     */
+    async createFileUploadRaw(requestParameters: CreateFileUploadRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<FileUploadTicket>> {
+        if (requestParameters['fileUploadRequest'] == null) {
+            throw new runtime.RequiredError(
+                'fileUploadRequest',
+                'Required parameter "fileUploadRequest" was null or undefined when calling createFileUpload().'
+            );
+        }
+
+        const queryParameters: any = {};
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+        headerParameters['Content-Type'] = 'application/json';
+
+        if (this.configuration && this.configuration.accessToken) {
+            const token = this.configuration.accessToken;
+            const tokenString = await token("JWTAuth", []);
+
+            if (tokenString) {
+                headerParameters["Authorization"] = `Bearer ${tokenString}`;
+            }
+        }
+        const response = await this.request({
+            path: `/api/files/uploads`,
+            method: 'POST',
+            headers: headerParameters,
+            query: queryParameters,
+            body: FileUploadRequestToJSON(requestParameters['fileUploadRequest']),
+        }, initOverrides);
+
+        return new runtime.JSONApiResponse(response, (jsonValue) => FileUploadTicketFromJSON(jsonValue));
+    }
+
+    /**
+     * Starts a direct upload to storage. The client PUTs the file to the returned URL with the returned headers, then calls completeFileUpload with the token to record the file. Given the content\'s `sha256`, storage verifies the upload against it, and if a file with identical content and visibility exists it is returned as `file` with nothing to upload.
+     * Create File Upload
+     */
+    async createFileUpload(requestParameters: CreateFileUploadRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<FileUploadTicket> {
+        const response = await this.createFileUploadRaw(requestParameters, initOverrides);
+        return await response.value();
+    }
+
+    /**
+     * Starts a resumable upload. Send the file in numbered parts with uploadSessionPart, in any order and concurrently, then call completeUploadSession. If the connection drops, get the session to see which parts arrived and send the rest.
+     * Create Upload Session
+     */
+    async createUploadSessionRaw(requestParameters: CreateUploadSessionRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<UploadSessionDetails>> {
+        if (requestParameters['uploadSessionCreate'] == null) {
+            throw new runtime.RequiredError(
+                'uploadSessionCreate',
+                'Required parameter "uploadSessionCreate" was null or undefined when calling createUploadSession().'
+            );
+        }
+
+        const queryParameters: any = {};
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+        headerParameters['Content-Type'] = 'application/json';
+
+        if (this.configuration && this.configuration.accessToken) {
+            const token = this.configuration.accessToken;
+            const tokenString = await token("JWTAuth", []);
+
+            if (tokenString) {
+                headerParameters["Authorization"] = `Bearer ${tokenString}`;
+            }
+        }
+        const response = await this.request({
+            path: `/api/files/sessions`,
+            method: 'POST',
+            headers: headerParameters,
+            query: queryParameters,
+            body: UploadSessionCreateToJSON(requestParameters['uploadSessionCreate']),
+        }, initOverrides);
+
+        return new runtime.JSONApiResponse(response, (jsonValue) => UploadSessionDetailsFromJSON(jsonValue));
+    }
+
+    /**
+     * Starts a resumable upload. Send the file in numbered parts with uploadSessionPart, in any order and concurrently, then call completeUploadSession. If the connection drops, get the session to see which parts arrived and send the rest.
+     * Create Upload Session
+     */
+    async createUploadSession(requestParameters: CreateUploadSessionRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<UploadSessionDetails> {
+        const response = await this.createUploadSessionRaw(requestParameters, initOverrides);
+        return await response.value();
+    }
+
     /**
      * Deletes a file from the database and S3.
      * Delete File
@@ -180,6 +492,52 @@ export class FilesApi extends runtime.BaseAPI {
         await this.deleteFileRaw(requestParameters, initOverrides);
     }
 
+    /**
+     * Deletes many files, and orphaned objects listed by `listOrphanedFiles`, at once. Rows are deleted in one transaction and objects in batches of up to 1000 keys; objects storage fails to delete are listed in `failures`.
+     * Delete Files In Bulk
+     */
+    async deleteFilesRaw(requestParameters: DeleteFilesRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<FileBulkDeleteResult>> {
+        if (requestParameters['fileBulkDelete'] == null) {
+            throw new runtime.RequiredError(
+                'fileBulkDelete',
+                'Required parameter "fileBulkDelete" was null or undefined when calling deleteFiles().'
+            );
+        }
+
+        const queryParameters: any = {};
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+        headerParameters['Content-Type'] = 'application/json';
+
+        if (this.configuration && this.configuration.accessToken) {
+            const token = this.configuration.accessToken;
+            const tokenString = await token("JWTAuth", []);
+
+            if (tokenString) {
+                headerParameters["Authorization"] = `Bearer ${tokenString}`;
+            }
+        }
+        const response = await this.request({
+            path: `/api/files/delete`,
+            method: 'POST',
+            headers: headerParameters,
+            query: queryParameters,
+            body: FileBulkDeleteToJSON(requestParameters['fileBulkDelete']),
+        }, initOverrides);
+
+        return new runtime.JSONApiResponse(response, (jsonValue) => FileBulkDeleteResultFromJSON(jsonValue));
+    }
+
+    /**
+     * Deletes many files, and orphaned objects listed by `listOrphanedFiles`, at once. Rows are deleted in one transaction and objects in batches of up to 1000 keys; objects storage fails to delete are listed in `failures`.
+     * Delete Files In Bulk
+     */
+    async deleteFiles(requestParameters: DeleteFilesRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<FileBulkDeleteResult> {
+        const response = await this.deleteFilesRaw(requestParameters, initOverrides);
+        return await response.value();
+    }
+
     /**
      * Gets all the details of a file.
      * Get File
@@ -223,6 +581,170 @@ export class FilesApi extends runtime.BaseAPI {
         return await response.value();
     }
 
+    /**
+     * The file\'s bytes, streamed through the API chunk by chunk, with support for single `Range` requests. When `s3.accel_redirect_prefix` is configured, nginx is told to serve a presigned URL instead and the API never touches the bytes.
+     * Get File Content
+     */
+    async getFileContentRaw(requestParameters: GetFileContentRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<void>> {
+        if (requestParameters['id'] == null) {
+            throw new runtime.RequiredError(
+                'id',
+                'Required parameter "id" was null or undefined when calling getFileContent().'
+            );
+        }
+
+        const queryParameters: any = {};
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+        if (this.configuration && this.configuration.accessToken) {
+            const token = this.configuration.accessToken;
+            const tokenString = await token("JWTAuth", []);
+
+            if (tokenString) {
+                headerParameters["Authorization"] = `Bearer ${tokenString}`;
+            }
+        }
+        const response = await this.request({
+            path: `/api/files/{id}/content`.replace(`{${"id"}}`, encodeURIComponent(String(requestParameters['id']))),
+            method: 'GET',
+            headers: headerParameters,
+            query: queryParameters,
+        }, initOverrides);
+
+        return new runtime.VoidApiResponse(response);
+    }
+
+    /**
+     * The file\'s bytes, streamed through the API chunk by chunk, with support for single `Range` requests. When `s3.accel_redirect_prefix` is configured, nginx is told to serve a presigned URL instead and the API never touches the bytes.
+     * Get File Content
+     */
+    async getFileContent(requestParameters: GetFileContentRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<void> {
+        await this.getFileContentRaw(requestParameters, initOverrides);
+    }
+
+    /**
+     * A URL to download the file from. For private files it is presigned and short-lived; the same URL is handed out again while most of its lifetime is left.
+     * Get File Download
+     */
+    async getFileDownloadRaw(requestParameters: GetFileDownloadRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<FileDownload>> {
+        if (requestParameters['id'] == null) {
+            throw new runtime.RequiredError(
+                'id',
+                'Required parameter "id" was null or undefined when calling getFileDownload().'
+            );
+        }
+
+        const queryParameters: any = {};
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+        if (this.configuration && this.configuration.accessToken) {
+            const token = this.configuration.accessToken;
+            const tokenString = await token("JWTAuth", []);
+
+            if (tokenString) {
+                headerParameters["Authorization"] = `Bearer ${tokenString}`;
+            }
+        }
+        const response = await this.request({
+            path: `/api/files/{id}/download`.replace(`{${"id"}}`, encodeURIComponent(String(requestParameters['id']))),
+            method: 'GET',
+            headers: headerParameters,
+            query: queryParameters,
+        }, initOverrides);
+
+        return new runtime.JSONApiResponse(response, (jsonValue) => FileDownloadFromJSON(jsonValue));
+    }
+
+    /**
+     * A URL to download the file from. For private files it is presigned and short-lived; the same URL is handed out again while most of its lifetime is left.
+     * Get File Download
+     */
+    async getFileDownload(requestParameters: GetFileDownloadRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<FileDownload> {
+        const response = await this.getFileDownloadRaw(requestParameters, initOverrides);
+        return await response.value();
+    }
+
+    /**
+     * S3 clients created by this server process and the count, errors and latency of its S3 calls by operation, since the process started.
+     * Get Storage Stats
+     */
+    async getStorageStatsRaw(initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<StorageStats>> {
+        const queryParameters: any = {};
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+        if (this.configuration && this.configuration.accessToken) {
+            const token = this.configuration.accessToken;
+            const tokenString = await token("JWTAuth", []);
+
+            if (tokenString) {
+                headerParameters["Authorization"] = `Bearer ${tokenString}`;
+            }
+        }
+        const response = await this.request({
+            path: `/api/files/storage/stats`,
+            method: 'GET',
+            headers: headerParameters,
+            query: queryParameters,
+        }, initOverrides);
+
+        return new runtime.JSONApiResponse(response, (jsonValue) => StorageStatsFromJSON(jsonValue));
+    }
+
+    /**
+     * S3 clients created by this server process and the count, errors and latency of its S3 calls by operation, since the process started.
+     * Get Storage Stats
+     */
+    async getStorageStats(initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<StorageStats> {
+        const response = await this.getStorageStatsRaw(initOverrides);
+        return await response.value();
+    }
+
+    /**
+     * Gets the parts received so far by a resumable upload.
+     * Get Upload Session
+     */
+    async getUploadSessionRaw(requestParameters: GetUploadSessionRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<UploadSessionDetails>> {
+        if (requestParameters['sessionId'] == null) {
+            throw new runtime.RequiredError(
+                'sessionId',
+                'Required parameter "sessionId" was null or undefined when calling getUploadSession().'
+            );
+        }
+
+        const queryParameters: any = {};
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+        if (this.configuration && this.configuration.accessToken) {
+            const token = this.configuration.accessToken;
+            const tokenString = await token("JWTAuth", []);
+
+            if (tokenString) {
+                headerParameters["Authorization"] = `Bearer ${tokenString}`;
+            }
+        }
+        const response = await this.request({
+            path: `/api/files/sessions/{session_id}`.replace(`{${"session_id"}}`, encodeURIComponent(String(requestParameters['sessionId']))),
+            method: 'GET',
+            headers: headerParameters,
+            query: queryParameters,
+        }, initOverrides);
+
+        return new runtime.JSONApiResponse(response, (jsonValue) => UploadSessionDetailsFromJSON(jsonValue));
+    }
+
+    /**
+     * Gets the parts received so far by a resumable upload.
+     * Get Upload Session
+     */
+    async getUploadSession(requestParameters: GetUploadSessionRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<UploadSessionDetails> {
+        const response = await this.getUploadSessionRaw(requestParameters, initOverrides);
+        return await response.value();
+    }
+
     /**
      * List all files
      * List Files
@@ -234,6 +756,10 @@ export class FilesApi extends runtime.BaseAPI {
             queryParameters['visibility'] = requestParameters['visibility'];
         }
 
+        if (requestParameters['contentType'] != null) {
+            queryParameters['content_type'] = requestParameters['contentType'];
+        }
+
         if (requestParameters['limit'] != null) {
             queryParameters['limit'] = requestParameters['limit'];
         }
@@ -242,6 +768,14 @@ export class FilesApi extends runtime.BaseAPI {
             queryParameters['offset'] = requestParameters['offset'];
         }
 
+        if (requestParameters['cursor'] != null) {
+            queryParameters['cursor'] = requestParameters['cursor'];
+        }
+
+        if (requestParameters['withCount'] != null) {
+            queryParameters['with_count'] = requestParameters['withCount'];
+        }
+
         const headerParameters: runtime.HTTPHeaders = {};
 
         if (this.configuration && this.configuration.accessToken) {
@@ -272,12 +806,56 @@ export class FilesApi extends runtime.BaseAPI {
     }
 
     /**
-     * Find files that exist in storage but not in the database. If a file exists in both public and private storage, it will be considered public. Returns detailed metadata about each orphaned file.
+     * Files in the database whose object was not in storage as of the latest inventory snapshot taken by the `reconcile_storage` job. Empty, with no `snapshot_at`, until one exists.
+     * List Missing Files
+     */
+    async listMissingFilesRaw(initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<MissingFiles>> {
+        const queryParameters: any = {};
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+        if (this.configuration && this.configuration.accessToken) {
+            const token = this.configuration.accessToken;
+            const tokenString = await token("JWTAuth", []);
+
+            if (tokenString) {
+                headerParameters["Authorization"] = `Bearer ${tokenString}`;
+            }
+        }
+        const response = await this.request({
+            path: `/api/files/missing`,
+            method: 'GET',
+            headers: headerParameters,
+            query: queryParameters,
+        }, initOverrides);
+
+        return new runtime.JSONApiResponse(response, (jsonValue) => MissingFilesFromJSON(jsonValue));
+    }
+
+    /**
+     * Files in the database whose object was not in storage as of the latest inventory snapshot taken by the `reconcile_storage` job. Empty, with no `snapshot_at`, until one exists.
+     * List Missing Files
+     */
+    async listMissingFiles(initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<MissingFiles> {
+        const response = await this.listMissingFilesRaw(initOverrides);
+        return await response.value();
+    }
+
+    /**
+     * Find files that exist in storage but not in the database. If a file exists in both public and private storage, it will be considered public. Reads the inventory kept by the `reconcile_storage` job; `snapshot_at` tells how current it is. With `live`, or before the first inventory pass completes, the buckets are scanned instead: they are listed page by page and results are streamed as they are found, with content types read by concurrent HEAD requests or guessed from file names when `exact_content_types` is false. A live scan that fails part way ends the document with `complete` false; its lists are partial.
      * List Orphaned Files
      */
-    async listOrphanedFilesRaw(initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<OrphanedFiles>> {
+    async listOrphanedFilesRaw(requestParameters: ListOrphanedFilesRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<OrphanedFiles>> {
         const queryParameters: any = {};
 
+        if (requestParameters['live'] != null) {
+            queryParameters['live'] = requestParameters['live'];
+        }
+
+        if (requestParameters['exactContentTypes'] != null) {
+            queryParameters['exact_content_types'] = requestParameters['exactContentTypes'];
+        }
+
         const headerParameters: runtime.HTTPHeaders = {};
 
         if (this.configuration && this.configuration.accessToken) {
@@ -299,16 +877,16 @@ export class FilesApi extends runtime.BaseAPI {
     }
 
     /**
-     * Find files that exist in storage but not in the database. If a file exists in both public and private storage, it will be considered public. Returns detailed metadata about each orphaned file.
+     * Find files that exist in storage but not in the database. If a file exists in both public and private storage, it will be considered public. Reads the inventory kept by the `reconcile_storage` job; `snapshot_at` tells how current it is. With `live`, or before the first inventory pass completes, the buckets are scanned instead: they are listed page by page and results are streamed as they are found, with content types read by concurrent HEAD requests or guessed from file names when `exact_content_types` is false. A live scan that fails part way ends the document with `complete` false; its lists are partial.
      * List Orphaned Files
      */
-    async listOrphanedFiles(initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<OrphanedFiles> {
-        const response = await this.listOrphanedFilesRaw(initOverrides);
+    async listOrphanedFiles(requestParameters: ListOrphanedFilesRequest = {}, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<OrphanedFiles> {
+        const response = await this.listOrphanedFilesRaw(requestParameters, initOverrides);
         return await response.value();
     }
 
     /**
-     * Updates a file, namely the posts associated with the file. File properties are immutable.
+     * Updates a file, namely the posts associated with the file and its visibility. Changing visibility moves the object within storage. Other file properties are immutable.
      * Update File
      */
     async updateFileRaw(requestParameters: UpdateFileRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<FileDetails>> {
@@ -352,7 +930,7 @@ export class FilesApi extends runtime.BaseAPI {
     }
 
     /**
-     * Updates a file, namely the posts associated with the file. File properties are immutable.
+     * Updates a file, namely the posts associated with the file and its visibility. Changing visibility moves the object within storage. Other file properties are immutable.
      * Update File
      */
     async updateFile(requestParameters: UpdateFileRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<FileDetails> {
@@ -360,6 +938,102 @@ export class FilesApi extends runtime.BaseAPI {
         return await response.value();
     }
 
+    /**
+     * Changes the visibility of many files at once. Objects are moved concurrently within storage.
+     * Update Files Visibility
+     */
+    async updateFilesVisibilityRaw(requestParameters: UpdateFilesVisibilityRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<Array<FileDetails>>> {
+        if (requestParameters['fileVisibilityUpdate'] == null) {
+            throw new runtime.RequiredError(
+                'fileVisibilityUpdate',
+                'Required parameter "fileVisibilityUpdate" was null or undefined when calling updateFilesVisibility().'
+            );
+        }
+
+        const queryParameters: any = {};
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+        headerParameters['Content-Type'] = 'application/json';
+
+        if (this.configuration && this.configuration.accessToken) {
+            const token = this.configuration.accessToken;
+            const tokenString = await token("JWTAuth", []);
+
+            if (tokenString) {
+                headerParameters["Authorization"] = `Bearer ${tokenString}`;
+            }
+        }
+        const response = await this.request({
+            path: `/api/files/visibility`,
+            method: 'PUT',
+            headers: headerParameters,
+            query: queryParameters,
+            body: FileVisibilityUpdateToJSON(requestParameters['fileVisibilityUpdate']),
+        }, initOverrides);
+
+        return new runtime.JSONApiResponse(response, (jsonValue) => jsonValue.map(FileDetailsFromJSON));
+    }
+
+    /**
+     * Changes the visibility of many files at once. Objects are moved concurrently within storage.
+     * Update Files Visibility
+     */
+    async updateFilesVisibility(requestParameters: UpdateFilesVisibilityRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<Array<FileDetails>> {
+        const response = await this.updateFilesVisibilityRaw(requestParameters, initOverrides);
+        return await response.value();
+    }
+
+    /**
+     * Stores part `number` (starting at 1) of a resumable upload; the request body is the raw bytes of the part, with its Content-Length. Sending a part again replaces it.
+     * Upload Session Part
+     */
+    async uploadSessionPartRaw(requestParameters: UploadSessionPartRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<UploadPartDetails>> {
+        if (requestParameters['sessionId'] == null) {
+            throw new runtime.RequiredError(
+                'sessionId',
+                'Required parameter "sessionId" was null or undefined when calling uploadSessionPart().'
+            );
+        }
+
+        if (requestParameters['number'] == null) {
+            throw new runtime.RequiredError(
+                'number',
+                'Required parameter "number" was null or undefined when calling uploadSessionPart().'
+            );
+        }
+
+        const queryParameters: any = {};
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+        if (this.configuration && this.configuration.accessToken) {
+            const token = this.configuration.accessToken;
+            const tokenString = await token("JWTAuth", []);
+
+            if (tokenString) {
+                headerParameters["Authorization"] = `Bearer ${tokenString}`;
+            }
+        }
+        const response = await this.request({
+            path: `/api/files/sessions/{session_id}/parts/{number}`.replace(`{${"session_id"}}`, encodeURIComponent(String(requestParameters['sessionId']))).replace(`{${"number"}}`, encodeURIComponent(String(requestParameters['number']))),
+            method: 'PUT',
+            headers: headerParameters,
+            query: queryParameters,
+        }, initOverrides);
+
+        return new runtime.JSONApiResponse(response, (jsonValue) => UploadPartDetailsFromJSON(jsonValue));
+    }
+
+    /**
+     * Stores part `number` (starting at 1) of a resumable upload; the request body is the raw bytes of the part, with its Content-Length. Sending a part again replaces it.
+     * Upload Session Part
+     */
+    async uploadSessionPart(requestParameters: UploadSessionPartRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<UploadPartDetails> {
+        const response = await this.uploadSessionPartRaw(requestParameters, initOverrides);
+        return await response.value();
+    }
+
 }
 
 /**
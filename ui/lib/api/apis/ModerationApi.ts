@@ -36,6 +36,8 @@ export interface ModQueueListRequest {
     reviewed?: boolean | null;
     limit?: number;
     offset?: number;
+    cursor?: string | null;
+    withCount?: boolean;
 }
 
 export interface ModUpdateCommentRequest {
@@ -109,6 +111,14 @@ export class ModerationApi extends runtime.BaseAPI {
             queryParameters['offset'] = requestParameters['offset'];
         }
 
+        if (requestParameters['cursor'] != null) {
+            queryParameters['cursor'] = requestParameters['cursor'];
+        }
+
+        if (requestParameters['withCount'] != null) {
+            queryParameters['with_count'] = requestParameters['withCount'];
+        }
+
         const headerParameters: runtime.HTTPHeaders = {};
 
         if (this.configuration && this.configuration.accessToken) {
@@ -17,6 +17,7 @@ import * as runtime from '../runtime';
 import type {
   FileDetails,
   PagedPostListPublic,
+  PagedPostSearchResult,
   PostCreate,
   PostPublic,
   PostUpdate,
@@ -29,6 +30,8 @@ import {
     FileDetailsToJSON,
     PagedPostListPublicFromJSON,
     PagedPostListPublicToJSON,
+    PagedPostSearchResultFromJSON,
+    PagedPostSearchResultToJSON,
     PostCreateFromJSON,
     PostCreateToJSON,
     PostPublicFromJSON,
@@ -74,6 +77,8 @@ export interface GetPostBySlugAndYearRequest {
 
 export interface GetPostFilesByIdRequest {
     postId: number;
+    visibility?: GetPostFilesByIdVisibilityEnum;
+    contentType?: string | null;
 }
 
 export interface ListPostsRequest {
@@ -84,12 +89,22 @@ export interface ListPostsRequest {
     order?: string;
     limit?: number;
     offset?: number;
+    cursor?: string | null;
+    withCount?: boolean;
 }
 
 export interface ListSharecodesRequest {
     postId: number;
 }
 
+export interface SearchPostsRequest {
+    q: string;
+    limit?: number;
+    offset?: number;
+    cursor?: string | null;
+    withCount?: boolean;
+}
+
 export interface UpdatePostRequest {
     postId: number;
     postUpdate: PostUpdate;
@@ -394,6 +409,14 @@ export class PostsApi extends runtime.BaseAPI {
 
         const queryParameters: any = {};
 
+        if (requestParameters['visibility'] != null) {
+            queryParameters['visibility'] = requestParameters['visibility'];
+        }
+
+        if (requestParameters['contentType'] != null) {
+            queryParameters['content_type'] = requestParameters['contentType'];
+        }
+
         const headerParameters: runtime.HTTPHeaders = {};
 
         if (this.configuration && this.configuration.accessToken) {
@@ -457,6 +480,14 @@ export class PostsApi extends runtime.BaseAPI {
             queryParameters['offset'] = requestParameters['offset'];
         }
 
+        if (requestParameters['cursor'] != null) {
+            queryParameters['cursor'] = requestParameters['cursor'];
+        }
+
+        if (requestParameters['withCount'] != null) {
+            queryParameters['with_count'] = requestParameters['withCount'];
+        }
+
         const headerParameters: runtime.HTTPHeaders = {};
 
         if (this.configuration && this.configuration.accessToken) {
@@ -527,6 +558,69 @@ export class PostsApi extends runtime.BaseAPI {
         return await response.value();
     }
 
+    /**
+     * Full-text search over published posts, best matches first. `q` accepts web search syntax: quoted phrases, `or` and `-excluded` terms.
+     * Search Posts
+     */
+    async searchPostsRaw(requestParameters: SearchPostsRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<runtime.ApiResponse<PagedPostSearchResult>> {
+        if (requestParameters['q'] == null) {
+            throw new runtime.RequiredError(
+                'q',
+                'Required parameter "q" was null or undefined when calling searchPosts().'
+            );
+        }
+
+        const queryParameters: any = {};
+
+        if (requestParameters['q'] != null) {
+            queryParameters['q'] = requestParameters['q'];
+        }
+
+        if (requestParameters['limit'] != null) {
+            queryParameters['limit'] = requestParameters['limit'];
+        }
+
+        if (requestParameters['offset'] != null) {
+            queryParameters['offset'] = requestParameters['offset'];
+        }
+
+        if (requestParameters['cursor'] != null) {
+            queryParameters['cursor'] = requestParameters['cursor'];
+        }
+
+        if (requestParameters['withCount'] != null) {
+            queryParameters['with_count'] = requestParameters['withCount'];
+        }
+
+        const headerParameters: runtime.HTTPHeaders = {};
+
+        if (this.configuration && this.configuration.accessToken) {
+            const token = this.configuration.accessToken;
+            const tokenString = await token("JWTAuth", []);
+
+            if (tokenString) {
+                headerParameters["Authorization"] = `Bearer ${tokenString}`;
+            }
+        }
+        const response = await this.request({
+            path: `/api/posts/search`,
+            method: 'GET',
+            headers: headerParameters,
+            query: queryParameters,
+        }, initOverrides);
+
+        return new runtime.JSONApiResponse(response, (jsonValue) => PagedPostSearchResultFromJSON(jsonValue));
+    }
+
+    /**
+     * Full-text search over published posts, best matches first. `q` accepts web search syntax: quoted phrases, `or` and `-excluded` terms.
+     * Search Posts
+     */
+    async searchPosts(requestParameters: SearchPostsRequest, initOverrides?: RequestInit | runtime.InitOverrideFunction): Promise<PagedPostSearchResult> {
+        const response = await this.searchPostsRaw(requestParameters, initOverrides);
+        return await response.value();
+    }
+
     /**
      * Update an existing blog post. All fields in payload are optional. `series_id` can be provided or set to `null` to disassociate from a series.
      * Update Post
@@ -581,3 +675,13 @@ export class PostsApi extends runtime.BaseAPI {
     }
 
 }
+
+/**
+ * @export
+ */
+export const GetPostFilesByIdVisibilityEnum = {
+    Public: 'public',
+    Private: 'private',
+    All: 'all'
+} as const;
+export type GetPostFilesByIdVisibilityEnum = typeof GetPostFilesByIdVisibilityEnum[keyof typeof GetPostFilesByIdVisibilityEnum];
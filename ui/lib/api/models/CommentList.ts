@@ -13,12 +13,12 @@
  */
 
 import { mapValues } from '../runtime';
-import type { PostDetails } from './PostDetails';
+import type { PostSummary } from './PostSummary';
 import {
-    PostDetailsFromJSON,
-    PostDetailsFromJSONTyped,
-    PostDetailsToJSON,
-} from './PostDetails';
+    PostSummaryFromJSON,
+    PostSummaryFromJSONTyped,
+    PostSummaryToJSON,
+} from './PostSummary';
 import type { AuthorSummary } from './AuthorSummary';
 import {
     AuthorSummaryFromJSON,
@@ -70,10 +70,10 @@ export interface CommentList {
     updatedAt: Date;
     /**
      * 
-     * @type {PostDetails}
+     * @type {PostSummary}
      * @memberof CommentList
      */
-    post: PostDetails;
+    post: PostSummary;
 }
 
 /**
@@ -106,7 +106,7 @@ export function CommentListFromJSONTyped(json: any, ignoreDiscriminator: boolean
         'children': ((json['children'] as Array<any>).map(CommentListFromJSON)),
         'createdAt': (new Date(json['created_at'])),
         'updatedAt': (new Date(json['updated_at'])),
-        'post': PostDetailsFromJSON(json['post']),
+        'post': PostSummaryFromJSON(json['post']),
     };
 }
 
@@ -122,7 +122,7 @@ export function CommentListToJSON(value?: CommentList | null): any {
         'children': ((value['children'] as Array<any>).map(CommentListToJSON)),
         'created_at': ((value['createdAt']).toISOString()),
         'updated_at': ((value['updatedAt']).toISOString()),
-        'post': PostDetailsToJSON(value['post']),
+        'post': PostSummaryToJSON(value['post']),
     };
 }
 
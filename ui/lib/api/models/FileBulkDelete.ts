@@ -0,0 +1,75 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * ooo-yay.com API
+ * Resource-based API for ooo-yay.com.
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+import type { OrphanedObject } from './OrphanedObject';
+import {
+    OrphanedObjectFromJSON,
+    OrphanedObjectFromJSONTyped,
+    OrphanedObjectToJSON,
+} from './OrphanedObject';
+
+/**
+ * 
+ * @export
+ * @interface FileBulkDelete
+ */
+export interface FileBulkDelete {
+    /**
+     * 
+     * @type {Array<number>}
+     * @memberof FileBulkDelete
+     */
+    ids?: Array<number>;
+    /**
+     * 
+     * @type {Array<OrphanedObject>}
+     * @memberof FileBulkDelete
+     */
+    orphans?: Array<OrphanedObject>;
+}
+
+/**
+ * Check if a given object implements the FileBulkDelete interface.
+ */
+export function instanceOfFileBulkDelete(value: object): value is FileBulkDelete {
+    return true;
+}
+
+export function FileBulkDeleteFromJSON(json: any): FileBulkDelete {
+    return FileBulkDeleteFromJSONTyped(json, false);
+}
+
+export function FileBulkDeleteFromJSONTyped(json: any, ignoreDiscriminator: boolean): FileBulkDelete {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'ids': json['ids'] == null ? undefined : json['ids'],
+        'orphans': json['orphans'] == null ? undefined : ((json['orphans'] as Array<any>).map(OrphanedObjectFromJSON)),
+    };
+}
+
+export function FileBulkDeleteToJSON(value?: FileBulkDelete | null): any {
+    if (value == null) {
+        return value;
+    }
+    return {
+        
+        'ids': value['ids'],
+        'orphans': value['orphans'] == null ? undefined : ((value['orphans'] as Array<any>).map(OrphanedObjectToJSON)),
+    };
+}
+
@@ -0,0 +1,86 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * ooo-yay.com API
+ * Resource-based API for ooo-yay.com.
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+import type { ObjectDeleteFailure } from './ObjectDeleteFailure';
+import {
+    ObjectDeleteFailureFromJSON,
+    ObjectDeleteFailureFromJSONTyped,
+    ObjectDeleteFailureToJSON,
+} from './ObjectDeleteFailure';
+
+/**
+ * 
+ * @export
+ * @interface FileBulkDeleteResult
+ */
+export interface FileBulkDeleteResult {
+    /**
+     * IDs of the deleted files.
+     * @type {Array<number>}
+     * @memberof FileBulkDeleteResult
+     */
+    files: Array<number>;
+    /**
+     * Objects removed from storage.
+     * @type {number}
+     * @memberof FileBulkDeleteResult
+     */
+    objects: number;
+    /**
+     * 
+     * @type {Array<ObjectDeleteFailure>}
+     * @memberof FileBulkDeleteResult
+     */
+    failures: Array<ObjectDeleteFailure>;
+}
+
+/**
+ * Check if a given object implements the FileBulkDeleteResult interface.
+ */
+export function instanceOfFileBulkDeleteResult(value: object): value is FileBulkDeleteResult {
+    if (!('files' in value) || value['files'] === undefined) return false;
+    if (!('objects' in value) || value['objects'] === undefined) return false;
+    if (!('failures' in value) || value['failures'] === undefined) return false;
+    return true;
+}
+
+export function FileBulkDeleteResultFromJSON(json: any): FileBulkDeleteResult {
+    return FileBulkDeleteResultFromJSONTyped(json, false);
+}
+
+export function FileBulkDeleteResultFromJSONTyped(json: any, ignoreDiscriminator: boolean): FileBulkDeleteResult {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'files': json['files'],
+        'objects': json['objects'],
+        'failures': ((json['failures'] as Array<any>).map(ObjectDeleteFailureFromJSON)),
+    };
+}
+
+export function FileBulkDeleteResultToJSON(value?: FileBulkDeleteResult | null): any {
+    if (value == null) {
+        return value;
+    }
+    return {
+        
+        'files': value['files'],
+        'objects': value['objects'],
+        'failures': ((value['failures'] as Array<any>).map(ObjectDeleteFailureToJSON)),
+    };
+}
+
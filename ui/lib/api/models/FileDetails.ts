@@ -19,6 +19,12 @@ import {
     PostSummaryFromJSONTyped,
     PostSummaryToJSON,
 } from './PostSummary';
+import type { ImageSource } from './ImageSource';
+import {
+    ImageSourceFromJSON,
+    ImageSourceFromJSONTyped,
+    ImageSourceToJSON,
+} from './ImageSource';
 
 /**
  * 
@@ -80,6 +86,12 @@ export interface FileDetails {
      * @memberof FileDetails
      */
     visibility: string;
+    /**
+     * Resized copies of an image in modern formats, by format and width. Filled in shortly after upload.
+     * @type {Array<ImageSource>}
+     * @memberof FileDetails
+     */
+    srcset?: Array<ImageSource>;
 }
 
 /**
@@ -117,6 +129,7 @@ export function FileDetailsFromJSONTyped(json: any, ignoreDiscriminator: boolean
         'createdAt': (new Date(json['created_at'])),
         'posts': ((json['posts'] as Array<any>).map(PostSummaryFromJSON)),
         'visibility': json['visibility'],
+        'srcset': json['srcset'] == null ? undefined : ((json['srcset'] as Array<any>).map(ImageSourceFromJSON)),
     };
 }
 
@@ -135,6 +148,7 @@ export function FileDetailsToJSON(value?: FileDetails | null): any {
         'created_at': ((value['createdAt']).toISOString()),
         'posts': ((value['posts'] as Array<any>).map(PostSummaryToJSON)),
         'visibility': value['visibility'],
+        'srcset': value['srcset'] == null ? undefined : ((value['srcset'] as Array<any>).map(ImageSourceToJSON)),
     };
 }
 
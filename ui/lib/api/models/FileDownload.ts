@@ -0,0 +1,69 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * ooo-yay.com API
+ * Resource-based API for ooo-yay.com.
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+/**
+ * 
+ * @export
+ * @interface FileDownload
+ */
+export interface FileDownload {
+    /**
+     * 
+     * @type {string}
+     * @memberof FileDownload
+     */
+    url: string;
+    /**
+     * 
+     * @type {Date}
+     * @memberof FileDownload
+     */
+    expiresAt?: Date | null;
+}
+
+/**
+ * Check if a given object implements the FileDownload interface.
+ */
+export function instanceOfFileDownload(value: object): value is FileDownload {
+    if (!('url' in value) || value['url'] === undefined) return false;
+    return true;
+}
+
+export function FileDownloadFromJSON(json: any): FileDownload {
+    return FileDownloadFromJSONTyped(json, false);
+}
+
+export function FileDownloadFromJSONTyped(json: any, ignoreDiscriminator: boolean): FileDownload {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'url': json['url'],
+        'expiresAt': json['expires_at'] == null ? undefined : (new Date(json['expires_at'])),
+    };
+}
+
+export function FileDownloadToJSON(value?: FileDownload | null): any {
+    if (value == null) {
+        return value;
+    }
+    return {
+        
+        'url': value['url'],
+        'expires_at': value['expiresAt'] == null ? undefined : ((value['expiresAt'] as any).toISOString()),
+    };
+}
+
@@ -0,0 +1,80 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * ooo-yay.com API
+ * Resource-based API for ooo-yay.com.
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+/**
+ * 
+ * @export
+ * @interface FileFilters
+ */
+export interface FileFilters {
+    /**
+     * 
+     * @type {FileFiltersVisibilityEnum}
+     * @memberof FileFilters
+     */
+    visibility?: FileFiltersVisibilityEnum;
+    /**
+     * 
+     * @type {string}
+     * @memberof FileFilters
+     */
+    contentType?: string | null;
+}
+
+
+/**
+ * @export
+ */
+export const FileFiltersVisibilityEnum = {
+    Public: 'public',
+    Private: 'private',
+    All: 'all'
+} as const;
+export type FileFiltersVisibilityEnum = typeof FileFiltersVisibilityEnum[keyof typeof FileFiltersVisibilityEnum];
+
+
+/**
+ * Check if a given object implements the FileFilters interface.
+ */
+export function instanceOfFileFilters(value: object): value is FileFilters {
+    return true;
+}
+
+export function FileFiltersFromJSON(json: any): FileFilters {
+    return FileFiltersFromJSONTyped(json, false);
+}
+
+export function FileFiltersFromJSONTyped(json: any, ignoreDiscriminator: boolean): FileFilters {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'visibility': json['visibility'] == null ? undefined : json['visibility'],
+        'contentType': json['content_type'] == null ? undefined : json['content_type'],
+    };
+}
+
+export function FileFiltersToJSON(value?: FileFilters | null): any {
+    if (value == null) {
+        return value;
+    }
+    return {
+        
+        'visibility': value['visibility'],
+        'content_type': value['contentType'],
+    };
+}
+
@@ -25,8 +25,25 @@ export interface FileMutateMetadata {
      * @memberof FileMutateMetadata
      */
     posts?: Array<number> | null;
+    /**
+     * 
+     * @type {FileMutateMetadataVisibilityEnum}
+     * @memberof FileMutateMetadata
+     */
+    visibility?: FileMutateMetadataVisibilityEnum | null;
 }
 
+
+/**
+ * @export
+ */
+export const FileMutateMetadataVisibilityEnum = {
+    Public: 'public',
+    Private: 'private'
+} as const;
+export type FileMutateMetadataVisibilityEnum = typeof FileMutateMetadataVisibilityEnum[keyof typeof FileMutateMetadataVisibilityEnum];
+
+
 /**
  * Check if a given object implements the FileMutateMetadata interface.
  */
@@ -45,6 +62,7 @@ export function FileMutateMetadataFromJSONTyped(json: any, ignoreDiscriminator:
     return {
         
         'posts': json['posts'] == null ? undefined : json['posts'],
+        'visibility': json['visibility'] == null ? undefined : json['visibility'],
     };
 }
 
@@ -55,6 +73,7 @@ export function FileMutateMetadataToJSON(value?: FileMutateMetadata | null): any
     return {
         
         'posts': value['posts'],
+        'visibility': value['visibility'],
     };
 }
 
@@ -0,0 +1,61 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * ooo-yay.com API
+ * Resource-based API for ooo-yay.com.
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+/**
+ * 
+ * @export
+ * @interface FileUploadComplete
+ */
+export interface FileUploadComplete {
+    /**
+     * 
+     * @type {string}
+     * @memberof FileUploadComplete
+     */
+    token: string;
+}
+
+/**
+ * Check if a given object implements the FileUploadComplete interface.
+ */
+export function instanceOfFileUploadComplete(value: object): value is FileUploadComplete {
+    if (!('token' in value) || value['token'] === undefined) return false;
+    return true;
+}
+
+export function FileUploadCompleteFromJSON(json: any): FileUploadComplete {
+    return FileUploadCompleteFromJSONTyped(json, false);
+}
+
+export function FileUploadCompleteFromJSONTyped(json: any, ignoreDiscriminator: boolean): FileUploadComplete {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'token': json['token'],
+    };
+}
+
+export function FileUploadCompleteToJSON(value?: FileUploadComplete | null): any {
+    if (value == null) {
+        return value;
+    }
+    return {
+        
+        'token': value['token'],
+    };
+}
+
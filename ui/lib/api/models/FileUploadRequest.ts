@@ -0,0 +1,104 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * ooo-yay.com API
+ * Resource-based API for ooo-yay.com.
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+/**
+ * 
+ * @export
+ * @interface FileUploadRequest
+ */
+export interface FileUploadRequest {
+    /**
+     * 
+     * @type {string}
+     * @memberof FileUploadRequest
+     */
+    name: string;
+    /**
+     * 
+     * @type {string}
+     * @memberof FileUploadRequest
+     */
+    contentType?: string;
+    /**
+     * 
+     * @type {FileUploadRequestVisibilityEnum}
+     * @memberof FileUploadRequest
+     */
+    visibility?: FileUploadRequestVisibilityEnum;
+    /**
+     * 
+     * @type {Array<number>}
+     * @memberof FileUploadRequest
+     */
+    posts?: Array<number> | null;
+    /**
+     * 
+     * @type {string}
+     * @memberof FileUploadRequest
+     */
+    sha256?: string | null;
+}
+
+
+/**
+ * @export
+ */
+export const FileUploadRequestVisibilityEnum = {
+    Public: 'public',
+    Private: 'private'
+} as const;
+export type FileUploadRequestVisibilityEnum = typeof FileUploadRequestVisibilityEnum[keyof typeof FileUploadRequestVisibilityEnum];
+
+
+/**
+ * Check if a given object implements the FileUploadRequest interface.
+ */
+export function instanceOfFileUploadRequest(value: object): value is FileUploadRequest {
+    if (!('name' in value) || value['name'] === undefined) return false;
+    return true;
+}
+
+export function FileUploadRequestFromJSON(json: any): FileUploadRequest {
+    return FileUploadRequestFromJSONTyped(json, false);
+}
+
+export function FileUploadRequestFromJSONTyped(json: any, ignoreDiscriminator: boolean): FileUploadRequest {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'name': json['name'],
+        'contentType': json['content_type'] == null ? undefined : json['content_type'],
+        'visibility': json['visibility'] == null ? undefined : json['visibility'],
+        'posts': json['posts'] == null ? undefined : json['posts'],
+        'sha256': json['sha256'] == null ? undefined : json['sha256'],
+    };
+}
+
+export function FileUploadRequestToJSON(value?: FileUploadRequest | null): any {
+    if (value == null) {
+        return value;
+    }
+    return {
+        
+        'name': value['name'],
+        'content_type': value['contentType'],
+        'visibility': value['visibility'],
+        'posts': value['posts'],
+        'sha256': value['sha256'],
+    };
+}
+
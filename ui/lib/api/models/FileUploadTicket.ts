@@ -0,0 +1,116 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * ooo-yay.com API
+ * Resource-based API for ooo-yay.com.
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+import type { FileDetails } from './FileDetails';
+import {
+    FileDetailsFromJSON,
+    FileDetailsFromJSONTyped,
+    FileDetailsToJSON,
+} from './FileDetails';
+
+/**
+ * 
+ * @export
+ * @interface FileUploadTicket
+ */
+export interface FileUploadTicket {
+    /**
+     * The name the object will be stored under.
+     * @type {string}
+     * @memberof FileUploadTicket
+     */
+    name: string;
+    /**
+     * 
+     * @type {string}
+     * @memberof FileUploadTicket
+     */
+    url?: string | null;
+    /**
+     * 
+     * @type {string}
+     * @memberof FileUploadTicket
+     */
+    method?: string;
+    /**
+     * Headers the upload request must send.
+     * @type {{ [key: string]: string; }}
+     * @memberof FileUploadTicket
+     */
+    headers?: { [key: string]: string; };
+    /**
+     * 
+     * @type {Date}
+     * @memberof FileUploadTicket
+     */
+    expiresAt?: Date | null;
+    /**
+     * 
+     * @type {string}
+     * @memberof FileUploadTicket
+     */
+    token?: string | null;
+    /**
+     * 
+     * @type {FileDetails}
+     * @memberof FileUploadTicket
+     */
+    file?: FileDetails | null;
+}
+
+/**
+ * Check if a given object implements the FileUploadTicket interface.
+ */
+export function instanceOfFileUploadTicket(value: object): value is FileUploadTicket {
+    if (!('name' in value) || value['name'] === undefined) return false;
+    return true;
+}
+
+export function FileUploadTicketFromJSON(json: any): FileUploadTicket {
+    return FileUploadTicketFromJSONTyped(json, false);
+}
+
+export function FileUploadTicketFromJSONTyped(json: any, ignoreDiscriminator: boolean): FileUploadTicket {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'name': json['name'],
+        'url': json['url'] == null ? undefined : json['url'],
+        'method': json['method'] == null ? undefined : json['method'],
+        'headers': json['headers'] == null ? undefined : json['headers'],
+        'expiresAt': json['expires_at'] == null ? undefined : (new Date(json['expires_at'])),
+        'token': json['token'] == null ? undefined : json['token'],
+        'file': json['file'] == null ? undefined : FileDetailsFromJSON(json['file']),
+    };
+}
+
+export function FileUploadTicketToJSON(value?: FileUploadTicket | null): any {
+    if (value == null) {
+        return value;
+    }
+    return {
+        
+        'name': value['name'],
+        'url': value['url'],
+        'method': value['method'],
+        'headers': value['headers'],
+        'expires_at': value['expiresAt'] == null ? undefined : ((value['expiresAt'] as any).toISOString()),
+        'token': value['token'],
+        'file': FileDetailsToJSON(value['file']),
+    };
+}
+
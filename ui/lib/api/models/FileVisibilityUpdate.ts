@@ -0,0 +1,81 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * ooo-yay.com API
+ * Resource-based API for ooo-yay.com.
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+/**
+ * 
+ * @export
+ * @interface FileVisibilityUpdate
+ */
+export interface FileVisibilityUpdate {
+    /**
+     * 
+     * @type {Array<number>}
+     * @memberof FileVisibilityUpdate
+     */
+    ids: Array<number>;
+    /**
+     * 
+     * @type {FileVisibilityUpdateVisibilityEnum}
+     * @memberof FileVisibilityUpdate
+     */
+    visibility: FileVisibilityUpdateVisibilityEnum;
+}
+
+
+/**
+ * @export
+ */
+export const FileVisibilityUpdateVisibilityEnum = {
+    Public: 'public',
+    Private: 'private'
+} as const;
+export type FileVisibilityUpdateVisibilityEnum = typeof FileVisibilityUpdateVisibilityEnum[keyof typeof FileVisibilityUpdateVisibilityEnum];
+
+
+/**
+ * Check if a given object implements the FileVisibilityUpdate interface.
+ */
+export function instanceOfFileVisibilityUpdate(value: object): value is FileVisibilityUpdate {
+    if (!('ids' in value) || value['ids'] === undefined) return false;
+    if (!('visibility' in value) || value['visibility'] === undefined) return false;
+    return true;
+}
+
+export function FileVisibilityUpdateFromJSON(json: any): FileVisibilityUpdate {
+    return FileVisibilityUpdateFromJSONTyped(json, false);
+}
+
+export function FileVisibilityUpdateFromJSONTyped(json: any, ignoreDiscriminator: boolean): FileVisibilityUpdate {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'ids': json['ids'],
+        'visibility': json['visibility'],
+    };
+}
+
+export function FileVisibilityUpdateToJSON(value?: FileVisibilityUpdate | null): any {
+    if (value == null) {
+        return value;
+    }
+    return {
+        
+        'ids': value['ids'],
+        'visibility': value['visibility'],
+    };
+}
+
@@ -0,0 +1,88 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * ooo-yay.com API
+ * Resource-based API for ooo-yay.com.
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+/**
+ * 
+ * @export
+ * @interface ImageSource
+ */
+export interface ImageSource {
+    /**
+     * 
+     * @type {string}
+     * @memberof ImageSource
+     */
+    location: string;
+    /**
+     * 
+     * @type {string}
+     * @memberof ImageSource
+     */
+    contentType: string;
+    /**
+     * 
+     * @type {number}
+     * @memberof ImageSource
+     */
+    width: number;
+    /**
+     * 
+     * @type {number}
+     * @memberof ImageSource
+     */
+    height: number;
+}
+
+/**
+ * Check if a given object implements the ImageSource interface.
+ */
+export function instanceOfImageSource(value: object): value is ImageSource {
+    if (!('location' in value) || value['location'] === undefined) return false;
+    if (!('contentType' in value) || value['contentType'] === undefined) return false;
+    if (!('width' in value) || value['width'] === undefined) return false;
+    if (!('height' in value) || value['height'] === undefined) return false;
+    return true;
+}
+
+export function ImageSourceFromJSON(json: any): ImageSource {
+    return ImageSourceFromJSONTyped(json, false);
+}
+
+export function ImageSourceFromJSONTyped(json: any, ignoreDiscriminator: boolean): ImageSource {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'location': json['location'],
+        'contentType': json['content_type'],
+        'width': json['width'],
+        'height': json['height'],
+    };
+}
+
+export function ImageSourceToJSON(value?: ImageSource | null): any {
+    if (value == null) {
+        return value;
+    }
+    return {
+        
+        'location': value['location'],
+        'content_type': value['contentType'],
+        'width': value['width'],
+        'height': value['height'],
+    };
+}
+
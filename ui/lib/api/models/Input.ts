@@ -26,11 +26,23 @@ export interface Input {
      */
     limit?: number;
     /**
-     * 
+     * Ignored when a cursor is given.
      * @type {number}
      * @memberof Input
      */
     offset?: number;
+    /**
+     * 
+     * @type {string}
+     * @memberof Input
+     */
+    cursor?: string | null;
+    /**
+     * Set to false to skip counting all items.
+     * @type {boolean}
+     * @memberof Input
+     */
+    withCount?: boolean;
 }
 
 /**
@@ -52,6 +64,8 @@ export function InputFromJSONTyped(json: any, ignoreDiscriminator: boolean): Inp
         
         'limit': json['limit'] == null ? undefined : json['limit'],
         'offset': json['offset'] == null ? undefined : json['offset'],
+        'cursor': json['cursor'] == null ? undefined : json['cursor'],
+        'withCount': json['with_count'] == null ? undefined : json['with_count'],
     };
 }
 
@@ -63,6 +77,8 @@ export function InputToJSON(value?: Input | null): any {
         
         'limit': value['limit'],
         'offset': value['offset'],
+        'cursor': value['cursor'],
+        'with_count': value['withCount'],
     };
 }
 
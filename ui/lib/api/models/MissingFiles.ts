@@ -0,0 +1,77 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * ooo-yay.com API
+ * Resource-based API for ooo-yay.com.
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+import type { FileDetails } from './FileDetails';
+import {
+    FileDetailsFromJSON,
+    FileDetailsFromJSONTyped,
+    FileDetailsToJSON,
+} from './FileDetails';
+
+/**
+ * 
+ * @export
+ * @interface MissingFiles
+ */
+export interface MissingFiles {
+    /**
+     * 
+     * @type {Date}
+     * @memberof MissingFiles
+     */
+    snapshotAt: Date | null;
+    /**
+     * 
+     * @type {Array<FileDetails>}
+     * @memberof MissingFiles
+     */
+    files: Array<FileDetails>;
+}
+
+/**
+ * Check if a given object implements the MissingFiles interface.
+ */
+export function instanceOfMissingFiles(value: object): value is MissingFiles {
+    if (!('snapshotAt' in value) || value['snapshotAt'] === undefined) return false;
+    if (!('files' in value) || value['files'] === undefined) return false;
+    return true;
+}
+
+export function MissingFilesFromJSON(json: any): MissingFiles {
+    return MissingFilesFromJSONTyped(json, false);
+}
+
+export function MissingFilesFromJSONTyped(json: any, ignoreDiscriminator: boolean): MissingFiles {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'snapshotAt': (json['snapshot_at'] == null ? null : new Date(json['snapshot_at'])),
+        'files': ((json['files'] as Array<any>).map(FileDetailsFromJSON)),
+    };
+}
+
+export function MissingFilesToJSON(value?: MissingFiles | null): any {
+    if (value == null) {
+        return value;
+    }
+    return {
+        
+        'snapshot_at': (value['snapshotAt'] == null ? null : (value['snapshotAt'] as any).toISOString()),
+        'files': ((value['files'] as Array<any>).map(FileDetailsToJSON)),
+    };
+}
+
@@ -0,0 +1,88 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * ooo-yay.com API
+ * Resource-based API for ooo-yay.com.
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+/**
+ * 
+ * @export
+ * @interface ObjectDeleteFailure
+ */
+export interface ObjectDeleteFailure {
+    /**
+     * 
+     * @type {string}
+     * @memberof ObjectDeleteFailure
+     */
+    name: string;
+    /**
+     * 
+     * @type {string}
+     * @memberof ObjectDeleteFailure
+     */
+    visibility: string;
+    /**
+     * 
+     * @type {string}
+     * @memberof ObjectDeleteFailure
+     */
+    code: string;
+    /**
+     * 
+     * @type {string}
+     * @memberof ObjectDeleteFailure
+     */
+    message: string;
+}
+
+/**
+ * Check if a given object implements the ObjectDeleteFailure interface.
+ */
+export function instanceOfObjectDeleteFailure(value: object): value is ObjectDeleteFailure {
+    if (!('name' in value) || value['name'] === undefined) return false;
+    if (!('visibility' in value) || value['visibility'] === undefined) return false;
+    if (!('code' in value) || value['code'] === undefined) return false;
+    if (!('message' in value) || value['message'] === undefined) return false;
+    return true;
+}
+
+export function ObjectDeleteFailureFromJSON(json: any): ObjectDeleteFailure {
+    return ObjectDeleteFailureFromJSONTyped(json, false);
+}
+
+export function ObjectDeleteFailureFromJSONTyped(json: any, ignoreDiscriminator: boolean): ObjectDeleteFailure {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'name': json['name'],
+        'visibility': json['visibility'],
+        'code': json['code'],
+        'message': json['message'],
+    };
+}
+
+export function ObjectDeleteFailureToJSON(value?: ObjectDeleteFailure | null): any {
+    if (value == null) {
+        return value;
+    }
+    return {
+        
+        'name': value['name'],
+        'visibility': value['visibility'],
+        'code': value['code'],
+        'message': value['message'],
+    };
+}
+
@@ -38,6 +38,24 @@ export interface OrphanedFiles {
      * @memberof OrphanedFiles
      */
     _private: Array<OrphanedFileDetails>;
+    /**
+     * 
+     * @type {Date}
+     * @memberof OrphanedFiles
+     */
+    snapshotAt?: Date | null;
+    /**
+     * False when a live scan failed part way; the lists are then partial and must not be acted on.
+     * @type {boolean}
+     * @memberof OrphanedFiles
+     */
+    complete?: boolean;
+    /**
+     * 
+     * @type {string}
+     * @memberof OrphanedFiles
+     */
+    error?: string | null;
 }
 
 /**
@@ -61,6 +79,9 @@ export function OrphanedFilesFromJSONTyped(json: any, ignoreDiscriminator: boole
         
         '_public': ((json['public'] as Array<any>).map(OrphanedFileDetailsFromJSON)),
         '_private': ((json['private'] as Array<any>).map(OrphanedFileDetailsFromJSON)),
+        'snapshotAt': json['snapshot_at'] == null ? undefined : (new Date(json['snapshot_at'])),
+        'complete': json['complete'] == null ? undefined : json['complete'],
+        'error': json['error'] == null ? undefined : json['error'],
     };
 }
 
@@ -72,6 +93,9 @@ export function OrphanedFilesToJSON(value?: OrphanedFiles | null): any {
         
         'public': ((value['_public'] as Array<any>).map(OrphanedFileDetailsToJSON)),
         'private': ((value['_private'] as Array<any>).map(OrphanedFileDetailsToJSON)),
+        'snapshot_at': value['snapshotAt'] == null ? undefined : ((value['snapshotAt'] as any).toISOString()),
+        'complete': value['complete'],
+        'error': value['error'],
     };
 }
 
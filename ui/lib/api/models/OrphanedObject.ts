@@ -0,0 +1,81 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * ooo-yay.com API
+ * Resource-based API for ooo-yay.com.
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+/**
+ * 
+ * @export
+ * @interface OrphanedObject
+ */
+export interface OrphanedObject {
+    /**
+     * 
+     * @type {string}
+     * @memberof OrphanedObject
+     */
+    name: string;
+    /**
+     * 
+     * @type {OrphanedObjectVisibilityEnum}
+     * @memberof OrphanedObject
+     */
+    visibility: OrphanedObjectVisibilityEnum;
+}
+
+
+/**
+ * @export
+ */
+export const OrphanedObjectVisibilityEnum = {
+    Public: 'public',
+    Private: 'private'
+} as const;
+export type OrphanedObjectVisibilityEnum = typeof OrphanedObjectVisibilityEnum[keyof typeof OrphanedObjectVisibilityEnum];
+
+
+/**
+ * Check if a given object implements the OrphanedObject interface.
+ */
+export function instanceOfOrphanedObject(value: object): value is OrphanedObject {
+    if (!('name' in value) || value['name'] === undefined) return false;
+    if (!('visibility' in value) || value['visibility'] === undefined) return false;
+    return true;
+}
+
+export function OrphanedObjectFromJSON(json: any): OrphanedObject {
+    return OrphanedObjectFromJSONTyped(json, false);
+}
+
+export function OrphanedObjectFromJSONTyped(json: any, ignoreDiscriminator: boolean): OrphanedObject {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'name': json['name'],
+        'visibility': json['visibility'],
+    };
+}
+
+export function OrphanedObjectToJSON(value?: OrphanedObject | null): any {
+    if (value == null) {
+        return value;
+    }
+    return {
+        
+        'name': value['name'],
+        'visibility': value['visibility'],
+    };
+}
+
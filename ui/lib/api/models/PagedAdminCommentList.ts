@@ -37,7 +37,13 @@ export interface PagedAdminCommentList {
      * @type {number}
      * @memberof PagedAdminCommentList
      */
-    count: number;
+    count?: number | null;
+    /**
+     * 
+     * @type {string}
+     * @memberof PagedAdminCommentList
+     */
+    nextCursor?: string | null;
 }
 
 /**
@@ -45,7 +51,6 @@ export interface PagedAdminCommentList {
  */
 export function instanceOfPagedAdminCommentList(value: object): value is PagedAdminCommentList {
     if (!('items' in value) || value['items'] === undefined) return false;
-    if (!('count' in value) || value['count'] === undefined) return false;
     return true;
 }
 
@@ -60,7 +65,8 @@ export function PagedAdminCommentListFromJSONTyped(json: any, ignoreDiscriminato
     return {
         
         'items': ((json['items'] as Array<any>).map(AdminCommentListFromJSON)),
-        'count': json['count'],
+        'count': json['count'] == null ? undefined : json['count'],
+        'nextCursor': json['next_cursor'] == null ? undefined : json['next_cursor'],
     };
 }
 
@@ -72,6 +78,7 @@ export function PagedAdminCommentListToJSON(value?: PagedAdminCommentList | null
         
         'items': ((value['items'] as Array<any>).map(AdminCommentListToJSON)),
         'count': value['count'],
+        'next_cursor': value['nextCursor'],
     };
 }
 
@@ -37,7 +37,13 @@ export interface PagedCommentList {
      * @type {number}
      * @memberof PagedCommentList
      */
-    count: number;
+    count?: number | null;
+    /**
+     * 
+     * @type {string}
+     * @memberof PagedCommentList
+     */
+    nextCursor?: string | null;
 }
 
 /**
@@ -45,7 +51,6 @@ export interface PagedCommentList {
  */
 export function instanceOfPagedCommentList(value: object): value is PagedCommentList {
     if (!('items' in value) || value['items'] === undefined) return false;
-    if (!('count' in value) || value['count'] === undefined) return false;
     return true;
 }
 
@@ -60,7 +65,8 @@ export function PagedCommentListFromJSONTyped(json: any, ignoreDiscriminator: bo
     return {
         
         'items': ((json['items'] as Array<any>).map(CommentListFromJSON)),
-        'count': json['count'],
+        'count': json['count'] == null ? undefined : json['count'],
+        'nextCursor': json['next_cursor'] == null ? undefined : json['next_cursor'],
     };
 }
 
@@ -72,6 +78,7 @@ export function PagedCommentListToJSON(value?: PagedCommentList | null): any {
         
         'items': ((value['items'] as Array<any>).map(CommentListToJSON)),
         'count': value['count'],
+        'next_cursor': value['nextCursor'],
     };
 }
 
@@ -37,7 +37,13 @@ export interface PagedFileDetails {
      * @type {number}
      * @memberof PagedFileDetails
      */
-    count: number;
+    count?: number | null;
+    /**
+     * 
+     * @type {string}
+     * @memberof PagedFileDetails
+     */
+    nextCursor?: string | null;
 }
 
 /**
@@ -45,7 +51,6 @@ export interface PagedFileDetails {
  */
 export function instanceOfPagedFileDetails(value: object): value is PagedFileDetails {
     if (!('items' in value) || value['items'] === undefined) return false;
-    if (!('count' in value) || value['count'] === undefined) return false;
     return true;
 }
 
@@ -60,7 +65,8 @@ export function PagedFileDetailsFromJSONTyped(json: any, ignoreDiscriminator: bo
     return {
         
         'items': ((json['items'] as Array<any>).map(FileDetailsFromJSON)),
-        'count': json['count'],
+        'count': json['count'] == null ? undefined : json['count'],
+        'nextCursor': json['next_cursor'] == null ? undefined : json['next_cursor'],
     };
 }
 
@@ -72,6 +78,7 @@ export function PagedFileDetailsToJSON(value?: PagedFileDetails | null): any {
         
         'items': ((value['items'] as Array<any>).map(FileDetailsToJSON)),
         'count': value['count'],
+        'next_cursor': value['nextCursor'],
     };
 }
 
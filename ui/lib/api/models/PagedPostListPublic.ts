@@ -37,7 +37,13 @@ export interface PagedPostListPublic {
      * @type {number}
      * @memberof PagedPostListPublic
      */
-    count: number;
+    count?: number | null;
+    /**
+     * 
+     * @type {string}
+     * @memberof PagedPostListPublic
+     */
+    nextCursor?: string | null;
 }
 
 /**
@@ -45,7 +51,6 @@ export interface PagedPostListPublic {
  */
 export function instanceOfPagedPostListPublic(value: object): value is PagedPostListPublic {
     if (!('items' in value) || value['items'] === undefined) return false;
-    if (!('count' in value) || value['count'] === undefined) return false;
     return true;
 }
 
@@ -60,7 +65,8 @@ export function PagedPostListPublicFromJSONTyped(json: any, ignoreDiscriminator:
     return {
         
         'items': ((json['items'] as Array<any>).map(PostListPublicFromJSON)),
-        'count': json['count'],
+        'count': json['count'] == null ? undefined : json['count'],
+        'nextCursor': json['next_cursor'] == null ? undefined : json['next_cursor'],
     };
 }
 
@@ -72,6 +78,7 @@ export function PagedPostListPublicToJSON(value?: PagedPostListPublic | null): a
         
         'items': ((value['items'] as Array<any>).map(PostListPublicToJSON)),
         'count': value['count'],
+        'next_cursor': value['nextCursor'],
     };
 }
 
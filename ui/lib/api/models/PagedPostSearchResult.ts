@@ -0,0 +1,84 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * ooo-yay.com API
+ * Resource-based API for ooo-yay.com.
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+import type { PostSearchResult } from './PostSearchResult';
+import {
+    PostSearchResultFromJSON,
+    PostSearchResultFromJSONTyped,
+    PostSearchResultToJSON,
+} from './PostSearchResult';
+
+/**
+ * 
+ * @export
+ * @interface PagedPostSearchResult
+ */
+export interface PagedPostSearchResult {
+    /**
+     * 
+     * @type {Array<PostSearchResult>}
+     * @memberof PagedPostSearchResult
+     */
+    items: Array<PostSearchResult>;
+    /**
+     * 
+     * @type {number}
+     * @memberof PagedPostSearchResult
+     */
+    count?: number | null;
+    /**
+     * 
+     * @type {string}
+     * @memberof PagedPostSearchResult
+     */
+    nextCursor?: string | null;
+}
+
+/**
+ * Check if a given object implements the PagedPostSearchResult interface.
+ */
+export function instanceOfPagedPostSearchResult(value: object): value is PagedPostSearchResult {
+    if (!('items' in value) || value['items'] === undefined) return false;
+    return true;
+}
+
+export function PagedPostSearchResultFromJSON(json: any): PagedPostSearchResult {
+    return PagedPostSearchResultFromJSONTyped(json, false);
+}
+
+export function PagedPostSearchResultFromJSONTyped(json: any, ignoreDiscriminator: boolean): PagedPostSearchResult {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'items': ((json['items'] as Array<any>).map(PostSearchResultFromJSON)),
+        'count': json['count'] == null ? undefined : json['count'],
+        'nextCursor': json['next_cursor'] == null ? undefined : json['next_cursor'],
+    };
+}
+
+export function PagedPostSearchResultToJSON(value?: PagedPostSearchResult | null): any {
+    if (value == null) {
+        return value;
+    }
+    return {
+        
+        'items': ((value['items'] as Array<any>).map(PostSearchResultToJSON)),
+        'count': value['count'],
+        'next_cursor': value['nextCursor'],
+    };
+}
+
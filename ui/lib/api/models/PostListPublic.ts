@@ -27,11 +27,17 @@ import {
 } from './SeriesPublic';
 
 /**
- * 
+ * A post as shown on listings: the body is replaced by its precomputed excerpt.
  * @export
  * @interface PostListPublic
  */
 export interface PostListPublic {
+    /**
+     * 
+     * @type {number}
+     * @memberof PostListPublic
+     */
+    id: number;
     /**
      * 
      * @type {string}
@@ -43,31 +49,37 @@ export interface PostListPublic {
      * @type {string}
      * @memberof PostListPublic
      */
-    content: string;
+    slug: string;
     /**
      * 
-     * @type {Date}
+     * @type {string}
      * @memberof PostListPublic
      */
-    publishedAt?: Date | null;
+    excerpt: string;
     /**
      * 
      * @type {number}
      * @memberof PostListPublic
      */
-    seriesId?: number | null;
+    wordCount: number;
     /**
-     * 
+     * Estimated reading time in minutes
      * @type {number}
      * @memberof PostListPublic
      */
-    id: number;
+    readingTime: number;
     /**
      * 
-     * @type {string}
+     * @type {Date}
      * @memberof PostListPublic
      */
-    slug: string;
+    publishedAt?: Date | null;
+    /**
+     * 
+     * @type {number}
+     * @memberof PostListPublic
+     */
+    seriesId?: number | null;
     /**
      * 
      * @type {UserPublic}
@@ -104,10 +116,12 @@ export interface PostListPublic {
  * Check if a given object implements the PostListPublic interface.
  */
 export function instanceOfPostListPublic(value: object): value is PostListPublic {
-    if (!('title' in value) || value['title'] === undefined) return false;
-    if (!('content' in value) || value['content'] === undefined) return false;
     if (!('id' in value) || value['id'] === undefined) return false;
+    if (!('title' in value) || value['title'] === undefined) return false;
     if (!('slug' in value) || value['slug'] === undefined) return false;
+    if (!('excerpt' in value) || value['excerpt'] === undefined) return false;
+    if (!('wordCount' in value) || value['wordCount'] === undefined) return false;
+    if (!('readingTime' in value) || value['readingTime'] === undefined) return false;
     if (!('author' in value) || value['author'] === undefined) return false;
     if (!('createdAt' in value) || value['createdAt'] === undefined) return false;
     if (!('updatedAt' in value) || value['updatedAt'] === undefined) return false;
@@ -124,12 +138,14 @@ export function PostListPublicFromJSONTyped(json: any, ignoreDiscriminator: bool
     }
     return {
         
+        'id': json['id'],
         'title': json['title'],
-        'content': json['content'],
+        'slug': json['slug'],
+        'excerpt': json['excerpt'],
+        'wordCount': json['word_count'],
+        'readingTime': json['reading_time'],
         'publishedAt': json['published_at'] == null ? undefined : (new Date(json['published_at'])),
         'seriesId': json['series_id'] == null ? undefined : json['series_id'],
-        'id': json['id'],
-        'slug': json['slug'],
         'author': UserPublicFromJSON(json['author']),
         'createdAt': (new Date(json['created_at'])),
         'updatedAt': (new Date(json['updated_at'])),
@@ -144,12 +160,14 @@ export function PostListPublicToJSON(value?: PostListPublic | null): any {
     }
     return {
         
+        'id': value['id'],
         'title': value['title'],
-        'content': value['content'],
+        'slug': value['slug'],
+        'excerpt': value['excerpt'],
+        'word_count': value['wordCount'],
+        'reading_time': value['readingTime'],
         'published_at': value['publishedAt'] == null ? undefined : ((value['publishedAt'] as any).toISOString()),
         'series_id': value['seriesId'],
-        'id': value['id'],
-        'slug': value['slug'],
         'author': UserPublicToJSON(value['author']),
         'created_at': ((value['createdAt']).toISOString()),
         'updated_at': ((value['updatedAt']).toISOString()),
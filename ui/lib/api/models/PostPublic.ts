@@ -68,6 +68,12 @@ export interface PostPublic {
      * @memberof PostPublic
      */
     slug: string;
+    /**
+     * Content rendered to HTML on save
+     * @type {string}
+     * @memberof PostPublic
+     */
+    contentHtml?: string;
     /**
      * 
      * @type {UserPublic}
@@ -130,6 +136,7 @@ export function PostPublicFromJSONTyped(json: any, ignoreDiscriminator: boolean)
         'seriesId': json['series_id'] == null ? undefined : json['series_id'],
         'id': json['id'],
         'slug': json['slug'],
+        'contentHtml': json['content_html'] == null ? undefined : json['content_html'],
         'author': UserPublicFromJSON(json['author']),
         'createdAt': (new Date(json['created_at'])),
         'updatedAt': (new Date(json['updated_at'])),
@@ -150,6 +157,7 @@ export function PostPublicToJSON(value?: PostPublic | null): any {
         'series_id': value['seriesId'],
         'id': value['id'],
         'slug': value['slug'],
+        'content_html': value['contentHtml'],
         'author': UserPublicToJSON(value['author']),
         'created_at': ((value['createdAt']).toISOString()),
         'updated_at': ((value['updatedAt']).toISOString()),
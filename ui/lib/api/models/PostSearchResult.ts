@@ -0,0 +1,196 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * ooo-yay.com API
+ * Resource-based API for ooo-yay.com.
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+import type { UserPublic } from './UserPublic';
+import {
+    UserPublicFromJSON,
+    UserPublicFromJSONTyped,
+    UserPublicToJSON,
+} from './UserPublic';
+import type { SeriesPublic } from './SeriesPublic';
+import {
+    SeriesPublicFromJSON,
+    SeriesPublicFromJSONTyped,
+    SeriesPublicToJSON,
+} from './SeriesPublic';
+
+/**
+ * 
+ * @export
+ * @interface PostSearchResult
+ */
+export interface PostSearchResult {
+    /**
+     * 
+     * @type {number}
+     * @memberof PostSearchResult
+     */
+    id: number;
+    /**
+     * 
+     * @type {string}
+     * @memberof PostSearchResult
+     */
+    title: string;
+    /**
+     * 
+     * @type {string}
+     * @memberof PostSearchResult
+     */
+    slug: string;
+    /**
+     * 
+     * @type {string}
+     * @memberof PostSearchResult
+     */
+    excerpt: string;
+    /**
+     * 
+     * @type {number}
+     * @memberof PostSearchResult
+     */
+    wordCount: number;
+    /**
+     * Estimated reading time in minutes
+     * @type {number}
+     * @memberof PostSearchResult
+     */
+    readingTime: number;
+    /**
+     * 
+     * @type {Date}
+     * @memberof PostSearchResult
+     */
+    publishedAt?: Date | null;
+    /**
+     * 
+     * @type {number}
+     * @memberof PostSearchResult
+     */
+    seriesId?: number | null;
+    /**
+     * 
+     * @type {UserPublic}
+     * @memberof PostSearchResult
+     */
+    author: UserPublic;
+    /**
+     * 
+     * @type {Date}
+     * @memberof PostSearchResult
+     */
+    createdAt: Date;
+    /**
+     * 
+     * @type {Date}
+     * @memberof PostSearchResult
+     */
+    updatedAt: Date;
+    /**
+     * 
+     * @type {number}
+     * @memberof PostSearchResult
+     */
+    commentCount?: number;
+    /**
+     * 
+     * @type {SeriesPublic}
+     * @memberof PostSearchResult
+     */
+    series?: SeriesPublic | null;
+    /**
+     * Relevance; title matches weigh more than body matches
+     * @type {number}
+     * @memberof PostSearchResult
+     */
+    rank: number;
+    /**
+     * Matching excerpt with hits wrapped in <mark> tags
+     * @type {string}
+     * @memberof PostSearchResult
+     */
+    headline: string;
+}
+
+/**
+ * Check if a given object implements the PostSearchResult interface.
+ */
+export function instanceOfPostSearchResult(value: object): value is PostSearchResult {
+    if (!('id' in value) || value['id'] === undefined) return false;
+    if (!('title' in value) || value['title'] === undefined) return false;
+    if (!('slug' in value) || value['slug'] === undefined) return false;
+    if (!('excerpt' in value) || value['excerpt'] === undefined) return false;
+    if (!('wordCount' in value) || value['wordCount'] === undefined) return false;
+    if (!('readingTime' in value) || value['readingTime'] === undefined) return false;
+    if (!('author' in value) || value['author'] === undefined) return false;
+    if (!('createdAt' in value) || value['createdAt'] === undefined) return false;
+    if (!('updatedAt' in value) || value['updatedAt'] === undefined) return false;
+    if (!('rank' in value) || value['rank'] === undefined) return false;
+    if (!('headline' in value) || value['headline'] === undefined) return false;
+    return true;
+}
+
+export function PostSearchResultFromJSON(json: any): PostSearchResult {
+    return PostSearchResultFromJSONTyped(json, false);
+}
+
+export function PostSearchResultFromJSONTyped(json: any, ignoreDiscriminator: boolean): PostSearchResult {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'id': json['id'],
+        'title': json['title'],
+        'slug': json['slug'],
+        'excerpt': json['excerpt'],
+        'wordCount': json['word_count'],
+        'readingTime': json['reading_time'],
+        'publishedAt': json['published_at'] == null ? undefined : (new Date(json['published_at'])),
+        'seriesId': json['series_id'] == null ? undefined : json['series_id'],
+        'author': UserPublicFromJSON(json['author']),
+        'createdAt': (new Date(json['created_at'])),
+        'updatedAt': (new Date(json['updated_at'])),
+        'commentCount': json['comment_count'] == null ? undefined : json['comment_count'],
+        'series': json['series'] == null ? undefined : SeriesPublicFromJSON(json['series']),
+        'rank': json['rank'],
+        'headline': json['headline'],
+    };
+}
+
+export function PostSearchResultToJSON(value?: PostSearchResult | null): any {
+    if (value == null) {
+        return value;
+    }
+    return {
+        
+        'id': value['id'],
+        'title': value['title'],
+        'slug': value['slug'],
+        'excerpt': value['excerpt'],
+        'word_count': value['wordCount'],
+        'reading_time': value['readingTime'],
+        'published_at': value['publishedAt'] == null ? undefined : ((value['publishedAt'] as any).toISOString()),
+        'series_id': value['seriesId'],
+        'author': UserPublicToJSON(value['author']),
+        'created_at': ((value['createdAt']).toISOString()),
+        'updated_at': ((value['updatedAt']).toISOString()),
+        'comment_count': value['commentCount'],
+        'series': SeriesPublicToJSON(value['series']),
+        'rank': value['rank'],
+        'headline': value['headline'],
+    };
+}
+
@@ -0,0 +1,88 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * ooo-yay.com API
+ * Resource-based API for ooo-yay.com.
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+/**
+ * 
+ * @export
+ * @interface StorageCallStats
+ */
+export interface StorageCallStats {
+    /**
+     * 
+     * @type {number}
+     * @memberof StorageCallStats
+     */
+    count: number;
+    /**
+     * 
+     * @type {number}
+     * @memberof StorageCallStats
+     */
+    errors: number;
+    /**
+     * 
+     * @type {number}
+     * @memberof StorageCallStats
+     */
+    totalSeconds: number;
+    /**
+     * 
+     * @type {number}
+     * @memberof StorageCallStats
+     */
+    maxSeconds: number;
+}
+
+/**
+ * Check if a given object implements the StorageCallStats interface.
+ */
+export function instanceOfStorageCallStats(value: object): value is StorageCallStats {
+    if (!('count' in value) || value['count'] === undefined) return false;
+    if (!('errors' in value) || value['errors'] === undefined) return false;
+    if (!('totalSeconds' in value) || value['totalSeconds'] === undefined) return false;
+    if (!('maxSeconds' in value) || value['maxSeconds'] === undefined) return false;
+    return true;
+}
+
+export function StorageCallStatsFromJSON(json: any): StorageCallStats {
+    return StorageCallStatsFromJSONTyped(json, false);
+}
+
+export function StorageCallStatsFromJSONTyped(json: any, ignoreDiscriminator: boolean): StorageCallStats {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'count': json['count'],
+        'errors': json['errors'],
+        'totalSeconds': json['total_seconds'],
+        'maxSeconds': json['max_seconds'],
+    };
+}
+
+export function StorageCallStatsToJSON(value?: StorageCallStats | null): any {
+    if (value == null) {
+        return value;
+    }
+    return {
+        
+        'count': value['count'],
+        'errors': value['errors'],
+        'total_seconds': value['totalSeconds'],
+        'max_seconds': value['maxSeconds'],
+    };
+}
+
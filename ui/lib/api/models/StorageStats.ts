@@ -0,0 +1,77 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * ooo-yay.com API
+ * Resource-based API for ooo-yay.com.
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+import type { StorageCallStats } from './StorageCallStats';
+import {
+    StorageCallStatsFromJSON,
+    StorageCallStatsFromJSONTyped,
+    StorageCallStatsToJSON,
+} from './StorageCallStats';
+
+/**
+ * 
+ * @export
+ * @interface StorageStats
+ */
+export interface StorageStats {
+    /**
+     * 
+     * @type {number}
+     * @memberof StorageStats
+     */
+    clientsCreated: number;
+    /**
+     * 
+     * @type {{ [key: string]: StorageCallStats; }}
+     * @memberof StorageStats
+     */
+    calls: { [key: string]: StorageCallStats; };
+}
+
+/**
+ * Check if a given object implements the StorageStats interface.
+ */
+export function instanceOfStorageStats(value: object): value is StorageStats {
+    if (!('clientsCreated' in value) || value['clientsCreated'] === undefined) return false;
+    if (!('calls' in value) || value['calls'] === undefined) return false;
+    return true;
+}
+
+export function StorageStatsFromJSON(json: any): StorageStats {
+    return StorageStatsFromJSONTyped(json, false);
+}
+
+export function StorageStatsFromJSONTyped(json: any, ignoreDiscriminator: boolean): StorageStats {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'clientsCreated': json['clients_created'],
+        'calls': json['calls'],
+    };
+}
+
+export function StorageStatsToJSON(value?: StorageStats | null): any {
+    if (value == null) {
+        return value;
+    }
+    return {
+        
+        'clients_created': value['clientsCreated'],
+        'calls': value['calls'],
+    };
+}
+
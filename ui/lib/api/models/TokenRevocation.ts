@@ -0,0 +1,61 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * ooo-yay.com API
+ * Resource-based API for ooo-yay.com.
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+/**
+ * How many refresh tokens were revoked
+ * @export
+ * @interface TokenRevocation
+ */
+export interface TokenRevocation {
+    /**
+     * 
+     * @type {number}
+     * @memberof TokenRevocation
+     */
+    revoked: number;
+}
+
+/**
+ * Check if a given object implements the TokenRevocation interface.
+ */
+export function instanceOfTokenRevocation(value: object): value is TokenRevocation {
+    if (!('revoked' in value) || value['revoked'] === undefined) return false;
+    return true;
+}
+
+export function TokenRevocationFromJSON(json: any): TokenRevocation {
+    return TokenRevocationFromJSONTyped(json, false);
+}
+
+export function TokenRevocationFromJSONTyped(json: any, ignoreDiscriminator: boolean): TokenRevocation {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'revoked': json['revoked'],
+    };
+}
+
+export function TokenRevocationToJSON(value?: TokenRevocation | null): any {
+    if (value == null) {
+        return value;
+    }
+    return {
+        
+        'revoked': value['revoked'],
+    };
+}
+
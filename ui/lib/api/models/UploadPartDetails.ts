@@ -0,0 +1,79 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * ooo-yay.com API
+ * Resource-based API for ooo-yay.com.
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+/**
+ * 
+ * @export
+ * @interface UploadPartDetails
+ */
+export interface UploadPartDetails {
+    /**
+     * 
+     * @type {number}
+     * @memberof UploadPartDetails
+     */
+    number: number;
+    /**
+     * 
+     * @type {number}
+     * @memberof UploadPartDetails
+     */
+    size: number;
+    /**
+     * 
+     * @type {string}
+     * @memberof UploadPartDetails
+     */
+    etag: string;
+}
+
+/**
+ * Check if a given object implements the UploadPartDetails interface.
+ */
+export function instanceOfUploadPartDetails(value: object): value is UploadPartDetails {
+    if (!('number' in value) || value['number'] === undefined) return false;
+    if (!('size' in value) || value['size'] === undefined) return false;
+    if (!('etag' in value) || value['etag'] === undefined) return false;
+    return true;
+}
+
+export function UploadPartDetailsFromJSON(json: any): UploadPartDetails {
+    return UploadPartDetailsFromJSONTyped(json, false);
+}
+
+export function UploadPartDetailsFromJSONTyped(json: any, ignoreDiscriminator: boolean): UploadPartDetails {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'number': json['number'],
+        'size': json['size'],
+        'etag': json['etag'],
+    };
+}
+
+export function UploadPartDetailsToJSON(value?: UploadPartDetails | null): any {
+    if (value == null) {
+        return value;
+    }
+    return {
+        
+        'number': value['number'],
+        'size': value['size'],
+        'etag': value['etag'],
+    };
+}
+
@@ -0,0 +1,104 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * ooo-yay.com API
+ * Resource-based API for ooo-yay.com.
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+/**
+ * 
+ * @export
+ * @interface UploadSessionCreate
+ */
+export interface UploadSessionCreate {
+    /**
+     * 
+     * @type {string}
+     * @memberof UploadSessionCreate
+     */
+    name: string;
+    /**
+     * 
+     * @type {string}
+     * @memberof UploadSessionCreate
+     */
+    contentType?: string;
+    /**
+     * 
+     * @type {UploadSessionCreateVisibilityEnum}
+     * @memberof UploadSessionCreate
+     */
+    visibility?: UploadSessionCreateVisibilityEnum;
+    /**
+     * 
+     * @type {number}
+     * @memberof UploadSessionCreate
+     */
+    size?: number | null;
+    /**
+     * 
+     * @type {Array<number>}
+     * @memberof UploadSessionCreate
+     */
+    posts?: Array<number> | null;
+}
+
+
+/**
+ * @export
+ */
+export const UploadSessionCreateVisibilityEnum = {
+    Public: 'public',
+    Private: 'private'
+} as const;
+export type UploadSessionCreateVisibilityEnum = typeof UploadSessionCreateVisibilityEnum[keyof typeof UploadSessionCreateVisibilityEnum];
+
+
+/**
+ * Check if a given object implements the UploadSessionCreate interface.
+ */
+export function instanceOfUploadSessionCreate(value: object): value is UploadSessionCreate {
+    if (!('name' in value) || value['name'] === undefined) return false;
+    return true;
+}
+
+export function UploadSessionCreateFromJSON(json: any): UploadSessionCreate {
+    return UploadSessionCreateFromJSONTyped(json, false);
+}
+
+export function UploadSessionCreateFromJSONTyped(json: any, ignoreDiscriminator: boolean): UploadSessionCreate {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'name': json['name'],
+        'contentType': json['content_type'] == null ? undefined : json['content_type'],
+        'visibility': json['visibility'] == null ? undefined : json['visibility'],
+        'size': json['size'] == null ? undefined : json['size'],
+        'posts': json['posts'] == null ? undefined : json['posts'],
+    };
+}
+
+export function UploadSessionCreateToJSON(value?: UploadSessionCreate | null): any {
+    if (value == null) {
+        return value;
+    }
+    return {
+        
+        'name': value['name'],
+        'content_type': value['contentType'],
+        'visibility': value['visibility'],
+        'size': value['size'],
+        'posts': value['posts'],
+    };
+}
+
@@ -0,0 +1,164 @@
+/* tslint:disable */
+/* eslint-disable */
+/**
+ * ooo-yay.com API
+ * Resource-based API for ooo-yay.com.
+ *
+ * The version of the OpenAPI document: 1.0.0
+ * 
+ *
+ * NOTE: This class is auto generated by OpenAPI Generator (https://openapi-generator.tech).
+ * https://openapi-generator.tech
+ * Do not edit the class manually.
+ */
+
+import { mapValues } from '../runtime';
+import type { UploadPartDetails } from './UploadPartDetails';
+import {
+    UploadPartDetailsFromJSON,
+    UploadPartDetailsFromJSONTyped,
+    UploadPartDetailsToJSON,
+} from './UploadPartDetails';
+import type { FileDetails } from './FileDetails';
+import {
+    FileDetailsFromJSON,
+    FileDetailsFromJSONTyped,
+    FileDetailsToJSON,
+} from './FileDetails';
+
+/**
+ * 
+ * @export
+ * @interface UploadSessionDetails
+ */
+export interface UploadSessionDetails {
+    /**
+     * 
+     * @type {string}
+     * @memberof UploadSessionDetails
+     */
+    id: string;
+    /**
+     * 
+     * @type {string}
+     * @memberof UploadSessionDetails
+     */
+    name: string;
+    /**
+     * 
+     * @type {string}
+     * @memberof UploadSessionDetails
+     */
+    contentType: string;
+    /**
+     * 
+     * @type {string}
+     * @memberof UploadSessionDetails
+     */
+    visibility: string;
+    /**
+     * 
+     * @type {number}
+     * @memberof UploadSessionDetails
+     */
+    size: number | null;
+    /**
+     * Every part but the last must be this large.
+     * @type {number}
+     * @memberof UploadSessionDetails
+     */
+    minPartSize: number;
+    /**
+     * 
+     * @type {number}
+     * @memberof UploadSessionDetails
+     */
+    maxPartSize: number;
+    /**
+     * 
+     * @type {Array<UploadPartDetails>}
+     * @memberof UploadSessionDetails
+     */
+    parts: Array<UploadPartDetails>;
+    /**
+     * Bytes stored so far.
+     * @type {number}
+     * @memberof UploadSessionDetails
+     */
+    received: number;
+    /**
+     * When the session is discarded unless a part arrives.
+     * @type {Date}
+     * @memberof UploadSessionDetails
+     */
+    expiresAt: Date;
+    /**
+     * 
+     * @type {FileDetails}
+     * @memberof UploadSessionDetails
+     */
+    file: FileDetails | null;
+}
+
+/**
+ * Check if a given object implements the UploadSessionDetails interface.
+ */
+export function instanceOfUploadSessionDetails(value: object): value is UploadSessionDetails {
+    if (!('id' in value) || value['id'] === undefined) return false;
+    if (!('name' in value) || value['name'] === undefined) return false;
+    if (!('contentType' in value) || value['contentType'] === undefined) return false;
+    if (!('visibility' in value) || value['visibility'] === undefined) return false;
+    if (!('size' in value) || value['size'] === undefined) return false;
+    if (!('minPartSize' in value) || value['minPartSize'] === undefined) return false;
+    if (!('maxPartSize' in value) || value['maxPartSize'] === undefined) return false;
+    if (!('parts' in value) || value['parts'] === undefined) return false;
+    if (!('received' in value) || value['received'] === undefined) return false;
+    if (!('expiresAt' in value) || value['expiresAt'] === undefined) return false;
+    if (!('file' in value) || value['file'] === undefined) return false;
+    return true;
+}
+
+export function UploadSessionDetailsFromJSON(json: any): UploadSessionDetails {
+    return UploadSessionDetailsFromJSONTyped(json, false);
+}
+
+export function UploadSessionDetailsFromJSONTyped(json: any, ignoreDiscriminator: boolean): UploadSessionDetails {
+    if (json == null) {
+        return json;
+    }
+    return {
+        
+        'id': json['id'],
+        'name': json['name'],
+        'contentType': json['content_type'],
+        'visibility': json['visibility'],
+        'size': json['size'],
+        'minPartSize': json['min_part_size'],
+        'maxPartSize': json['max_part_size'],
+        'parts': ((json['parts'] as Array<any>).map(UploadPartDetailsFromJSON)),
+        'received': json['received'],
+        'expiresAt': (new Date(json['expires_at'])),
+        'file': FileDetailsFromJSON(json['file']),
+    };
+}
+
+export function UploadSessionDetailsToJSON(value?: UploadSessionDetails | null): any {
+    if (value == null) {
+        return value;
+    }
+    return {
+        
+        'id': value['id'],
+        'name': value['name'],
+        'content_type': value['contentType'],
+        'visibility': value['visibility'],
+        'size': value['size'],
+        'min_part_size': value['minPartSize'],
+        'max_part_size': value['maxPartSize'],
+        'parts': ((value['parts'] as Array<any>).map(UploadPartDetailsToJSON)),
+        'received': value['received'],
+        'expires_at': ((value['expiresAt']).toISOString()),
+        'file': FileDetailsToJSON(value['file']),
+    };
+}
+
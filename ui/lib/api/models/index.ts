@@ -16,19 +16,31 @@ export * from './ContentType';
 export * from './ExperienceSchema';
 export * from './FeedAuthorSchema';
 export * from './FeedItem';
+export * from './FileBulkDelete';
+export * from './FileBulkDeleteResult';
 export * from './FileDetails';
+export * from './FileDownload';
+export * from './FileFilters';
 export * from './FileMetadata';
 export * from './FileMutateMetadata';
+export * from './FileUploadComplete';
+export * from './FileUploadRequest';
+export * from './FileUploadTicket';
+export * from './FileVisibilityUpdate';
 export * from './Group';
 export * from './GroupMutate';
 export * from './HealthResponse';
 export * from './HealthStatus';
 export * from './Hub';
+export * from './ImageSource';
 export * from './Input';
 export * from './JSONFeed';
+export * from './MissingFiles';
 export * from './NewAccount';
+export * from './ObjectDeleteFailure';
 export * from './OrphanedFileDetails';
 export * from './OrphanedFiles';
+export * from './OrphanedObject';
 export * from './PagedAdminCommentList';
 export * from './PagedAdminUserDetails';
 export * from './PagedCommentList';
@@ -36,6 +48,7 @@ export * from './PagedFileDetails';
 export * from './PagedGroup';
 export * from './PagedPermission';
 export * from './PagedPostListPublic';
+export * from './PagedPostSearchResult';
 export * from './PagedPostSummaryForSeries';
 export * from './PagedSeriesPublic';
 export * from './Permission';
@@ -44,6 +57,7 @@ export * from './PostCreate';
 export * from './PostDetails';
 export * from './PostListPublic';
 export * from './PostPublic';
+export * from './PostSearchResult';
 export * from './PostSummary';
 export * from './PostSummaryForSeries';
 export * from './PostUpdate';
@@ -57,12 +71,18 @@ export * from './SeriesSummary';
 export * from './SeriesUpdate';
 export * from './ShareCodeCreate';
 export * from './ShareCodeSchema';
+export * from './StorageCallStats';
+export * from './StorageStats';
 export * from './TokenObtainPairInputSchema';
 export * from './TokenObtainPairOutputSchema';
 export * from './TokenRefreshInputSchema';
 export * from './TokenRefreshOutputSchema';
+export * from './TokenRevocation';
 export * from './TokenVerifyInputSchema';
 export * from './UpdateAccount';
+export * from './UploadPartDetails';
+export * from './UploadSessionCreate';
+export * from './UploadSessionDetails';
 export * from './UserPublic';
 export * from './UserSelf';
 export * from './ValidationErrorResponse';